@@ -3,7 +3,7 @@ Admin Web Interface Routes
 Handles HTML pages for admin dashboard using Jinja2 templates
 """
 
-from fastapi import APIRouter, Request, Depends, Form, HTTPException, status, Cookie, Response, UploadFile, File
+from fastapi import APIRouter, Request, Depends, Form, HTTPException, status, Cookie, Response, UploadFile, File, BackgroundTasks
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, StreamingResponse, FileResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -24,16 +24,29 @@ from datetime import datetime, timedelta
 import pytz
 import re
 import html
+import logging
 
-from app.dependencies import get_db
-from app.models import Admin, Hospital, Doctor, Treatment, ContactUs as Contact, Image, Offer, PackageBooking, Blog, FAQ, Banner, PartnerHospital, PatientStory, User, Appointment, doctor_hospital_association, treatment_doctor_association, AboutUs, FeaturedCard, ContactUsPage
+from app.db import pool_metrics
+from app.dependencies import get_db, decode_token_cached, load_principal, invalidate_principal
+from app.models import Admin, Hospital, Doctor, Treatment, ContactUs as Contact, Image, Offer, PackageBooking, Blog, FAQ, Banner, PartnerHospital, PatientStory, User, Appointment, doctor_hospital_association, treatment_doctor_association, AboutUs, FeaturedCard, ContactUsPage, ExportJob
 from app.schemas import TreatmentUpdate, HospitalUpdate, DoctorUpdate, BlogCreate, BlogUpdate
 from app.auth import verify_password
 from app.core.config import settings
+from app.utils.availability import availability_for, doctor_availability, parse_time_slots
+from app.utils.blog_content import apply_blog_content
+from app.utils.cache import TTLCache, invalidate_on_write
+from app.utils.owner_rows import load_faqs_map
+from app.utils.csv_export import iter_csv_chunks, csv_download
+from app.utils.export_jobs import (
+    register_export_source, create_export_job, run_export_job, purge_expired_exports,
+    job_to_dict, export_file_path, ranged_file_response,
+)
+from app.utils.bulk_import import BULK_IMPORT_TARGETS, bulk_import_csv
 import razorpay
 
 router = APIRouter()
 templates = Jinja2Templates(directory="templates")
+logger = logging.getLogger(__name__)
 
 # Razorpay Configuration
 RAZORPAY_KEY_ID = settings.razorpay_key_id or ""
@@ -117,22 +130,15 @@ def time_to_input_format(time_str):
     except:
         return ''
 
-def get_time_from_slots(time_slots, day, type):
-    """Extract start or end time from time slots JSON for a specific day"""
-    if not time_slots:
+def get_time_from_slots(doctor, day, type):
+    """Start or end time ("HH:MM") of a doctor's hours on a day, from the cached parsed time slots"""
+    # Accepts a Doctor (cached per doctor) or a raw time_slots JSON string
+    availability = availability_for(doctor) if hasattr(doctor, 'time_slots') else parse_time_slots(doctor)
+    day_range = availability.day_range(day)
+    if not day_range:
         return ''
-    try:
-        slots = json.loads(time_slots)
-        day_key = day  # day_names[day] in the template
-        if day_key in slots and slots[day_key] != 'Off':
-            times = slots[day_key].split(' - ')
-            if type == 'start' and len(times) >= 1:
-                return time_to_input_format(times[0])
-            elif type == 'end' and len(times) >= 2:
-                return time_to_input_format(times[1])
-    except:
-        pass
-    return ''
+    minutes = day_range[0] if type == 'start' else day_range[1]
+    return f'{minutes // 60 % 24:02d}:{minutes % 60:02d}'
 
 # Add custom filters to Jinja2 environment
 templates.env.filters['nl2br'] = nl2br
@@ -166,7 +172,7 @@ def create_access_token(admin_id: int, username: str, is_super_admin: bool) -> s
 def verify_access_token(token: str) -> Optional[dict]:
     """Verify and decode JWT access token"""
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = decode_token_cached(token, JWT_SECRET_KEY, JWT_ALGORITHM)
         if payload.get("type") != "admin_access":
             return None
         return payload
@@ -177,46 +183,6 @@ def verify_access_token(token: str) -> Optional[dict]:
     except Exception:
         return None
 
-async def get_current_admin_from_token(
-    session_token: Optional[str] = Cookie(None),
-    db: AsyncSession = Depends(get_db)
-) -> Optional[Admin]:
-    """Get current admin from JWT token stored in cookie"""
-    if not session_token:
-        return None
-    
-    payload = verify_access_token(session_token)
-    if not payload:
-        return None
-    
-    # Get fresh admin data from database
-    result = await db.execute(
-        select(Admin).where(
-            Admin.id == payload["admin_id"],
-            Admin.is_active == True
-        )
-    )
-    admin = result.scalar_one_or_none()
-    return admin
-
-def require_admin_login(admin: Optional[Admin] = Depends(get_current_admin_from_token)):
-    """Dependency to require admin login"""
-    if not admin:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required"
-        )
-    return admin
-
-def require_super_admin(admin: Admin = Depends(require_admin_login)):
-    """Dependency to require super admin privileges"""
-    if not admin.is_super_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Super admin privileges required"
-        )
-    return admin
-
 def get_current_admin_from_session(session_token: Optional[str]) -> Optional[dict]:
     """Helper function to get admin info from session token (JWT)"""
     if not session_token:
@@ -249,68 +215,274 @@ async def get_current_admin_object(session_token: Optional[str], db: AsyncSessio
     if not token_data:
         return None
         
-    # Get full admin object from database
-    result = await db.execute(
-        select(Admin).where(
-            Admin.id == token_data["admin_id"],
-            Admin.is_active == True
-        )
-    )
-    return result.scalar_one_or_none()
+    # Get full admin object from the principal cache or the database
+    admin = await load_principal(db, Admin, token_data["admin_id"])
+    if admin is None or not admin.is_active:
+        return None
+    return admin
+
+class AdminContext:
+    """Admin resolved once per request from the session cookie.
+
+    ``admin_dict`` is built eagerly so templates can still render it after
+    the session has been rolled back (avoids lazy loading of expired rows).
+    """
+
+    def __init__(self, admin: Optional[Admin]):
+        self.admin = admin
+        self.admin_dict = {
+            "id": admin.id,
+            "username": admin.username,
+            "is_super_admin": admin.is_super_admin,
+            "is_active": admin.is_active,
+            "last_login": admin.last_login,
+            "created_at": admin.created_at
+        } if admin else None
+
+async def get_admin_context(
+    request: Request,
+    session_token: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_db)
+) -> AdminContext:
+    """Dependency that decodes and loads the current admin once per request"""
+    context = getattr(request.state, "admin_context", None)
+    if context is None:
+        context = AdminContext(await get_current_admin_object(session_token, db))
+        request.state.admin_context = context
+    return context
 
-async def get_current_admin_dict(session_token: Optional[str], db: AsyncSession) -> Optional[dict]:
-    """Helper function to get admin data as dict for template rendering (avoids lazy loading)"""
-    admin = await get_current_admin_object(session_token, db)
+async def get_current_admin_from_token(
+    admin_context: AdminContext = Depends(get_admin_context)
+) -> Optional[Admin]:
+    """Get current admin from JWT token stored in cookie"""
+    return admin_context.admin
+
+def require_admin_login(admin: Optional[Admin] = Depends(get_current_admin_from_token)):
+    """Dependency to require admin login"""
     if not admin:
-        return None
-        
-    return {
-        "id": admin.id,
-        "username": admin.username,
-        "is_super_admin": admin.is_super_admin,
-        "is_active": admin.is_active,
-        "last_login": admin.last_login,
-        "created_at": admin.created_at
-    }
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required"
+        )
+    return admin
+
+def require_super_admin(admin: Admin = Depends(require_admin_login)):
+    """Dependency to require super admin privileges"""
+    if not admin.is_super_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Super admin privileges required"
+        )
+    return admin
+
+# Snapshot of the dashboard counters and recent rows, dropped whenever a table
+# they read is written (treatments: recent bookings show the treatment name)
+dashboard_stats_cache = TTLCache(maxsize=1, ttl=settings.dashboard_stats_cache_seconds)
+invalidate_on_write(
+    [model.__tablename__ for model in (
+        Hospital, Doctor, Treatment, Offer, Contact, PackageBooking,
+        Blog, Banner, PartnerHospital, Admin, Image, User,
+    )],
+    dashboard_stats_cache.clear,
+)
+
+
+def _count(column, *criteria):
+    return select(func.count(column)).where(*criteria).scalar_subquery()
+
 
 async def get_dashboard_stats(db: AsyncSession):
     """Get dashboard statistics"""
-    stats = {}
-    
-    # Count totals
-    stats["hospitals"] = await db.scalar(select(func.count(Hospital.id)))
-    stats["doctors"] = await db.scalar(select(func.count(Doctor.id)))
-    stats["treatments"] = await db.scalar(select(func.count(Treatment.id)))
-    stats["offers"] = await db.scalar(select(func.count(Offer.id)))
-    stats["contacts"] = await db.scalar(select(func.count(Contact.id)))
-    stats["bookings"] = await db.scalar(select(func.count(PackageBooking.id)))
-    stats["blogs"] = await db.scalar(select(func.count(Blog.id)))
-    stats["published_blogs"] = await db.scalar(select(func.count(Blog.id)).where(Blog.is_published == True))
-    stats["banners"] = await db.scalar(select(func.count(Banner.id)))
-    stats["active_banners"] = await db.scalar(select(func.count(Banner.id)).where(Banner.is_active == True))
-    stats["partners"] = await db.scalar(select(func.count(PartnerHospital.id)))
-    stats["admins"] = await db.scalar(select(func.count(Admin.id)))
-    stats["images"] = await db.scalar(select(func.count(Image.id)))
-    stats["users"] = await db.scalar(select(func.count(User.id)))
-    stats["active_users"] = await db.scalar(select(func.count(User.id)).where(User.is_active == True))
-    stats["verified_users"] = await db.scalar(select(func.count(User.id)).where(User.is_email_verified == True))
-    
-    # Recent contacts
+    stats = dashboard_stats_cache.get("stats")
+    if stats is not None:
+        return dict(stats)
+
+    # Every counter in a single round trip
+    counts = await db.execute(
+        select(
+            _count(Hospital.id).label("hospitals"),
+            _count(Doctor.id).label("doctors"),
+            _count(Treatment.id).label("treatments"),
+            _count(Offer.id).label("offers"),
+            _count(Contact.id).label("contacts"),
+            _count(PackageBooking.id).label("bookings"),
+            _count(Blog.id).label("blogs"),
+            _count(Blog.id, Blog.is_published == True).label("published_blogs"),
+            _count(Banner.id).label("banners"),
+            _count(Banner.id, Banner.is_active == True).label("active_banners"),
+            _count(PartnerHospital.id).label("partners"),
+            _count(Admin.id).label("admins"),
+            _count(Image.id).label("images"),
+            _count(User.id).label("users"),
+            _count(User.id, User.is_active == True).label("active_users"),
+            _count(User.id, User.is_email_verified == True).label("verified_users"),
+        )
+    )
+    stats = dict(counts.one()._mapping)
+    
+    # Recent contacts and bookings are cached as plain dicts, never as ORM
+    # instances, since the snapshot is shared by every request
     recent_contacts = await db.execute(
-        select(Contact).order_by(desc(Contact.created_at)).limit(5)
+        select(Contact.id, Contact.first_name, Contact.last_name, Contact.email, Contact.phone,
+               Contact.subject, Contact.created_at)
+        .order_by(desc(Contact.created_at))
+        .limit(5)
     )
-    stats["recent_contacts"] = recent_contacts.scalars().all()
+    stats["recent_contacts"] = [
+        {**row, "name": f"{row['first_name']} {row['last_name']}".strip()}
+        for row in recent_contacts.mappings()
+    ]
     
-    # Recent bookings with treatment information
+    # Recent bookings with the name of their treatment
     recent_bookings = await db.execute(
-        select(PackageBooking)
-        .options(selectinload(PackageBooking.treatment))
+        select(
+            PackageBooking.id, PackageBooking.first_name, PackageBooking.last_name,
+            PackageBooking.mobile_no, PackageBooking.budget, PackageBooking.created_at,
+            Treatment.name.label("treatment_name"),
+        )
+        .outerjoin(Treatment, Treatment.id == PackageBooking.treatment_id)
         .order_by(desc(PackageBooking.created_at))
         .limit(5)
     )
-    stats["recent_bookings"] = recent_bookings.scalars().all()
-    
-    return stats
+    stats["recent_bookings"] = []
+    for row in recent_bookings.mappings():
+        booking = dict(row)
+        treatment_name = booking.pop("treatment_name")
+        booking["treatment"] = {"name": treatment_name} if treatment_name is not None else None
+        stats["recent_bookings"].append(booking)
+    
+    dashboard_stats_cache.set("stats", stats)
+    return dict(stats)
+
+# CSV export columns and row builders shared by the admin list pages
+HOSPITAL_EXPORT_HEADER = [
+    'ID', 'Name', 'Location', 'Address', 'Phone', 'Email', 
+    'Specializations', 'Rating', 'Status', 'Features', 'Facilities',
+    'Description', 'Created Date'
+]
+
+
+def hospital_export_row(hospital: Hospital) -> list:
+    return [
+        hospital.id,
+        hospital.name,
+        hospital.location,
+        hospital.address or '',
+        hospital.phone or '',
+        hospital.email or '',
+        hospital.specializations or '',
+        hospital.rating or '',
+        'Active' if hospital.is_active else 'Inactive',
+        hospital.features or '',
+        hospital.facilities or '',
+        hospital.description or '',
+        hospital.created_at.strftime('%Y-%m-%d %H:%M:%S')
+    ]
+
+
+DOCTOR_EXPORT_HEADER = [
+    'ID', 'Name', 'Specialization', 'Hospital', 'Hospital Location', 
+    'Experience (Years)', 'Rating', 'Status', 'Qualification', 
+    'Phone', 'Email', 'Bio', 'Created Date'
+]
+
+
+def doctor_export_row(doctor: Doctor) -> list:
+    return [
+        doctor.id,
+        f"Dr. {doctor.name}",
+        doctor.specialization or '',
+        doctor.hospital.name if doctor.hospital else '',
+        doctor.hospital.location if doctor.hospital else '',
+        doctor.experience_years or '',
+        doctor.rating or '',
+        'Available' if doctor.is_active else 'Unavailable',
+        doctor.qualification or '',
+        doctor.phone or '',
+        doctor.email or '',
+        doctor.bio or '',
+        doctor.created_at.strftime('%Y-%m-%d %H:%M:%S')
+    ]
+
+
+TREATMENT_EXPORT_HEADER = [
+    'ID', 'Name', 'Type', 'Description', 'Hospital', 'Doctor', 
+    'Location', 'Price Exact', 'Price Min', 'Price Max', 'Rating',
+    'Ayushman Bharat', 'Includes', 'Excludes',
+    'Created Date'
+]
+
+
+def treatment_export_row(treatment: Treatment) -> list:
+    return [
+        treatment.id,
+        treatment.name,
+        treatment.treatment_type or '',
+        treatment.short_description or '',
+        treatment.hospital.name if treatment.hospital else (treatment.other_hospital_name or ''),
+        f"Dr. {treatment.doctor.name}" if treatment.doctor else (f"Dr. {treatment.other_doctor_name}" if treatment.other_doctor_name else ''),
+        treatment.location or '',
+        treatment.price_exact or '',
+        treatment.price_min or '',
+        treatment.price_max or '',
+        treatment.rating or '',
+        'Yes' if treatment.is_ayushman else 'No',
+        treatment.Includes or '',
+        treatment.excludes or '',
+        treatment.created_at.strftime('%Y-%m-%d %H:%M:%S') if treatment.created_at else ''
+    ]
+
+
+CONTACT_EXPORT_HEADER = [
+    'ID', 'Name', 'Email', 'Phone', 'Subject', 'Message', 
+    'Service Type', 'Status', 'Created Date', 'Read At'
+]
+
+
+def contact_export_row(contact: Contact) -> list:
+    return [
+        contact.id,
+        contact.name or f"{getattr(contact, 'first_name', '')} {getattr(contact, 'last_name', '')}".strip(),
+        contact.email,
+        getattr(contact, 'phone', '') or 'N/A',
+        contact.subject or 'N/A',
+        contact.message or 'N/A',
+        getattr(contact, 'service_type', '') or 'N/A',
+        'Read' if contact.is_read else 'New',
+        contact.created_at.strftime('%Y-%m-%d %H:%M:%S') if contact.created_at else 'N/A',
+        contact.read_at.strftime('%Y-%m-%d %H:%M:%S') if getattr(contact, 'read_at', None) else 'N/A'
+    ]
+
+
+BOOKING_EXPORT_HEADER = [
+    'ID', 'First Name', 'Last Name', 'Email', 'Mobile', 
+    'Treatment', 'Treatment Type', 'Budget', 'Doctor Preference', 
+    'Hospital Preference', 'Travel Assistant', 'Stay Assistant', 
+    'Personal Assistant', 'Medical History File', 'Is Ayushman', 'User Query', 
+    'Created Date'
+]
+
+
+def booking_export_row(booking: PackageBooking) -> list:
+    return [
+        booking.id,
+        booking.first_name,
+        booking.last_name,
+        booking.email,
+        booking.mobile_no,
+        booking.treatment.name if booking.treatment else 'Not selected',
+        booking.treatment.treatment_type if booking.treatment else 'N/A',
+        booking.budget or 'Not specified',
+        booking.doctor_preference or 'No preference',
+        booking.hospital_preference or 'No preference',
+        'Yes' if booking.travel_assistant else 'No',
+        'Yes' if booking.stay_assistant else 'No',
+        'Yes' if booking.personal_assistant else 'No',
+        booking.medical_history_file or 'None',
+        'Yes' if getattr(booking, 'is_ayushman_treatment', False) else 'No',
+        booking.user_query or 'None',
+        booking.created_at.strftime('%Y-%m-%d %H:%M:%S') if booking.created_at else 'N/A'
+    ]
 
 @router.get("/admin", response_class=HTMLResponse)
 async def admin_login_page(request: Request, session_token: Optional[str] = Cookie(None)):
@@ -343,6 +515,7 @@ async def admin_login(
     # Update last login
     admin.last_login = datetime.now()
     await db.commit()
+    invalidate_principal(Admin, admin.id)
     
     # Create JWT access token
     access_token = create_access_token(
@@ -373,11 +546,11 @@ async def admin_logout():
 @router.get("/admin/dashboard", response_class=HTMLResponse)
 async def admin_dashboard(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Admin dashboard"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -400,11 +573,11 @@ async def admin_hospitals(
     status: Optional[str] = None,
     rating: Optional[float] = None,
     export: Optional[bool] = False,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Hospital management page with filtering and export"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -445,55 +618,9 @@ async def admin_hospitals(
     
     # Handle export
     if export:
-        result = await db.execute(query.order_by(desc(Hospital.created_at)))
-        hospitals = result.scalars().all()
-        
-        # Create CSV content
-        import csv
-        import io
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'ID', 'Name', 'Location', 'Address', 'Phone', 'Email', 
-            'Specializations', 'Rating', 'Status', 'Features', 'Facilities',
-            'Description', 'Created Date'
-        ])
-        
-        # Write data
-        for hospital in hospitals:
-            writer.writerow([
-                hospital.id,
-                hospital.name,
-                hospital.location,
-                hospital.address or '',
-                hospital.phone or '',
-                hospital.email or '',
-                hospital.specializations or '',
-                hospital.rating or '',
-                'Active' if hospital.is_active else 'Inactive',
-                hospital.features or '',
-                hospital.facilities or '',
-                hospital.description or '',
-                hospital.created_at.strftime('%Y-%m-%d %H:%M:%S')
-            ])
-        
-        output.seek(0)
-        
-        from fastapi.responses import StreamingResponse
-        from datetime import datetime
-        
-        def iter_csv():
-            yield output.getvalue()
-        
-        filename = f"hospitals_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        return StreamingResponse(
-            iter_csv(),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        return csv_download(
+            iter_csv_chunks(db, query.order_by(desc(Hospital.created_at)), HOSPITAL_EXPORT_HEADER, hospital_export_row),
+            "hospitals_export",
         )
     
     # Get total count for pagination
@@ -507,16 +634,10 @@ async def admin_hospitals(
     )
     hospitals = result.scalars().all()
 
-    # Load FAQs for each hospital (only first 3 for summary)
-    hospital_faqs_map = {}
-    for hospital in hospitals:
-        faqs_result = await db.execute(
-            select(FAQ).where(
-                FAQ.owner_type == "hospital",
-                FAQ.owner_id == hospital.id
-            ).order_by(FAQ.position, FAQ.id).limit(3)
-        )
-        hospital_faqs_map[hospital.id] = faqs_result.scalars().all()
+    # Load FAQs for all hospitals in one query (only first 3 for summary)
+    hospital_faqs_map = await load_faqs_map(
+        db, "hospital", [hospital.id for hospital in hospitals], active_only=False, per_owner=3
+    )
 
     total_pages = (total + limit - 1) // limit
 
@@ -538,11 +659,11 @@ async def admin_hospitals(
 @router.get("/admin/hospitals/new", response_class=HTMLResponse)
 async def admin_hospital_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """New hospital form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -557,11 +678,11 @@ async def admin_hospital_new(
 async def admin_hospital_edit(
     request: Request,
     hospital_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit hospital form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -610,11 +731,11 @@ async def admin_doctors(
     rating: Optional[float] = None,
     status: Optional[str] = None,
     export: Optional[bool] = False,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Doctor management page with filtering and export"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -663,55 +784,9 @@ async def admin_doctors(
     
     # Handle export
     if export:
-        result = await db.execute(query.order_by(desc(Doctor.created_at)))
-        doctors = result.scalars().all()
-        
-        # Create CSV content
-        import csv
-        import io
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'ID', 'Name', 'Specialization', 'Hospital', 'Hospital Location', 
-            'Experience (Years)', 'Rating', 'Status', 'Qualification', 
-            'Phone', 'Email', 'Bio', 'Created Date'
-        ])
-        
-        # Write data
-        for doctor in doctors:
-            writer.writerow([
-                doctor.id,
-                f"Dr. {doctor.name}",
-                doctor.specialization or '',
-                doctor.hospital.name if doctor.hospital else '',
-                doctor.hospital.location if doctor.hospital else '',
-                doctor.experience_years or '',
-                doctor.rating or '',
-                'Available' if doctor.is_active else 'Unavailable',
-                doctor.qualification or '',
-                doctor.phone or '',
-                doctor.email or '',
-                doctor.bio or '',
-                doctor.created_at.strftime('%Y-%m-%d %H:%M:%S')
-            ])
-        
-        output.seek(0)
-        
-        from fastapi.responses import StreamingResponse
-        from datetime import datetime
-        
-        def iter_csv():
-            yield output.getvalue()
-        
-        filename = f"doctors_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        return StreamingResponse(
-            iter_csv(),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        return csv_download(
+            iter_csv_chunks(db, query.order_by(desc(Doctor.created_at)), DOCTOR_EXPORT_HEADER, doctor_export_row),
+            "doctors_export",
         )
     
     # Get total count for pagination
@@ -758,11 +833,11 @@ async def admin_treatments(
     is_active: Optional[bool] = None,
     is_featured: Optional[bool] = None,
     export: Optional[bool] = False,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Treatment management page with filtering and export"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -867,58 +942,9 @@ async def admin_treatments(
     
     # Handle export
     if export:
-        result = await db.execute(query.order_by(desc(Treatment.created_at)))
-        treatments = result.scalars().all()
-        
-        # Create CSV content
-        import csv
-        import io
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'ID', 'Name', 'Type', 'Description', 'Hospital', 'Doctor', 
-            'Location', 'Price Exact', 'Price Min', 'Price Max', 'Rating',
-            'Ayushman Bharat', 'Includes', 'Excludes',
-            'Created Date'
-        ])
-        
-        # Write data
-        for treatment in treatments:
-            writer.writerow([
-                treatment.id,
-                treatment.name,
-                treatment.treatment_type or '',
-                treatment.short_description or '',
-                treatment.hospital.name if treatment.hospital else (treatment.other_hospital_name or ''),
-                f"Dr. {treatment.doctor.name}" if treatment.doctor else (f"Dr. {treatment.other_doctor_name}" if treatment.other_doctor_name else ''),
-                treatment.location or '',
-                treatment.price_exact or '',
-                treatment.price_min or '',
-                treatment.price_max or '',
-                treatment.rating or '',
-                'Yes' if treatment.is_ayushman else 'No',
-                treatment.Includes or '',
-                treatment.excludes or '',
-                treatment.created_at.strftime('%Y-%m-%d %H:%M:%S') if treatment.created_at else ''
-            ])
-        
-        output.seek(0)
-        
-        from fastapi.responses import StreamingResponse
-        from datetime import datetime
-        
-        def iter_csv():
-            yield output.getvalue()
-        
-        filename = f"treatments_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        return StreamingResponse(
-            iter_csv(),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        return csv_download(
+            iter_csv_chunks(db, query.order_by(desc(Treatment.created_at)), TREATMENT_EXPORT_HEADER, treatment_export_row),
+            "treatments_export",
         )
     
     # Get total count for pagination
@@ -960,6 +986,11 @@ async def featured_treatments_count(admin: dict = Depends(require_admin_login),
     count = await db.scalar(select(func.count(Treatment.id)).where(Treatment.is_featured == True))
     return {"count": int(count or 0)}
 
+@router.get('/admin/api/pool-metrics')
+async def database_pool_metrics(admin: Admin = Depends(require_super_admin)):
+    """Live connection pool usage: checked-out connections, overflow, checkout waits and timeouts."""
+    return pool_metrics()
+
 # Offers Management (Attractions / Discount Packages)
 @router.get("/admin/offers", response_class=HTMLResponse)
 async def admin_offers(
@@ -969,11 +1000,11 @@ async def admin_offers(
     filter_type: Optional[str] = None,
     filter_location: Optional[str] = None,
     filter_status: Optional[str] = None,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Admin offers listing page with filtering and search"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -1046,11 +1077,11 @@ async def admin_contacts(
     status: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Contact management page with filtering"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -1104,35 +1135,7 @@ async def admin_contacts(
     # Handle export request
     if export == "true":
         # Get filtered contacts for export
-        result = await db.execute(query.order_by(desc(Contact.created_at)))
-        contacts = result.scalars().all()
-        
-        # Generate CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'ID', 'Name', 'Email', 'Phone', 'Subject', 'Message', 
-            'Service Type', 'Status', 'Created Date', 'Read At'
-        ])
-        
-        # Write data
-        for contact in contacts:
-            writer.writerow([
-                contact.id,
-                contact.name or f"{getattr(contact, 'first_name', '')} {getattr(contact, 'last_name', '')}".strip(),
-                contact.email,
-                getattr(contact, 'phone', '') or 'N/A',
-                contact.subject or 'N/A',
-                contact.message or 'N/A',
-                getattr(contact, 'service_type', '') or 'N/A',
-                'Read' if contact.is_read else 'New',
-                contact.created_at.strftime('%Y-%m-%d %H:%M:%S') if contact.created_at else 'N/A',
-                contact.read_at.strftime('%Y-%m-%d %H:%M:%S') if getattr(contact, 'read_at', None) else 'N/A'
-            ])
-        
-        output.seek(0)
+        export_query = query.order_by(desc(Contact.created_at))
         
         # Create filename with current date and filters
         filename_parts = ["contacts_export"]
@@ -1142,14 +1145,10 @@ async def admin_contacts(
             filename_parts.append(f"status_{status}")
         if date_from or date_to:
             filename_parts.append("filtered")
-        filename_parts.append(datetime.now().strftime('%Y%m%d_%H%M%S'))
-        filename = "_".join(filename_parts) + ".csv"
-        
-        # Return CSV file
-        return StreamingResponse(
-            io.BytesIO(output.getvalue().encode('utf-8')),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        
+        return csv_download(
+            iter_csv_chunks(db, export_query, CONTACT_EXPORT_HEADER, contact_export_row),
+            "_".join(filename_parts),
         )
     
     limit = 10
@@ -1184,11 +1183,11 @@ async def admin_contacts(
 @router.get("/admin/contacts/{contact_id}")
 async def get_contact_details(
     contact_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Get individual contact details (API endpoint for modal)"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1216,11 +1215,11 @@ async def get_contact_details(
 @router.post("/admin/contacts/{contact_id}/mark-read")
 async def mark_contact_read(
     contact_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Mark a contact as read"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1237,11 +1236,11 @@ async def mark_contact_read(
 async def reply_to_contact(
     contact_id: int,
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Reply to a contact"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1265,11 +1264,11 @@ async def reply_to_contact(
 @router.delete("/admin/contacts/{contact_id}")
 async def delete_contact(
     contact_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a contact"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1284,11 +1283,11 @@ async def delete_contact(
 
 @router.post("/admin/contacts/mark-all-read")
 async def mark_all_contacts_read(
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Mark all contacts as read"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1304,11 +1303,11 @@ async def mark_all_contacts_read(
 @router.post("/admin/contacts/bulk-mark-read")
 async def bulk_mark_contacts_read(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Mark selected contacts as read"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1337,11 +1336,11 @@ async def update_contact(
     message: Optional[str] = Form(None),
     service_type: Optional[str] = Form(None),
     admin_response: Optional[str] = Form(None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update contact information"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1374,23 +1373,9 @@ async def update_contact(
     return {"message": "Contact updated successfully", "contact": contact}
 
 # Package Booking Management
-@router.get("/admin/bookings", response_class=HTMLResponse)
-async def admin_bookings(
-    request: Request,
-    page: int = 1,
-    from_date: Optional[str] = None,
-    to_date: Optional[str] = None,
-    search: Optional[str] = None,
-    payment_status: Optional[str] = None,
-    export: Optional[str] = None,
-    session_token: Optional[str] = Cookie(None),
-    db: AsyncSession = Depends(get_db)
-):
-    """Package booking management page with date range and treatment type filters"""
-    admin = await get_current_admin_dict(session_token, db)
-    if not admin:
-        return RedirectResponse(url="/admin", status_code=302)
-    
+def filter_bookings(query, from_date: Optional[str], to_date: Optional[str],
+                    search: Optional[str], payment_status: Optional[str]):
+    """Apply the booking list filters (date range, treatment search, payment status) to ``query``"""
     # Parse date parameters
     from_date_obj = None
     to_date_obj = None
@@ -1408,12 +1393,6 @@ async def admin_bookings(
         except ValueError:
             to_date_obj = None
     
-    limit = 15
-    offset = (page - 1) * limit
-    
-    # Build query
-    query = select(PackageBooking).options(selectinload(PackageBooking.treatment))
-    
     # Apply date range filters
     if from_date_obj:
         query = query.where(PackageBooking.created_at >= from_date_obj)
@@ -1445,122 +1424,51 @@ async def admin_bookings(
     if payment_status and payment_status.strip():
         query = query.where(PackageBooking.payment_status == payment_status.strip())
     
+    return query
+
+@router.get("/admin/bookings", response_class=HTMLResponse)
+async def admin_bookings(
+    request: Request,
+    page: int = 1,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    search: Optional[str] = None,
+    payment_status: Optional[str] = None,
+    export: Optional[str] = None,
+    admin_context: AdminContext = Depends(get_admin_context),
+    db: AsyncSession = Depends(get_db)
+):
+    """Package booking management page with date range and treatment type filters"""
+    admin = admin_context.admin_dict
+    if not admin:
+        return RedirectResponse(url="/admin", status_code=302)
+    
+    limit = 15
+    offset = (page - 1) * limit
+    
+    # Build query
+    query = filter_bookings(
+        select(PackageBooking).options(selectinload(PackageBooking.treatment)),
+        from_date, to_date, search, payment_status
+    )
+    
+    # Handle export request: every matching record, streamed without pagination
+    if export == "true":
+        return csv_download(
+            iter_csv_chunks(db, query.order_by(desc(PackageBooking.created_at)), BOOKING_EXPORT_HEADER, booking_export_row),
+            "bookings_export",
+        )
+    
     # Add ordering and pagination
     query = query.order_by(desc(PackageBooking.created_at)).offset(offset).limit(limit)
     
     result = await db.execute(query)
     bookings = result.scalars().all()
     
-    # Handle export request
-    if export == "true":
-        # For export, get all matching records without pagination
-        export_query = select(PackageBooking).options(selectinload(PackageBooking.treatment))
-        
-        # Apply same filters
-        if from_date_obj:
-            export_query = export_query.where(PackageBooking.created_at >= from_date_obj)
-        if to_date_obj:
-            export_query = export_query.where(PackageBooking.created_at <= to_date_obj)
-        if search:
-            search_term = f"%{search.strip()}%"
-            export_query = export_query.join(Treatment, PackageBooking.treatment_id == Treatment.id, isouter=True).where(
-                (Treatment.name.ilike(search_term)) |
-                (Treatment.treatment_type.ilike(search_term)) |
-                # Also match "online consultancy" for bookings with doctor preference but no treatment
-                (and_(
-                    PackageBooking.treatment_id.is_(None),
-                    PackageBooking.doctor_preference.isnot(None),
-                    PackageBooking.doctor_preference != 'null',
-                    PackageBooking.doctor_preference != '',  
-                    or_(
-                        search_term.lower().find('online') != -1,
-                        search_term.lower().find('consultancy') != -1,
-                        search_term.lower().find('consultation') != -1,
-                        search_term.lower().find('virtual') != -1
-                    ).self_group()
-                ))
-            )
-        if payment_status and payment_status.strip():
-            export_query = export_query.where(PackageBooking.payment_status == payment_status.strip())
-        
-        export_query = export_query.order_by(desc(PackageBooking.created_at))
-        export_result = await db.execute(export_query)
-        all_bookings = export_result.scalars().all()
-        
-        # Generate CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write headers
-        writer.writerow([
-            'ID', 'First Name', 'Last Name', 'Email', 'Mobile', 
-            'Treatment', 'Treatment Type', 'Budget', 'Doctor Preference', 
-            'Hospital Preference', 'Travel Assistant', 'Stay Assistant', 
-            'Personal Assistant', 'Medical History File', 'Is Ayushman', 'User Query', 
-            'Created Date'
-        ])
-        
-        # Write data
-        for booking in all_bookings:
-            writer.writerow([
-                booking.id,
-                booking.first_name,
-                booking.last_name,
-                booking.email,
-                booking.mobile_no,
-                booking.treatment.name if booking.treatment else 'Not selected',
-                booking.treatment.treatment_type if booking.treatment else 'N/A',
-                booking.budget or 'Not specified',
-                booking.doctor_preference or 'No preference',
-                booking.hospital_preference or 'No preference',
-                'Yes' if booking.travel_assistant else 'No',
-                'Yes' if booking.stay_assistant else 'No',
-                'Yes' if booking.personal_assistant else 'No',
-                booking.medical_history_file or 'None',
-                'Yes' if getattr(booking, 'is_ayushman_treatment', False) else 'No',
-                booking.user_query or 'None',
-                booking.created_at.strftime('%Y-%m-%d %H:%M:%S') if booking.created_at else 'N/A'
-            ])
-        
-        output.seek(0)
-        
-        # Create filename with current date
-        filename = f"bookings_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        # Return CSV file
-        return StreamingResponse(
-            io.BytesIO(output.getvalue().encode('utf-8')),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-    
     # Get total count for pagination
-    count_query = select(func.count(PackageBooking.id))
-    if from_date_obj:
-        count_query = count_query.where(PackageBooking.created_at >= from_date_obj)
-    if to_date_obj:
-        count_query = count_query.where(PackageBooking.created_at <= to_date_obj)
-    if search:
-        search_term = f"%{search.strip()}%"
-        count_query = count_query.join(Treatment, PackageBooking.treatment_id == Treatment.id, isouter=True).where(
-            (Treatment.name.ilike(search_term)) |
-            (Treatment.treatment_type.ilike(search_term)) |
-            # Also match "online consultancy" for bookings with doctor preference but no treatment
-            (and_(
-                PackageBooking.treatment_id.is_(None),
-                PackageBooking.doctor_preference.isnot(None),
-                PackageBooking.doctor_preference != 'null',
-                PackageBooking.doctor_preference != '',
-                or_(
-                    search_term.lower().find('online') != -1,
-                    search_term.lower().find('consultancy') != -1,
-                    search_term.lower().find('consultation') != -1,
-                    search_term.lower().find('virtual') != -1
-                ).self_group()
-            ))
-        )
-    if payment_status and payment_status.strip():
-        count_query = count_query.where(PackageBooking.payment_status == payment_status.strip())
+    count_query = filter_bookings(
+        select(func.count(PackageBooking.id)), from_date, to_date, search, payment_status
+    )
     
     total = await db.scalar(count_query)
     total_pages = (total + limit - 1) // limit
@@ -1597,14 +1505,89 @@ async def admin_bookings(
         "month_bookings": month_bookings
     })
 
+register_export_source(
+    "bookings",
+    lambda filters: filter_bookings(
+        select(PackageBooking).options(selectinload(PackageBooking.treatment)),
+        filters.get("from_date"), filters.get("to_date"),
+        filters.get("search"), filters.get("payment_status")
+    ),
+    BOOKING_EXPORT_HEADER,
+    booking_export_row,
+)
+
+
+@router.post("/admin/bookings/export-jobs")
+async def start_bookings_export_job(
+    background_tasks: BackgroundTasks,
+    from_date: Optional[str] = Form(None),
+    to_date: Optional[str] = Form(None),
+    search: Optional[str] = Form(None),
+    payment_status: Optional[str] = Form(None),
+    admin: Admin = Depends(require_admin_login),
+    db: AsyncSession = Depends(get_db)
+):
+    """Start a background CSV export of the filtered bookings"""
+    await purge_expired_exports(db)
+    job = await create_export_job(
+        db,
+        "bookings",
+        {"from_date": from_date, "to_date": to_date, "search": search, "payment_status": payment_status},
+        admin_id=admin.id,
+    )
+    background_tasks.add_task(run_export_job, job.id, db.bind)
+    return JSONResponse(status_code=202, content=job_to_dict(job))
+
+
+async def get_export_job_for_admin(job_id: int, admin: Admin, db: AsyncSession) -> ExportJob:
+    job = await db.get(ExportJob, job_id)
+    if not job or (job.created_by != admin.id and not admin.is_super_admin):
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+
+@router.get("/admin/export-jobs/{job_id}")
+async def export_job_progress(
+    job_id: int,
+    admin: Admin = Depends(require_admin_login),
+    db: AsyncSession = Depends(get_db)
+):
+    """Poll the progress of a background export"""
+    job = await get_export_job_for_admin(job_id, admin, db)
+    return job_to_dict(job)
+
+
+@router.get("/admin/export-jobs/{job_id}/download")
+async def export_job_download(
+    job_id: int,
+    request: Request,
+    admin: Admin = Depends(require_admin_login),
+    db: AsyncSession = Depends(get_db)
+):
+    """Download a finished export; supports resuming with a Range header"""
+    job = await get_export_job_for_admin(job_id, admin, db)
+    if job.status == "completed" and job.expires_at and job.expires_at <= datetime.utcnow():
+        await purge_expired_exports(db)
+    if job.status == "expired":
+        raise HTTPException(status_code=410, detail="Export file has expired")
+    if job.status != "completed":
+        raise HTTPException(status_code=409, detail=f"Export is {job.status}")
+    
+    path = export_file_path(job)
+    if not path or not os.path.exists(path):
+        raise HTTPException(status_code=410, detail="Export file is no longer available")
+    
+    filename = f"{job.resource}_export_{job.created_at.strftime('%Y%m%d_%H%M%S')}.csv"
+    return ranged_file_response(request, path, filename)
+
 @router.get("/admin/bookings/{booking_id}/details")
 async def get_booking_details(
     booking_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Get booking details for modal display"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1751,11 +1734,11 @@ async def get_booking_details(
 async def download_medical_file(
     booking_id: int,
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Download medical history file for a booking"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1801,11 +1784,11 @@ async def download_medical_file(
 @router.delete("/admin/bookings/{booking_id}")
 async def delete_booking(
     booking_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a booking"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1821,11 +1804,11 @@ async def delete_booking(
 @router.delete("/admin/hospitals/{hospital_id}")
 async def delete_hospital(
     hospital_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a hospital"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1858,11 +1841,11 @@ async def delete_hospital(
 @router.get("/admin/hospitals/{hospital_id}/details")
 async def get_hospital_details(
     hospital_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Get hospital details for modal display"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1909,11 +1892,11 @@ async def get_hospital_details(
 @router.delete("/admin/doctors/{doctor_id}")
 async def delete_doctor(
     doctor_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a doctor"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1934,17 +1917,18 @@ async def delete_doctor(
     
     await db.delete(doctor)
     await db.commit()
+    doctor_availability.invalidate(doctor_id)
     
     return {"message": "Doctor deleted successfully"}
 
 @router.delete("/admin/treatments/{treatment_id}")
 async def delete_treatment(
     treatment_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a treatment"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -1971,11 +1955,11 @@ async def delete_treatment(
 @router.delete("/admin/offers/{offer_id}")
 async def delete_offer(
     offer_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete an offer"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -2003,11 +1987,11 @@ async def delete_offer(
 
 @router.get("/admin/api/treatment-types")
 async def get_treatment_types_api(
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """API endpoint to get all treatment types"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -2018,11 +2002,11 @@ async def get_treatment_types_api(
 @router.get("/admin/admins", response_class=HTMLResponse)
 async def admin_admins(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Admin management page (Super Admin only)"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin or not admin.get('is_super_admin'):
         return RedirectResponse(url="/admin/dashboard", status_code=302)
     
@@ -2041,11 +2025,11 @@ async def admin_admins(
 @router.get("/admin/admins/new", response_class=HTMLResponse)
 async def admin_new_admin(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """New admin form (Super Admin only)"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin or not admin.get('is_super_admin'):
         return RedirectResponse(url="/admin/dashboard", status_code=302)
     
@@ -2060,11 +2044,11 @@ async def admin_new_admin(
 async def admin_edit_admin(
     request: Request,
     admin_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit admin form (Super Admin only)"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin or not admin.get('is_super_admin'):
         return RedirectResponse(url="/admin/dashboard", status_code=302)
     
@@ -2088,11 +2072,11 @@ async def admin_create_admin(
     email: str = Form(...),
     password: str = Form(...),
     is_super_admin: bool = Form(False),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new admin (Super Admin only)"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin or not admin.is_super_admin:
         raise HTTPException(status_code=403, detail="Super admin privileges required")
     
@@ -2106,7 +2090,7 @@ async def admin_create_admin(
         if existing_admin.scalar_one_or_none():
             return render_template("admin/admin_form.html", {
                 "request": request,
-                "admin": await get_current_admin_dict(session_token, db),
+                "admin": admin_context.admin_dict,
                 "admin_user": None,
                 "action": "Create",
                 "error": "Username or email already exists"
@@ -2134,7 +2118,7 @@ async def admin_create_admin(
         await db.rollback()
         return render_template("admin/admin_form.html", {
             "request": request,
-            "admin": await get_current_admin_dict(session_token, db),
+            "admin": admin_context.admin_dict,
             "admin_user": None,
             "action": "Create",
             "error": f"Error creating admin: {str(e)}"
@@ -2150,11 +2134,11 @@ async def admin_update_admin(
     is_super_admin: bool = Form(False),
     # Checkbox fields are only sent when checked; default to False so absence === False
     is_active: bool = Form(False),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update admin (Super Admin only)"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin or not admin.is_super_admin:
         raise HTTPException(status_code=403, detail="Super admin privileges required")
     
@@ -2173,7 +2157,7 @@ async def admin_update_admin(
         if existing_admin.scalar_one_or_none():
             return render_template("admin/admin_form.html", {
                 "request": request,
-                "admin": await get_current_admin_dict(session_token, db),
+                "admin": admin_context.admin_dict,
                 "admin_user": admin_user,
                 "action": "Update",
                 "error": "Username or email already exists"
@@ -2192,6 +2176,8 @@ async def admin_update_admin(
             admin_user.password_hash = get_password_hash(password)
         
         await db.commit()
+        # Status, role or password may have changed
+        invalidate_principal(Admin, admin_id)
         
         return RedirectResponse(url="/admin/admins", status_code=302)
         
@@ -2199,7 +2185,7 @@ async def admin_update_admin(
         await db.rollback()
         return render_template("admin/admin_form.html", {
             "request": request,
-            "admin": await get_current_admin_dict(session_token, db),
+            "admin": admin_context.admin_dict,
             "admin_user": admin_user,
             "action": "Update",
             "error": f"Error updating admin: {str(e)}"
@@ -2208,11 +2194,11 @@ async def admin_update_admin(
 @router.delete("/admin/admins/{admin_id}")
 async def admin_delete_admin(
     admin_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete admin (Super Admin only)"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin or not admin.is_super_admin:
         raise HTTPException(status_code=403, detail="Super admin privileges required")
     
@@ -2234,6 +2220,7 @@ async def admin_delete_admin(
     
     await db.delete(admin_user)
     await db.commit()
+    invalidate_principal(Admin, admin_id)
     
     return {"message": "Admin deleted successfully"}
 
@@ -2241,11 +2228,11 @@ async def admin_delete_admin(
 @router.get("/admin/doctors/new", response_class=HTMLResponse)
 async def admin_doctor_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """New doctor form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -2364,11 +2351,11 @@ async def delete_specialization(name: str = Form(...), admin: dict = Depends(req
 async def admin_doctor_edit(
     request: Request,
     doctor_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit doctor form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -2443,11 +2430,11 @@ async def admin_doctor_edit(
 @router.get("/admin/treatments/new", response_class=HTMLResponse)
 async def admin_treatment_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """New treatment form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -2475,11 +2462,11 @@ async def admin_treatment_new(
 async def admin_treatment_edit(
     request: Request,
     treatment_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit treatment form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -2563,11 +2550,11 @@ async def admin_treatment_edit(
 @router.get("/admin/offers/new", response_class=HTMLResponse)
 async def admin_offer_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """New offer form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -2594,11 +2581,11 @@ async def admin_offer_new(
 async def admin_offer_edit(
     request: Request,
     offer_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit offer form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -2669,6 +2656,51 @@ async def save_uploaded_file(file: UploadFile, category: str) -> str:
     
     return unique_filename
 
+# Bulk CSV import. Registered before the "/admin/<resource>/{id}" update
+# routes so "bulk-import" is never parsed as an id.
+@router.post("/admin/{resource}/bulk-import")
+async def admin_bulk_import(
+    resource: str,
+    file: UploadFile = File(...),
+    admin: Admin = Depends(require_admin_login),
+    db: AsyncSession = Depends(get_db)
+):
+    """Import hospitals, doctors or treatments from an uploaded CSV and report per-row errors"""
+    if resource not in BULK_IMPORT_TARGETS:
+        raise HTTPException(status_code=404, detail="Bulk import is not available for this resource")
+    
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        report = await bulk_import_csv(db, resource, lines)
+    except UnicodeDecodeError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="CSV file must be UTF-8 encoded")
+    except csv.Error as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=f"Invalid CSV file: {e}")
+    finally:
+        lines.detach()
+    return report.as_dict()
+
+
+@router.get("/admin/{resource}/bulk-import-template")
+async def admin_bulk_import_template(
+    resource: str,
+    admin: Admin = Depends(require_admin_login)
+):
+    """Empty CSV with the columns accepted by the bulk import"""
+    if resource not in BULK_IMPORT_TARGETS:
+        raise HTTPException(status_code=404, detail="Bulk import is not available for this resource")
+    
+    output = io.StringIO()
+    csv.writer(output).writerow(BULK_IMPORT_TARGETS[resource].columns)
+    return Response(
+        content=output.getvalue(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={resource}_import_template.csv"}
+    )
+
+
 @router.post("/admin/hospitals")
 async def admin_hospital_create(
     request: Request,
@@ -2694,16 +2726,16 @@ async def admin_hospital_create(
     faq5_question: str = Form(""),
     faq5_answer: str = Form(""),
     images: List[UploadFile] = File(default=[]),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new hospital"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
     # Get admin data for templates (to avoid SQLAlchemy lazy loading issues)
-    admin_dict = await get_current_admin_dict(session_token, db)
+    admin_dict = admin_context.admin_dict
     
     try:
         # Create hospital object
@@ -2797,7 +2829,7 @@ async def admin_hospital_update(
     update_image_order: str = Form(None),
     image_order: str = Form(None),
     set_primary_image: str = Form(None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     import logging
@@ -2813,7 +2845,7 @@ async def admin_hospital_update(
     except Exception as e:
         print(f"[DEBUG] Error printing POST form data: {e}")
     """Update existing hospital"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -3026,16 +3058,16 @@ async def admin_doctor_create(
     faq5_answer: str = Form(""),
     profile_photo: UploadFile = File(default=None),
     images: List[UploadFile] = File(default=[]),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new doctor"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
     # Get admin data for templates (to avoid SQLAlchemy lazy loading issues)
-    admin_dict = await get_current_admin_dict(session_token, db)
+    admin_dict = admin_context.admin_dict
     
     try:
         # Handle profile photo upload
@@ -3235,11 +3267,11 @@ async def admin_doctor_update(
     delete_image_id: str = Form(None),
     update_image_order: str = Form(None),
     image_order: str = Form(None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update existing doctor"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -3521,11 +3553,11 @@ async def admin_treatment_create(
     faq_answers: List[str] = Form(default=[]),
     images: List[UploadFile] = File(default=[]),
     associated_doctors: List[int] = Form(default=[]),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new treatment"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -3657,21 +3689,22 @@ async def admin_treatment_update(
     delete_image_id: str = Form(None),
     set_primary_image: str = Form(None),
     image_order: str = Form(None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update existing treatment with image management"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
-    # Debug: Log all form data received
-    print(f"DEBUG TREATMENT UPDATE: Received FAQ data:")
-    print(f"  - FAQ 1: Q='{faq1_question}' A='{faq1_answer}'")
-    print(f"  - FAQ 2: Q='{faq2_question}' A='{faq2_answer}'")
-    print(f"  - FAQ 3: Q='{faq3_question}' A='{faq3_answer}'")
-    print(f"  - FAQ 4: Q='{faq4_question}' A='{faq4_answer}'")
-    print(f"  - FAQ 5: Q='{faq5_question}' A='{faq5_answer}'")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Treatment update FAQ data", extra={"treatment_id": treatment_id, "faqs": [
+            {"question": question, "answer": answer}
+            for question, answer in (
+                (faq1_question, faq1_answer), (faq2_question, faq2_answer), (faq3_question, faq3_answer),
+                (faq4_question, faq4_answer), (faq5_question, faq5_answer),
+            )
+        ]})
     
     try:
         # Get existing treatment with images
@@ -3687,7 +3720,7 @@ async def admin_treatment_update(
         
         # Handle image deletion
         if delete_image_id and delete_image_id.isdigit():
-            print(f"Processing image deletion for image ID: {delete_image_id}, treatment ID: {treatment_id}")
+            logger.debug("Deleting treatment image", extra={"image_id": delete_image_id, "treatment_id": treatment_id})
             image_id = int(delete_image_id)
             # Get the image to delete
             result = await db.execute(
@@ -3697,7 +3730,6 @@ async def admin_treatment_update(
                 .where(Image.owner_id == treatment_id)
             )
             image = result.scalar_one_or_none()
-            print(f"Found image to delete: {image}")
             
             if image:
                 # Delete the image file
@@ -3707,7 +3739,7 @@ async def admin_treatment_update(
                         if os.path.exists(filepath):
                             os.remove(filepath)
                 except Exception as e:
-                    print(f"Error deleting image file: {e}")
+                    logger.warning("Error deleting image file", extra={"image_id": image.id, "error": str(e)})
                 
                 # Delete the image record
                 await db.execute(
@@ -3730,7 +3762,7 @@ async def admin_treatment_update(
         
         # Handle setting primary image
         if set_primary_image and set_primary_image.isdigit():
-            print(f"Processing setting primary image for image ID: {set_primary_image}, treatment ID: {treatment_id}")
+            logger.debug("Setting primary treatment image", extra={"image_id": set_primary_image, "treatment_id": treatment_id})
             image_id = int(set_primary_image)
             # Get the image to set as primary
             result = await db.execute(
@@ -3740,7 +3772,6 @@ async def admin_treatment_update(
                 .where(Image.owner_id == treatment_id)
             )
             image = result.scalar_one_or_none()
-            print(f"Found image to set as primary: {image}")
             
             if image:
                 # Set all images to non-primary
@@ -3768,9 +3799,8 @@ async def admin_treatment_update(
         
         # Handle image order update
         if update_image_order and image_order:
-            print(f"Processing image order update for treatment ID: {treatment_id}")
             image_order_list = parse_comma_separated_string(image_order)
-            print(f"New image order: {image_order_list}")
+            logger.debug("Reordering treatment images", extra={"treatment_id": treatment_id, "image_order": image_order_list})
             
             for position, image_id in enumerate(image_order_list):
                 if image_id.isdigit():
@@ -3783,13 +3813,12 @@ async def admin_treatment_update(
                         .where(Image.owner_id == treatment_id)
                     )
                     image = result.scalar_one_or_none()
-                    print(f"Found image to update: {image}")
                     
                     if image:
                         image.position = position
                         await db.commit()
                     else:
-                        print(f"Image ID {image_id} not found for treatment ID {treatment_id}")
+                        logger.warning("Treatment image not found", extra={"image_id": image_id, "treatment_id": treatment_id})
             
             if request.headers.get('x-requested-with') == 'XMLHttpRequest' or request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 return {"success": True, "message": "Image order updated successfully"}
@@ -3897,10 +3926,8 @@ async def admin_treatment_update(
                 await db.execute(insert(treatment_doctor_association).values(assoc_values))
         except Exception as e:
             # Non-fatal: log if needed but don't block update
-            print(f"Warning: failed to update associated doctors for treatment {treatment.id}: {e}")
+            logger.warning("Failed to update associated doctors", extra={"treatment_id": treatment.id, "error": str(e)})
 
-        print(f"DEBUG: Updated FAQ fields for treatment {treatment.id}")
-        
         await db.commit()
         
         if request.headers.get('x-requested-with') == 'XMLHttpRequest' or request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -3911,7 +3938,7 @@ async def admin_treatment_update(
     except Exception as e:
         await db.rollback()
         error_msg = f"Error updating treatment: {str(e)}"
-        print(error_msg)
+        logger.exception("Error updating treatment", extra={"treatment_id": treatment_id})
         
         if request.headers.get('x-requested-with') == 'XMLHttpRequest' or request.headers.get('X-Requested-With') == 'XMLHttpRequest':
             return {"success": False, "message": error_msg}
@@ -4111,11 +4138,11 @@ async def admin_offer_create(
     treatment_id: Optional[int] = Form(None),
     is_active: Optional[str] = Form(None),
     images: List[UploadFile] = File(default=[]),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new offer"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -4197,11 +4224,11 @@ async def admin_offer_update(
     treatment_id: Optional[int] = Form(None),
     is_active: Optional[str] = Form(None),
     images: List[UploadFile] = File(default=[]),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update existing offer"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -4280,11 +4307,11 @@ async def admin_offer_update(
 # Treatment Type Management API Endpoints
 @router.get("/admin/api/treatment-types")
 async def get_treatment_types_api(
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Get all treatment types for API"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -4298,11 +4325,11 @@ async def get_treatment_types_api(
 @router.post("/admin/api/treatment-types/rename")
 async def rename_treatment_type(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Rename a treatment type globally"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -4357,11 +4384,11 @@ async def rename_treatment_type(
 @router.post("/admin/api/treatment-types/delete")
 async def delete_treatment_type(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a treatment type globally"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -4433,11 +4460,11 @@ async def delete_treatment_type(
 @router.get("/admin/blogs", response_class=HTMLResponse)
 async def admin_blogs_list(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Display blogs list page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -4459,11 +4486,11 @@ async def admin_blogs_list(
 @router.get("/admin/blogs/new", response_class=HTMLResponse)
 async def admin_blog_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Display new blog form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -4479,8 +4506,8 @@ async def admin_blog_new(
 
 
 @router.get("/admin/about-us", response_class=HTMLResponse)
-async def admin_about_us_list(request: Request, session_token: Optional[str] = Cookie(None), db: AsyncSession = Depends(get_db)):
-    admin = await get_current_admin_dict(session_token, db)
+async def admin_about_us_list(request: Request, admin_context: AdminContext = Depends(get_admin_context), db: AsyncSession = Depends(get_db)):
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
 
@@ -4490,16 +4517,16 @@ async def admin_about_us_list(request: Request, session_token: Optional[str] = C
 
 
 @router.get("/admin/about-us/new", response_class=HTMLResponse)
-async def admin_about_us_new(request: Request, session_token: Optional[str] = Cookie(None), db: AsyncSession = Depends(get_db)):
-    admin = await get_current_admin_dict(session_token, db)
+async def admin_about_us_new(request: Request, admin_context: AdminContext = Depends(get_admin_context), db: AsyncSession = Depends(get_db)):
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     return templates.TemplateResponse("admin/about_us_form.html", {"request": request, "admin": admin, "item": None, "action": "create"})
 
 
 @router.get("/admin/about-us/{item_id}/edit", response_class=HTMLResponse)
-async def admin_about_us_edit(item_id: int, request: Request, session_token: Optional[str] = Cookie(None), db: AsyncSession = Depends(get_db)):
-    admin = await get_current_admin_dict(session_token, db)
+async def admin_about_us_edit(item_id: int, request: Request, admin_context: AdminContext = Depends(get_admin_context), db: AsyncSession = Depends(get_db)):
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     # Eager-load featured_cards relationship to avoid async lazy-load during template rendering
@@ -4545,9 +4572,9 @@ async def admin_about_us_create(request: Request,
                                 position: int = Form(0),
                                 is_featured: bool = Form(False),
                                 is_active: bool = Form(True),
-                                session_token: Optional[str] = Cookie(None),
+                                admin_context: AdminContext = Depends(get_admin_context),
                                 db: AsyncSession = Depends(get_db)):
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
 
@@ -4673,7 +4700,7 @@ async def admin_about_us_create(request: Request,
         await db.rollback()
         return templates.TemplateResponse("admin/about_us_form.html", {
             "request": request,
-            "admin": await get_current_admin_dict(None, db),
+            "admin": admin_context.admin_dict,
             "item": about,
             "action": "create",
             "error": f"Error creating About Us: {str(e)}"
@@ -4697,9 +4724,9 @@ async def admin_about_us_update(item_id: int,
                                 position: int = Form(0),
                                 is_featured: bool = Form(False),
                                 is_active: bool = Form(True),
-                                session_token: Optional[str] = Cookie(None),
+                                admin_context: AdminContext = Depends(get_admin_context),
                                 db: AsyncSession = Depends(get_db)):
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
 
@@ -4812,7 +4839,7 @@ async def admin_about_us_update(item_id: int,
         await db.rollback()
         return templates.TemplateResponse("admin/about_us_form.html", {
             "request": request,
-            "admin": await get_current_admin_dict(None, db),
+            "admin": admin_context.admin_dict,
             "item": about,
             "action": "edit",
             "error": f"Error updating About Us: {str(e)}"
@@ -4820,8 +4847,8 @@ async def admin_about_us_update(item_id: int,
 
 
 @router.post("/admin/about-us/{item_id}/delete")
-async def admin_about_us_delete(item_id: int, session_token: Optional[str] = Cookie(None), db: AsyncSession = Depends(get_db)):
-    admin = await get_current_admin_dict(session_token, db)
+async def admin_about_us_delete(item_id: int, admin_context: AdminContext = Depends(get_admin_context), db: AsyncSession = Depends(get_db)):
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
 
@@ -4834,8 +4861,8 @@ async def admin_about_us_delete(item_id: int, session_token: Optional[str] = Coo
 
 
 @router.get("/admin/contact-page", response_class=HTMLResponse)
-async def admin_contact_page_edit(request: Request, session_token: Optional[str] = Cookie(None), db: AsyncSession = Depends(get_db)):
-    admin = await get_current_admin_dict(session_token, db)
+async def admin_contact_page_edit(request: Request, admin_context: AdminContext = Depends(get_admin_context), db: AsyncSession = Depends(get_db)):
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
 
@@ -4852,9 +4879,9 @@ async def admin_contact_page_update(request: Request,
                                     email: Optional[str] = Form(None),
                                     address: Optional[str] = Form(None),
                                     is_active: bool = Form(True),
-                                    session_token: Optional[str] = Cookie(None),
+                                    admin_context: AdminContext = Depends(get_admin_context),
                                     db: AsyncSession = Depends(get_db)):
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
 
@@ -4893,11 +4920,11 @@ async def admin_blog_create(
     is_featured: bool = Form(False),
     featured_image: Optional[UploadFile] = File(None),
     content_images: List[UploadFile] = File(default=[]),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new blog"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -4973,6 +5000,8 @@ async def admin_blog_create(
             is_featured=blog_data.is_featured,
             published_at=blog_data.published_at
         )
+        # Sanitized HTML, table of contents, excerpt and word count
+        apply_blog_content(blog)
         
         db.add(blog)
         await db.flush()  # Get the blog ID
@@ -5009,11 +5038,11 @@ async def admin_blog_create(
 async def admin_blog_edit(
     request: Request,
     blog_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Display edit blog form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5061,11 +5090,11 @@ async def admin_blog_update(
     is_featured: bool = Form(False),
     featured_image: Optional[UploadFile] = File(None),
     content_images: List[UploadFile] = File(default=[]),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update existing blog"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5179,6 +5208,7 @@ async def admin_blog_update(
         blog.is_published = update_data.is_published
         blog.is_featured = update_data.is_featured
         blog.published_at = update_data.published_at
+        apply_blog_content(blog)
         
         # Handle new content images upload
         for image_file in content_images:
@@ -5221,11 +5251,11 @@ async def admin_blog_update(
 async def admin_blog_delete(
     request: Request,
     blog_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete blog"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
@@ -5259,11 +5289,11 @@ async def admin_blog_delete(
 async def admin_blog_images(
     request: Request,
     blog_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Get blog images for content editor"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
@@ -5295,11 +5325,11 @@ async def admin_blog_images(
 @router.get("/admin/banners", response_class=HTMLResponse)
 async def admin_banners_list(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Banner management page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5319,11 +5349,11 @@ async def admin_banners_list(
 @router.get("/admin/banners/new", response_class=HTMLResponse)
 async def admin_banner_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Banner creation page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5337,11 +5367,11 @@ async def admin_banner_new(
 @router.post("/admin/banners/new", response_class=HTMLResponse)
 async def admin_banner_create(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new banner"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5392,11 +5422,11 @@ async def admin_banner_create(
 async def admin_banner_edit(
     request: Request,
     banner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Banner edit page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5424,11 +5454,11 @@ async def admin_banner_update(
     position: int = Form(0),
     is_active: bool = Form(False),
     banner_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update banner"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5478,11 +5508,11 @@ async def admin_banner_update(
 async def admin_banner_delete(
     request: Request,
     banner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete banner (deprecated - use form-based version)"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5509,11 +5539,11 @@ async def admin_banner_delete(
 @router.get("/admin/partners/new", response_class=HTMLResponse)
 async def admin_partner_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Partner hospital creation page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5534,11 +5564,11 @@ async def admin_partner_new(
 async def admin_partner_create(
     request: Request,
     logo_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new partner hospital"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5568,11 +5598,11 @@ async def admin_partner_create(
 async def admin_partner_edit(
     request: Request,
     partner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Partner hospital edit page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5592,11 +5622,11 @@ async def admin_partner_update(
     request: Request,
     partner_id: int,
     logo_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update a partner hospital"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5639,11 +5669,11 @@ async def admin_banner_create(
     position: int = Form(0),
     is_active: bool = Form(False),
     banner_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new banner (deprecated - use form-based version)"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5690,11 +5720,11 @@ async def admin_banner_create(
 async def admin_banner_edit(
     request: Request,
     banner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit banner form (deprecated - use form-based version)"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5728,11 +5758,11 @@ async def admin_banner_update(
     position: int = Form(0),
     is_active: bool = Form(False),
     banner_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update banner (deprecated - use form-based version)"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5780,11 +5810,11 @@ async def admin_banner_update(
 async def admin_banner_delete(
     request: Request,
     banner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete banner"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5805,11 +5835,11 @@ async def admin_banner_delete(
 @router.get("/admin/partners/new", response_class=HTMLResponse)
 async def admin_partner_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """New partner hospital page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5827,11 +5857,11 @@ async def admin_partner_new(
 @router.post("/admin/partners/new", response_class=HTMLResponse)
 async def admin_partner_create(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new partner hospital"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5853,11 +5883,11 @@ async def admin_partner_create(
 async def admin_partner_edit(
     request: Request,
     partner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit partner hospital page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5876,11 +5906,11 @@ async def admin_partner_edit(
 async def admin_partner_update(
     request: Request,
     partner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update partner hospital"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5914,11 +5944,11 @@ async def admin_banner_create(
     position: int = Form(0),
     is_active: bool = Form(False),
     banner_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new banner"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5963,11 +5993,11 @@ async def admin_banner_create(
 async def admin_banner_edit(
     request: Request,
     banner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit banner form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -5999,11 +6029,11 @@ async def admin_banner_update(
     position: int = Form(0),
     is_active: bool = Form(False),
     banner_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update banner"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6050,11 +6080,11 @@ async def admin_banner_update(
 @router.post("/admin/banners/{banner_id}/delete")
 async def admin_banner_delete(
     banner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete banner"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6081,11 +6111,11 @@ async def admin_banner_delete(
 @router.get("/admin/partners", response_class=HTMLResponse)
 async def admin_partners_list(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Partner hospitals management page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6114,12 +6144,12 @@ async def admin_partners_list(
 @router.get("/admin/partners/new", response_class=HTMLResponse)
 async def admin_partner_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
 
     """New partner hospital form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6142,11 +6172,11 @@ async def admin_partner_create(
     name: str = Form(...),
     hospital_id: int = Form(None),
     logo_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new partner hospital"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6190,11 +6220,11 @@ async def admin_partner_create(
 async def admin_partner_edit(
     request: Request,
     partner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit partner hospital form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6225,11 +6255,11 @@ async def admin_partner_update(
     name: str = Form(...),
     hospital_id: int = Form(None),
     logo_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update partner hospital"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6275,11 +6305,11 @@ async def admin_partner_update(
 @router.post("/admin/partners/{partner_id}/delete")
 async def admin_partner_delete(
     partner_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete partner hospital"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6306,11 +6336,11 @@ async def admin_partner_delete(
 @router.get("/admin/stories", response_class=HTMLResponse)
 async def admin_stories_list(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Patient stories management page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6330,11 +6360,11 @@ async def admin_stories_list(
 @router.get("/admin/stories/new", response_class=HTMLResponse)
 async def admin_story_new(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """New patient story form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6359,11 +6389,11 @@ async def admin_story_create(
     is_featured: bool = Form(False),
     is_active: bool = Form(False),
     profile_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Create new patient story"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6413,11 +6443,11 @@ async def admin_story_create(
 async def admin_story_edit(
     request: Request,
     story_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit patient story form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6450,11 +6480,11 @@ async def admin_story_update(
     is_featured: bool = Form(False),
     is_active: bool = Form(False),
     profile_image: UploadFile = File(default=None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update patient story"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6506,11 +6536,11 @@ async def admin_story_update(
 @router.get("/admin/partners", response_class=HTMLResponse)
 async def admin_partners_list(
     request: Request,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Partner hospitals management page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6532,11 +6562,11 @@ async def admin_partners_list(
 @router.post("/admin/stories/{story_id}/delete")
 async def admin_story_delete(
     story_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete patient story"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6563,11 +6593,11 @@ async def admin_users(
     page: int = 1,
     search: Optional[str] = None,
     status: Optional[str] = None,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """User management page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6660,11 +6690,11 @@ async def admin_appointments_list(
     doctor_id: Optional[int] = None,
     status: Optional[str] = None,
     payment_status: Optional[str] = None,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Appointment management page"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6725,11 +6755,11 @@ async def admin_appointments_list(
 async def admin_appointment_payment(
     request: Request,
     appointment_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Redirect to payment page for an appointment"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6740,11 +6770,11 @@ async def admin_appointment_payment(
 async def admin_appointment_edit(
     request: Request,
     appointment_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Edit appointment form"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6782,11 +6812,11 @@ async def admin_appointment_update(
     notes: str = Form(""),
     status: str = Form("scheduled"),
     consultation_fees: Optional[float] = Form(None),
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Update existing appointment"""
-    admin = await get_current_admin_dict(session_token, db)
+    admin = admin_context.admin_dict
     if not admin:
         return RedirectResponse(url="/admin", status_code=302)
     
@@ -6830,7 +6860,8 @@ async def admin_appointment_update(
             "appointment": appointment,
             "doctors": doctors,
             "action": "edit",
-            "error": f"Error updating appointment: {str(e)}"
+            "error": "The doctor already has an appointment at this time"
+            if isinstance(e, IntegrityError) else f"Error updating appointment: {str(e)}"
         })
 
 
@@ -6839,11 +6870,11 @@ async def admin_appointment_payment_action(
     request: Request,
     appointment_id: int,
     action: str = Form(...),  # refund, cancel, etc.
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Handle payment actions for appointments"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -6875,11 +6906,11 @@ async def admin_appointment_payment_action(
 @router.get("/admin/users/{user_id}")
 async def get_user_details(
     user_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Get individual user details (API endpoint for modal)"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -6902,11 +6933,11 @@ async def get_user_details(
 @router.post("/admin/users/{user_id}/toggle-status")
 async def toggle_user_status(
     user_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Toggle user active status"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -6916,6 +6947,7 @@ async def toggle_user_status(
     
     user.is_active = not user.is_active
     await db.commit()
+    invalidate_principal(User, user_id)
     
     status_text = "activated" if user.is_active else "deactivated"
     return {"message": f"User {status_text} successfully"}
@@ -6923,11 +6955,11 @@ async def toggle_user_status(
 @router.delete("/admin/users/{user_id}")
 async def delete_user(
     user_id: int,
-    session_token: Optional[str] = Cookie(None),
+    admin_context: AdminContext = Depends(get_admin_context),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a user"""
-    admin = await get_current_admin_object(session_token, db)
+    admin = admin_context.admin
     if not admin:
         raise HTTPException(status_code=401, detail="Authentication required")
     
@@ -6937,6 +6969,7 @@ async def delete_user(
     
     await db.delete(user)
     await db.commit()
+    invalidate_principal(User, user_id)
     
     return {"message": "User deleted successfully"}
 
@@ -3,7 +3,7 @@ API v1 router
 """
 
 from fastapi import APIRouter
-from app.api.v1 import routes, uploads, admin, contact, offers
+from app.api.v1 import routes, uploads, admin, contact, offers, home
 
 api_router = APIRouter()
 
@@ -13,3 +13,4 @@ api_router.include_router(uploads.router, prefix="/uploads", tags=["uploads"])
 api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
 api_router.include_router(contact.router, tags=["contact"])
 api_router.include_router(offers.router, tags=["offers"])
+api_router.include_router(home.router, tags=["home"])
@@ -11,7 +11,7 @@ from typing import List
 from app.db import get_db
 from app import models, schemas
 from app.auth import verify_password, create_admin_token
-from app.dependencies import get_current_admin, get_current_super_admin
+from app.dependencies import get_current_admin, get_current_super_admin, invalidate_principal
 
 router = APIRouter()
 
@@ -44,6 +44,7 @@ async def admin_login(
     # Update last login
     admin.last_login = datetime.utcnow()
     await db.commit()
+    invalidate_principal(models.Admin, admin.id)
     
     # Create access token
     access_token = create_admin_token(
@@ -184,5 +185,6 @@ async def toggle_admin_active(
     
     admin.is_active = not admin.is_active
     await db.commit()
+    invalidate_principal(models.Admin, admin_id)
     
     return {"message": f"Admin {'activated' if admin.is_active else 'deactivated'} successfully"}
\ No newline at end of file
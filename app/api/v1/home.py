@@ -0,0 +1,156 @@
+"""
+Homepage aggregate endpoint
+
+``GET /api/v1/home`` returns every landing page section in one compact
+payload instead of seven separate list calls. Each section selects only the
+columns its cards show and attaches primary images with one batched query.
+Sections are cached individually and dropped when one of the tables they
+read is written, so editing a banner does not reload the featured doctors.
+Sections missing from the cache are loaded concurrently, each on its own
+session bound to the engine chosen for the request.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models, schemas
+from app.core.config import settings
+from app.db import get_read_db
+from app.utils.cache import TTLCache, invalidate_on_write
+
+router = APIRouter()
+
+
+@dataclass(frozen=True)
+class HomeSection:
+    key: str
+    model: type
+    columns: tuple
+    criteria: tuple = ()
+    order_by: tuple = ()
+    # Image.owner_type of the primary image shown on each card
+    image_owner: Optional[str] = None
+
+    @property
+    def tables(self) -> tuple:
+        """Tables whose writes make the cached section stale"""
+        if self.image_owner:
+            return (self.model.__tablename__, "images")
+        return (self.model.__tablename__,)
+
+    async def load(self, db: AsyncSession, limit: int) -> List[dict]:
+        query = (
+            select(*(getattr(self.model, column) for column in self.columns))
+            .where(*self.criteria)
+            .order_by(*self.order_by)
+            .limit(limit)
+        )
+        rows = [dict(row) for row in (await db.execute(query)).mappings()]
+        if self.image_owner and rows:
+            images = await _primary_image_urls(db, self.image_owner, [row["id"] for row in rows])
+            for row in rows:
+                row["image_url"] = images.get(row["id"])
+        return rows
+
+
+async def _primary_image_urls(db: AsyncSession, owner_type: str, owner_ids: List[int]) -> Dict[int, str]:
+    """URL of the primary (else first) image of each owner, in one query"""
+    result = await db.execute(
+        select(models.Image.owner_id, models.Image.url)
+        .where(models.Image.owner_type == owner_type, models.Image.owner_id.in_(owner_ids))
+        .order_by(models.Image.owner_id, models.Image.is_primary.desc(), models.Image.position, models.Image.id)
+    )
+    urls: Dict[int, str] = {}
+    for owner_id, url in result.all():
+        urls.setdefault(owner_id, url)
+    return urls
+
+
+HOME_SECTIONS = (
+    HomeSection(
+        "banners", models.Banner,
+        ("id", "name", "title", "subtitle", "description", "image_url", "link_url", "button_text"),
+        criteria=(models.Banner.is_active == True,),
+        order_by=(models.Banner.position, models.Banner.created_at.desc()),
+    ),
+    HomeSection(
+        "sliders", models.Slider,
+        ("id", "title", "description", "image_url", "link", "tags"),
+        criteria=(models.Slider.is_active == True,),
+        order_by=(models.Slider.created_at.desc(),),
+    ),
+    HomeSection(
+        "featured_treatments", models.Treatment,
+        ("id", "name", "short_description", "treatment_type", "location", "price_min", "price_max",
+         "price_exact", "rating", "hospital_id", "is_ayushman"),
+        criteria=(models.Treatment.is_featured == True,),
+        order_by=(models.Treatment.created_at.desc(),),
+        image_owner="treatment",
+    ),
+    HomeSection(
+        "featured_doctors", models.Doctor,
+        ("id", "name", "profile_photo", "designation", "specialization", "experience_years", "rating",
+         "location", "hospital_id"),
+        criteria=(models.Doctor.is_featured == True, models.Doctor.is_active == True),
+        order_by=(models.Doctor.created_at.desc(),),
+        image_owner="doctor",
+    ),
+    HomeSection(
+        "featured_hospitals", models.Hospital,
+        ("id", "name", "location", "rating", "specializations", "bed_count"),
+        criteria=(models.Hospital.is_featured == True, models.Hospital.is_active == True),
+        order_by=(models.Hospital.created_at.desc(),),
+        image_owner="hospital",
+    ),
+    HomeSection(
+        "stories", models.PatientStory,
+        ("id", "patient_name", "description", "rating", "profile_photo", "treatment_type", "hospital_name",
+         "location"),
+        criteria=(models.PatientStory.is_featured == True, models.PatientStory.is_active == True),
+        order_by=(models.PatientStory.position, models.PatientStory.created_at.desc()),
+    ),
+    HomeSection(
+        "partners", models.PartnerHospital,
+        ("id", "name", "logo_url", "hospital_id"),
+        order_by=(models.PartnerHospital.created_at.desc(),),
+    ),
+)
+
+# One entry per section key
+home_cache = TTLCache(maxsize=len(HOME_SECTIONS), ttl=settings.home_cache_seconds)
+for _section in HOME_SECTIONS:
+    invalidate_on_write(_section.tables, partial(home_cache.invalidate, _section.key))
+
+
+async def _load_on_own_session(db: AsyncSession, section: HomeSection) -> List[dict]:
+    # A session runs one statement at a time, so concurrent sections each get one
+    async with AsyncSession(bind=db.bind, expire_on_commit=False) as session:
+        return await section.load(session, settings.home_section_limit)
+
+
+@router.get("/home", response_model=schemas.HomeResponse)
+async def get_home(db: AsyncSession = Depends(get_read_db)):
+    """Every homepage section in one payload"""
+    payload = {}
+    missing = []
+    for section in HOME_SECTIONS:
+        cached = home_cache.get(section.key)
+        if cached is None:
+            missing.append(section)
+        else:
+            payload[section.key] = cached
+
+    if len(missing) == 1:
+        loaded = [await missing[0].load(db, settings.home_section_limit)]
+    else:
+        loaded = await asyncio.gather(*(_load_on_own_session(db, section) for section in missing))
+    for section, rows in zip(missing, loaded):
+        home_cache.set(section.key, rows)
+        payload[section.key] = rows
+    return payload
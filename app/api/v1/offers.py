@@ -2,23 +2,101 @@
 Public API endpoints for Offers
 """
 
+from dataclasses import dataclass
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, and_
+from sqlalchemy import select, desc, and_, case, func
 from sqlalchemy.orm import selectinload
 from typing import Optional, List
 from datetime import datetime
 
-from app.dependencies import get_db
+from app.core.config import settings
+from app.db import get_read_db
 from app.models import Offer, Treatment, Image
 from app.schemas import OfferResponse
+from app.utils.cache import TTLCache, invalidate_on_write
 
 router = APIRouter(prefix="/api/v1/offers", tags=["offers"])
 
 
+@dataclass
+class ActiveOffers:
+    """Active, not yet ended offers as of ``taken_at``"""
+    taken_at: datetime
+    # Serialized offers, newest first; includes offers that have not started yet
+    offers: List[dict]
+    treatment_types: List[str]
+    locations: List[str]
+    # Offers running right now, as returned by /active/count
+    counts: dict
+    # Earliest start or end of an offer after ``taken_at``; the snapshot is
+    # only valid until then
+    next_change: Optional[datetime]
+
+
+# The set of active offers only changes when an offer starts or ends or is
+# edited, so the snapshot lives until the next start/end boundary and is
+# dropped on offer and image writes. offers_snapshot_max_seconds bounds how
+# long writes made by other worker processes can go unnoticed.
+active_offers_cache = TTLCache(maxsize=1, ttl=settings.offers_snapshot_max_seconds)
+invalidate_on_write(("offers", "images"), active_offers_cache.clear)
+
+
+async def get_active_offers(db: AsyncSession) -> ActiveOffers:
+    """Return the cached snapshot, rebuilding it once it is past its boundary"""
+    snapshot = active_offers_cache.get("active")
+    if snapshot is not None:
+        return snapshot
+
+    now = datetime.utcnow()
+    result = await db.execute(
+        select(Offer)
+        .options(selectinload(Offer.images))
+        .where(Offer.is_active == True, Offer.end_date > now)
+        .order_by(desc(Offer.created_at))
+    )
+    offers = [OfferResponse.model_validate(offer).model_dump() for offer in result.scalars().all()]
+
+    # Categories of the running offers and the next boundary in one aggregate
+    running = Offer.start_date <= now
+    stats = (await db.execute(
+        select(
+            func.sum(case((running, 1), else_=0)).label("total_active"),
+            func.sum(case((and_(running, Offer.is_free_camp == True), 1), else_=0)).label("free_camps"),
+            func.sum(case((and_(running, Offer.discount_percentage > 0), 1), else_=0)).label("discount_offers"),
+            func.min(case((Offer.start_date > now, Offer.start_date), else_=Offer.end_date)).label("next_change"),
+        ).where(Offer.is_active == True, Offer.end_date > now)
+    )).one()
+    total_active = stats.total_active or 0
+    free_camps = stats.free_camps or 0
+    discount_offers = stats.discount_offers or 0
+
+    snapshot = ActiveOffers(
+        taken_at=now,
+        offers=offers,
+        treatment_types=sorted({offer["treatment_type"] for offer in offers if offer["treatment_type"]}),
+        locations=sorted({offer["location"] for offer in offers if offer["location"]}),
+        counts={
+            "total_active": total_active,
+            "free_camps": free_camps,
+            "discount_offers": discount_offers,
+            "other_offers": total_active - free_camps - discount_offers,
+        },
+        next_change=stats.next_change,
+    )
+    ttl = (stats.next_change - now).total_seconds() if stats.next_change else None
+    active_offers_cache.set("active", snapshot, ttl=ttl)
+    return snapshot
+
+
+def _contains(value: Optional[str], term: str) -> bool:
+    """Python equivalent of ``column.ilike('%term%')``"""
+    return value is not None and term.lower() in value.lower()
+
+
 @router.get("", response_model=List[OfferResponse])
 async def get_offers(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     skip: int = Query(0, ge=0, description="Number of offers to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of offers to return"),
     treatment_type: Optional[str] = Query(None, description="Filter by treatment type"),
@@ -38,6 +116,19 @@ async def get_offers(
     - **include_expired**: Whether to include expired offers
     - **search**: Search term for name and description
     """
+    if is_active and not include_expired:
+        # The common public listing is served from the active-offer snapshot
+        offers = (await get_active_offers(db)).offers
+        if treatment_type:
+            offers = [offer for offer in offers if _contains(offer["treatment_type"], treatment_type)]
+        if location:
+            offers = [offer for offer in offers if _contains(offer["location"], location)]
+        if search:
+            offers = [
+                offer for offer in offers
+                if _contains(offer["name"], search) or _contains(offer["description"], search)
+            ]
+        return offers[skip:skip + limit]
     
     # Build query
     query = select(Offer).options(
@@ -87,7 +178,7 @@ async def get_offers(
 @router.get("/{offer_id}", response_model=OfferResponse)
 async def get_offer(
     offer_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific offer by ID
@@ -114,68 +205,24 @@ async def get_offer(
 
 
 @router.get("/treatment-types/list")
-async def get_treatment_types(db: AsyncSession = Depends(get_db)):
+async def get_treatment_types(db: AsyncSession = Depends(get_read_db)):
     """
     Get all available treatment types from offers
     """
-    query = select(Offer.treatment_type).distinct().where(
-        and_(
-            Offer.treatment_type.isnot(None),
-            Offer.is_active == True,
-            Offer.end_date > datetime.utcnow()
-        )
-    )
-    
-    result = await db.execute(query)
-    treatment_types = [row[0] for row in result.fetchall() if row[0]]
-    
-    return {"treatment_types": sorted(treatment_types)}
+    return {"treatment_types": (await get_active_offers(db)).treatment_types}
 
 
 @router.get("/locations/list")
-async def get_locations(db: AsyncSession = Depends(get_db)):
+async def get_locations(db: AsyncSession = Depends(get_read_db)):
     """
     Get all available locations from offers
     """
-    query = select(Offer.location).distinct().where(
-        and_(
-            Offer.location.isnot(None),
-            Offer.is_active == True,
-            Offer.end_date > datetime.utcnow()
-        )
-    )
-    
-    result = await db.execute(query)
-    locations = [row[0] for row in result.fetchall() if row[0]]
-    
-    return {"locations": sorted(locations)}
+    return {"locations": (await get_active_offers(db)).locations}
 
 
 @router.get("/active/count")
-async def get_active_offers_count(db: AsyncSession = Depends(get_db)):
+async def get_active_offers_count(db: AsyncSession = Depends(get_read_db)):
     """
     Get count of currently active offers
     """
-    now = datetime.utcnow()
-    
-    query = select(Offer).where(
-        and_(
-            Offer.is_active == True,
-            Offer.start_date <= now,
-            Offer.end_date > now
-        )
-    )
-    
-    result = await db.execute(query)
-    active_offers = result.scalars().all()
-    
-    # Categorize offers
-    free_camps = len([o for o in active_offers if o.is_free_camp])
-    discount_offers = len([o for o in active_offers if o.discount_percentage and o.discount_percentage > 0])
-    
-    return {
-        "total_active": len(active_offers),
-        "free_camps": free_camps,
-        "discount_offers": discount_offers,
-        "other_offers": len(active_offers) - free_camps - discount_offers
-    }
\ No newline at end of file
+    return dict((await get_active_offers(db)).counts)
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, not_, func, false, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import defer
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytz
 import json
 import re
@@ -12,11 +15,17 @@ import uuid
 import razorpay
 import hmac
 import hashlib
+import logging
 from pathlib import Path
-from app.db import get_db
+from app.db import get_db, get_read_db
 from app import models, schemas
-from app.dependencies import get_current_admin, get_current_user
+from app.dependencies import get_current_admin, get_current_user, invalidate_principal
 from app.core.config import settings
+from app.utils.availability import availability_for, doctor_availability, next_free_slots, slot_window
+from app.utils.blog_content import apply_blog_content, reading_time_for
+from app.utils.cache import TTLCache, invalidate_on_write
+from app.utils.owner_rows import load_faqs_map, load_images_map
+from app.utils.view_counter import ViewCounter
 import os
 
 # Razorpay Configuration
@@ -24,6 +33,8 @@ RAZORPAY_KEY_ID = settings.razorpay_key_id or ""
 RAZORPAY_KEY_SECRET = settings.razorpay_key_secret or ""
 razorpay_client = razorpay.Client(auth=(RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET))
 
+logger = logging.getLogger(__name__)
+
 
 def hospital_to_dict(hospital: models.Hospital) -> dict:
     """Convert Hospital model to dict for safe serialization"""
@@ -63,16 +74,8 @@ def hospital_to_dict(hospital: models.Hospital) -> dict:
 
 def doctor_to_dict(doctor: models.Doctor) -> dict:
     """Convert Doctor model to dict for safe serialization"""
-    # parse time_slots JSON if present into a dict for clients
-    time_slots_parsed = {}
-    try:
-        if doctor.time_slots:
-            if isinstance(doctor.time_slots, str):
-                time_slots_parsed = json.loads(doctor.time_slots)
-            elif isinstance(doctor.time_slots, dict):
-                time_slots_parsed = doctor.time_slots
-    except Exception:
-        time_slots_parsed = {}
+    # time_slots JSON is parsed once per doctor and cached until it changes
+    time_slots_parsed = dict(availability_for(doctor).days)
 
     return {
         "id": doctor.id,
@@ -93,7 +96,7 @@ def doctor_to_dict(doctor: models.Doctor) -> dict:
         "highlights": doctor.highlights,
         "awards": doctor.awards,
         "location": doctor.location,
-    "time_slots": time_slots_parsed,
+        "time_slots": time_slots_parsed,
         "is_featured": doctor.is_featured if doctor.is_featured is not None else False,
         "is_active": doctor.is_active if doctor.is_active is not None else True,
         "created_at": doctor.created_at,
@@ -154,21 +157,22 @@ def treatment_to_dict(treatment: models.Treatment) -> dict:
     }
 
 
-def blog_to_dict(blog: models.Blog) -> dict:
-    """Convert Blog model to dict for safe serialization"""
+def blog_summary_to_dict(blog: models.Blog) -> dict:
+    """Convert Blog model to a list entry; only reads columns the list query loads"""
     return {
         "id": blog.id,
         "title": blog.title,
         "subtitle": blog.subtitle,
         "slug": blog.slug,
-        "content": blog.content,
-        "excerpt": blog.excerpt,
+        # Admin-entered values win over the ones derived from the content
+        "excerpt": blog.excerpt or blog.auto_excerpt,
         "featured_image": blog.featured_image,
         "meta_description": blog.meta_description,
         "tags": blog.tags,
         "category": blog.category,
         "author_name": blog.author_name,
-        "reading_time": blog.reading_time,
+        "reading_time": blog.reading_time or reading_time_for(blog.word_count),
+        "word_count": blog.word_count or 0,
         "view_count": blog.view_count,
         "is_published": blog.is_published,
         "is_featured": blog.is_featured,
@@ -178,6 +182,41 @@ def blog_to_dict(blog: models.Blog) -> dict:
         "images": []  # Will be populated separately
     }
 
+
+def blog_to_dict(blog: models.Blog) -> dict:
+    """Convert Blog model to dict for safe serialization"""
+    return {
+        **blog_summary_to_dict(blog),
+        # Blogs saved before derived fields existed only have the raw content
+        "content": blog.content_html if blog.content_html is not None else blog.content,
+        "toc": json.loads(blog.toc) if blog.toc else [],
+    }
+
+
+def image_to_dict(image: models.Image) -> dict:
+    return {
+        "id": image.id,
+        "url": image.url,
+        "is_primary": image.is_primary,
+        "position": image.position,
+        "uploaded_at": image.uploaded_at
+    }
+
+
+def faq_to_dict(faq: models.FAQ) -> dict:
+    return {
+        "id": faq.id,
+        "owner_type": faq.owner_type,
+        "owner_id": faq.owner_id,
+        "question": faq.question,
+        "answer": faq.answer,
+        "position": faq.position,
+        "is_active": faq.is_active,
+        "created_at": faq.created_at,
+        "updated_at": faq.updated_at
+    }
+
+
 router = APIRouter()
 
 
@@ -199,7 +238,7 @@ async def get_sliders(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     active_only: bool = Query(True),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     query = select(models.Slider)
     if active_only:
@@ -211,7 +250,7 @@ async def get_sliders(
 
 
 @router.get("/sliders/{slider_id}", response_model=schemas.SliderResponse)
-async def get_slider(slider_id: int, db: AsyncSession = Depends(get_db)):
+async def get_slider(slider_id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(models.Slider).where(models.Slider.id == slider_id))
     slider = result.scalar_one_or_none()
     if not slider:
@@ -273,7 +312,7 @@ async def get_hospitals(
     limit: int = Query(100, ge=1, le=1000),
     search: Optional[str] = Query(None),
     location: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     query = select(models.Hospital)
     
@@ -294,62 +333,23 @@ async def get_hospitals(
     result = await db.execute(query)
     hospitals = result.scalars().all()
     
-    # Load images and FAQs for each hospital within the session
+    # Load images and FAQs for all hospitals in two queries
+    hospital_ids = [hospital.id for hospital in hospitals]
+    images_map = await load_images_map(db, 'hospital', hospital_ids)
+    faqs_map = await load_faqs_map(db, 'hospital', hospital_ids)
+
     hospital_dicts = []
     for hospital in hospitals:
-        # Load images within session
-        images_result = await db.execute(
-            select(models.Image).where(
-                and_(
-                    models.Image.owner_id == hospital.id,
-                    models.Image.owner_type == 'hospital'
-                )
-            ).order_by(models.Image.position)
-        )
-        images = images_result.scalars().all()
-        
-        # Load FAQs within session
-        faqs_result = await db.execute(
-            select(models.FAQ).where(
-                and_(
-                    models.FAQ.owner_id == hospital.id,
-                    models.FAQ.owner_type == 'hospital',
-                    models.FAQ.is_active == True
-                )
-            ).order_by(models.FAQ.position)
-        )
-        faqs = faqs_result.scalars().all()
-        
         hospital_dict = hospital_to_dict(hospital)
-        hospital_dict['images'] = [
-            {
-                "id": img.id,
-                "url": img.url,
-                "is_primary": img.is_primary,
-                "position": img.position,
-                "uploaded_at": img.uploaded_at
-            } for img in images
-        ]
-        hospital_dict['faqs'] = [
-            {
-                "id": faq.id,
-                "owner_type": faq.owner_type,
-                "owner_id": faq.owner_id,
-                "question": faq.question,
-                "answer": faq.answer,
-                "position": faq.position,
-                "is_active": faq.is_active,
-                "created_at": faq.created_at,
-                "updated_at": faq.updated_at
-            } for faq in faqs
-        ]
+        hospital_dict['images'] = [image_to_dict(img) for img in images_map[hospital.id]]
+        hospital_dict['faqs'] = [faq_to_dict(faq) for faq in faqs_map[hospital.id]]
         hospital_dicts.append(hospital_dict)
     
     return hospital_dicts
 
 
 @router.get("/hospitals/{hospital_id}", response_model=schemas.HospitalResponse)
-async def get_hospital(hospital_id: int, db: AsyncSession = Depends(get_db)):
+async def get_hospital(hospital_id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(models.Hospital).where(models.Hospital.id == hospital_id))
     hospital = result.scalar_one_or_none()
     if not hospital:
@@ -466,7 +466,7 @@ async def get_doctors(
     hospital_id: Optional[int] = Query(None),
     specialization: Optional[str] = Query(None),
     location: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     query = select(models.Doctor)
     
@@ -560,6 +560,86 @@ async def get_doctors(
     return doctor_dicts
 
 
+def _stale_hold():
+    """
+    Unpaid online bookings older than ``appointment_hold_minutes``, or None when
+    holds never expire. Public bookings with a fee carry a Razorpay order id;
+    admin-entered appointments do not and always keep their slot.
+    """
+    if settings.appointment_hold_minutes <= 0:
+        return None
+    cutoff = datetime.utcnow() - timedelta(minutes=settings.appointment_hold_minutes)
+    # NULL-safe so rows with missing columns are never treated as stale
+    return func.coalesce(and_(
+        models.Appointment.status == "scheduled",
+        models.Appointment.payment_status == "pending",
+        models.Appointment.payment_order_id.isnot(None),
+        models.Appointment.created_at < cutoff,
+    ), false())
+
+
+@router.get("/doctors/available-slots", response_model=List[schemas.AvailableSlot])
+async def get_available_slots(
+    doctor_id: Optional[List[int]] = Query(None),
+    hospital_id: Optional[int] = Query(None),
+    specialization: Optional[str] = Query(None),
+    count: int = Query(10, ge=1, le=100),
+    start: Optional[datetime] = Query(None, description="Search from this local time; defaults to now"),
+    days: int = Query(settings.appointment_search_days, ge=1, le=60),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Next free appointment slots across the matching active doctors, earliest first"""
+    if start is None:
+        start = datetime.now(pytz.timezone(settings.clinic_timezone)).replace(tzinfo=None)
+    elif start.tzinfo is not None:
+        start = start.astimezone(pytz.timezone(settings.clinic_timezone)).replace(tzinfo=None)
+    start = start.replace(second=0, microsecond=0)
+    until = datetime.combine(start.date() + timedelta(days=days), datetime.min.time())
+
+    query = select(models.Doctor.id, models.Doctor.name, models.Doctor.time_slots).where(
+        models.Doctor.is_active == True,
+        models.Doctor.time_slots.isnot(None)
+    )
+    if doctor_id:
+        query = query.where(models.Doctor.id.in_(doctor_id))
+    if hospital_id:
+        query = query.where(models.Doctor.hospital_id == hospital_id)
+    if specialization:
+        query = query.where(models.Doctor.specialization.ilike(f"%{specialization}%"))
+    doctors = (await db.execute(query)).all()
+    if not doctors:
+        return []
+
+    names = {doctor.id: doctor.name for doctor in doctors}
+    booked: Dict[int, List[datetime]] = {}
+    query = select(models.Appointment.doctor_id, models.Appointment.scheduled_at).where(
+        models.Appointment.doctor_id.in_(names),
+        models.Appointment.scheduled_at >= start,
+        models.Appointment.scheduled_at < until,
+        models.Appointment.status != "cancelled"
+    )
+    stale = _stale_hold()
+    if stale is not None:
+        query = query.where(not_(stale))
+    appointments = await db.execute(query.order_by(models.Appointment.scheduled_at))
+    for booked_doctor_id, scheduled_at in appointments.all():
+        booked.setdefault(booked_doctor_id, []).append(scheduled_at)
+
+    slots = next_free_slots(
+        ((doctor.id, doctor_availability.get(doctor.id, doctor.time_slots)) for doctor in doctors),
+        booked,
+        start,
+        count,
+        slot_minutes=settings.appointment_slot_minutes,
+        days=days,
+    )
+    length = timedelta(minutes=settings.appointment_slot_minutes)
+    return [
+        {"doctor_id": slot_doctor_id, "doctor_name": names[slot_doctor_id], "start": slot, "end": slot + length}
+        for slot, slot_doctor_id in slots
+    ]
+
+
 @router.get("/doctors/{doctor_id}/debug")
 async def debug_doctor_faqs(doctor_id: int, db: AsyncSession = Depends(get_db)):
     """Debug endpoint to check doctor FAQ data"""
@@ -607,7 +687,7 @@ async def debug_doctor_faqs(doctor_id: int, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/doctors/{doctor_id}", response_model=schemas.DoctorResponse)
-async def get_doctor(doctor_id: int, db: AsyncSession = Depends(get_db)):
+async def get_doctor(doctor_id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(models.Doctor).where(models.Doctor.id == doctor_id))
     doctor = result.scalar_one_or_none()
     if not doctor:
@@ -706,6 +786,7 @@ async def delete_doctor(
     
     await db.delete(doctor)
     await db.commit()
+    doctor_availability.invalidate(doctor_id)
     return {"message": "Doctor deleted"}
 
 
@@ -714,7 +795,7 @@ async def delete_doctor(
 async def global_search(
     query: str = Query(..., min_length=2, description="Search query (minimum 2 characters)"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results per category"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Global search across doctors, treatments, and hospitals
@@ -1014,6 +1095,7 @@ async def user_login(
     # Update last login
     user.last_login = datetime.utcnow()
     await db.commit()
+    invalidate_principal(models.User, user.id)
     
     # Create access token
     access_token = create_access_token(
@@ -1059,6 +1141,7 @@ async def verify_email(
     user.email_verification_token = None
     user.email_verification_expires = None
     await db.commit()
+    invalidate_principal(models.User, user.id)
     
     return {"message": "Email verified successfully"}
 
@@ -1097,6 +1180,7 @@ async def resend_verification(
     user.email_verification_token = verification_token
     user.email_verification_expires = verification_expires
     await db.commit()
+    invalidate_principal(models.User, user.id)
     
     # Send verification email
     base_url = f"{request.url.scheme}://{request.url.netloc}"
@@ -1114,7 +1198,7 @@ async def forgot_password(
     from app.auth_utils import generate_verification_token, send_password_reset_email
     from datetime import datetime, timedelta
     
-    print(f"🔐 Password reset request for email: {forgot_data.email}")
+    logger.info("Password reset requested", extra={"email": forgot_data.email})
     
     # Get user by email
     result = await db.execute(
@@ -1124,11 +1208,9 @@ async def forgot_password(
     
     if not user:
         # Don't reveal if email exists or not for security
-        print(f"⚠️ User not found for email: {forgot_data.email}")
+        logger.info("Password reset for unknown email", extra={"email": forgot_data.email})
         return {"message": "If the email exists, a password reset link has been sent"}
     
-    print(f"✅ User found: {user.name} ({user.email})")
-    
     # Generate password reset token
     reset_token = generate_verification_token()
     reset_expires = datetime.utcnow() + timedelta(hours=1)
@@ -1136,19 +1218,16 @@ async def forgot_password(
     user.password_reset_token = reset_token
     user.password_reset_expires = reset_expires
     await db.commit()
-    
-    print(f"🔑 Reset token generated and saved to database")
+    invalidate_principal(models.User, user.id)
     
     # Send password reset email
     base_url = f"{request.url.scheme}://{request.url.netloc}"
-    print(f"📧 Sending password reset email to {user.email} with base_url: {base_url}")
+    logger.debug("Sending password reset email", extra={"user_id": user.id, "base_url": base_url})
     
     email_sent = send_password_reset_email(user.email, reset_token, user.name, base_url)
     
-    if email_sent:
-        print(f"✅ Password reset email sent successfully to {user.email}")
-    else:
-        print(f"❌ Failed to send password reset email to {user.email}")
+    if not email_sent:
+        logger.warning("Password reset email not sent", extra={"user_id": user.id})
     
     return {"message": "If the email exists, a password reset link has been sent"}
 
@@ -1186,6 +1265,7 @@ async def reset_password(
     user.password_reset_token = None
     user.password_reset_expires = None
     await db.commit()
+    invalidate_principal(models.User, user.id)
     
     return {"message": "Password reset successfully"}
 
@@ -1244,6 +1324,7 @@ async def verify_email_page(token: str, request: Request, db: AsyncSession = Dep
         user.email_verification_token = None
         user.email_verification_expires = None
         await db.commit()
+        invalidate_principal(models.User, user.id)
         
         # Return success page
         return f"""
@@ -1541,7 +1622,7 @@ async def get_treatments(
     price_max: Optional[float] = Query(None),
     is_active: Optional[bool] = Query(None),
     is_featured: Optional[bool] = Query(None),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     query = select(models.Treatment)
     
@@ -1700,7 +1781,7 @@ async def get_treatments(
 async def get_featured_treatments(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=200),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Return featured treatments with minimal fields: id, name, descriptions and images."""
     query = select(models.Treatment).where(models.Treatment.is_featured == True)
@@ -1740,7 +1821,7 @@ async def get_featured_treatments(
 
 
 @router.get("/treatments/{treatment_id}", response_model=schemas.TreatmentResponse)
-async def get_treatment(treatment_id: int, db: AsyncSession = Depends(get_db)):
+async def get_treatment(treatment_id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(models.Treatment).where(models.Treatment.id == treatment_id))
     treatment = result.scalar_one_or_none()
     if not treatment:
@@ -1853,7 +1934,7 @@ async def get_treatment(treatment_id: int, db: AsyncSession = Depends(get_db)):
 async def get_featured_treatments(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=200),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Return featured treatments with minimal fields: id, name, descriptions and images."""
     query = select(models.Treatment).where(models.Treatment.is_featured == True)
@@ -2011,7 +2092,7 @@ async def create_booking(
             buffer.write(content)
         
         medical_file_path = str(file_path)
-        print(f"✅ File uploaded successfully: {medical_file_path} ({len(content)} bytes)")
+        logger.debug("Medical history file stored", extra={"path": medical_file_path, "size": len(content)})
     
     # Create booking object
     booking_data = {
@@ -2087,7 +2168,7 @@ async def create_booking(
             currency="INR"
         )
     except Exception as e:
-        print(f"❌ Error creating Razorpay order: {str(e)}")
+        logger.exception("Error creating Razorpay order", extra={"booking_id": db_booking.id})
         # Return booking even if Razorpay order creation fails
         return schemas.BookingWithPayment(
             id=db_booking.id,
@@ -2272,6 +2353,98 @@ async def verify_razorpay_payment(
         )
 
 
+# Appointment endpoints
+@router.post("/appointments", response_model=schemas.AppointmentWithPayment, status_code=status.HTTP_201_CREATED)
+async def create_appointment(
+    booking: schemas.AppointmentBookingCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Book a free doctor slot and open a Razorpay order for the consultation fee"""
+    clinic_tz = pytz.timezone(settings.clinic_timezone)
+    scheduled_at = booking.scheduled_at
+    if scheduled_at.tzinfo is not None:
+        scheduled_at = scheduled_at.astimezone(clinic_tz).replace(tzinfo=None)
+    if scheduled_at <= datetime.now(clinic_tz).replace(tzinfo=None):
+        raise HTTPException(status_code=400, detail="Appointment time must be in the future")
+
+    # Lock the doctor row so concurrent bookings for this doctor run one at a time
+    doctor = (await db.execute(
+        select(models.Doctor.id, models.Doctor.time_slots, models.Doctor.consultancy_fee)
+        .where(models.Doctor.id == booking.doctor_id, models.Doctor.is_active == True)
+        .with_for_update()
+    )).one_or_none()
+    if not doctor:
+        raise HTTPException(status_code=404, detail="Doctor not found")
+    slot_minutes = settings.appointment_slot_minutes
+    if not doctor_availability.get(doctor.id, doctor.time_slots).is_slot_start(scheduled_at, slot_minutes):
+        raise HTTPException(status_code=400, detail="The doctor is not available at this time")
+
+    # Same rule as the available-slots listing: any live appointment starting
+    # inside the slot takes it (also catches unaligned admin bookings)
+    window_start, window_end = slot_window(scheduled_at, slot_minutes)
+    in_window = and_(
+        models.Appointment.doctor_id == doctor.id,
+        models.Appointment.scheduled_at >= window_start,
+        models.Appointment.scheduled_at < window_end,
+    )
+    stale = _stale_hold()
+    if stale is not None:
+        # Release expired unpaid holds so the unique slot index lets the new row in
+        await db.execute(
+            update(models.Appointment).where(in_window, stale).values(status="cancelled")
+            .execution_options(synchronize_session=False)
+        )
+    conflict = await db.execute(
+        select(models.Appointment.id).where(in_window, models.Appointment.status != "cancelled").limit(1)
+    )
+    if conflict.first():
+        raise HTTPException(status_code=409, detail="This slot is already booked")
+
+    appointment = models.Appointment(
+        patient_name=booking.patient_name,
+        patient_contact=booking.patient_contact,
+        doctor_id=doctor.id,
+        hospital_preference=booking.hospital_preference,
+        scheduled_at=scheduled_at,
+        notes=booking.notes,
+        status="scheduled",
+        consultation_fees=doctor.consultancy_fee,
+        payment_status="pending"
+    )
+    db.add(appointment)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # uq_appointments_doctor_slot: a concurrent request reserved the same slot first
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="This slot is already booked")
+    await db.refresh(appointment)
+
+    payment = {"razorpay_key_id": RAZORPAY_KEY_ID, "currency": "INR"}
+    if appointment.consultation_fees:
+        payment["amount_in_paise"] = int(appointment.consultation_fees * 100)
+        try:
+            # The Razorpay SDK makes a blocking HTTP call
+            razorpay_order = await run_in_threadpool(razorpay_client.order.create, {
+                "amount": payment["amount_in_paise"],
+                "currency": "INR",
+                "receipt": f"appointment_{appointment.id}",
+                "notes": {
+                    "appointment_id": str(appointment.id),
+                    "patient_name": appointment.patient_name
+                }
+            })
+            appointment.payment_order_id = razorpay_order['id']
+            await db.commit()
+            await db.refresh(appointment)
+        except Exception:
+            logger.exception("Error creating Razorpay order", extra={"appointment_id": appointment.id})
+            # The slot stays reserved; payment can be retried by support
+            payment["error"] = "Failed to create payment order. Please contact support."
+
+    return {**schemas.AppointmentResponse.model_validate(appointment).model_dump(), **payment}
+
+
 # Get Razorpay Key (Public endpoint for frontend)
 @router.get("/razorpay/key")
 async def get_razorpay_key():
@@ -2281,7 +2454,7 @@ async def get_razorpay_key():
 
 # Dropdown/Filter Data Endpoints
 @router.get("/filters/locations", response_model=List[str])
-async def get_locations(db: AsyncSession = Depends(get_db)):
+async def get_locations(db: AsyncSession = Depends(get_read_db)):
     """Get all unique locations from hospitals, treatments, and doctors for dropdown"""
     # Get locations from hospitals
     hospital_result = await db.execute(
@@ -2335,7 +2508,7 @@ async def get_locations(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/doctor-filters/locations", response_model=List[str])
-async def get_doctor_locations(db: AsyncSession = Depends(get_db)):
+async def get_doctor_locations(db: AsyncSession = Depends(get_read_db)):
     """Get all unique city names from doctors for dropdown (normalized & deduped).
 
     Uses the same normalization rules as `/filters/locations`:
@@ -2375,9 +2548,8 @@ async def get_doctor_locations(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/filters/treatment-types", response_model=List[str])
-async def get_treatment_types(db: AsyncSession = Depends(get_db)):
+async def get_treatment_types(db: AsyncSession = Depends(get_read_db)):
     """Get all unique treatment types for dropdown (categories only, not individual treatment names)"""
-    # Debug: Let's see what the raw query returns
     result = await db.execute(
         select(models.Treatment.treatment_type)
         .distinct()
@@ -2386,9 +2558,6 @@ async def get_treatment_types(db: AsyncSession = Depends(get_db)):
     )
     treatment_types = result.scalars().all()
     
-    # Debug logging (you can remove this later)
-    print(f"Raw treatment_types from DB: {treatment_types}")
-    
     # Filter out empty values, clean whitespace, and ensure uniqueness
     valid_types = set()
     for t in treatment_types:
@@ -2396,10 +2565,9 @@ async def get_treatment_types(db: AsyncSession = Depends(get_db)):
             # Clean and standardize the type name
             clean_type = t.strip()
             valid_types.add(clean_type)
-            print(f"Added clean_type: {clean_type}")
     
     final_result = sorted(list(valid_types))
-    print(f"Final result: {final_result}")
+    logger.debug("Treatment types resolved", extra={"raw_count": len(treatment_types), "types": final_result})
     
     return final_result
 
@@ -2427,7 +2595,7 @@ async def debug_treatment_types(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/filters/specializations", response_model=List[str])
-async def get_specializations(db: AsyncSession = Depends(get_db)):
+async def get_specializations(db: AsyncSession = Depends(get_read_db)):
     """Get all unique specializations/skills from doctors for dropdown"""
     result = await db.execute(
         select(models.Doctor.specialization).distinct().where(models.Doctor.specialization.isnot(None))
@@ -2452,7 +2620,7 @@ async def get_specializations(db: AsyncSession = Depends(get_db)):
 async def get_faqs(
     owner_type: str,
     owner_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all FAQs for a specific entity (doctor, hospital, or treatment)"""
     if owner_type not in ["doctor", "hospital", "treatment"]:
@@ -2623,7 +2791,7 @@ async def delete_image(
 
 
 # Blog endpoints
-@router.get("/blogs", response_model=List[schemas.BlogResponse])
+@router.get("/blogs", response_model=List[schemas.BlogSummaryResponse])
 async def get_blogs(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -2632,10 +2800,13 @@ async def get_blogs(
     tags: Optional[str] = Query(None),
     published_only: bool = Query(True),
     featured_only: bool = Query(False),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all blogs with filtering and pagination"""
-    query = select(models.Blog)
+    # The body is only needed by the detail endpoints, so keep list rows small
+    query = select(models.Blog).options(
+        defer(models.Blog.content), defer(models.Blog.content_html), defer(models.Blog.toc)
+    )
     
     filters = []
     if search:
@@ -2661,109 +2832,54 @@ async def get_blogs(
     result = await db.execute(query)
     blogs = result.scalars().all()
     
-    # Load images for each blog within the session
+    # Load images for all blogs in one query
+    images_map = await load_images_map(db, 'blog', [blog.id for blog in blogs])
+
     blog_dicts = []
     for blog in blogs:
-        # Load images within session
-        images_result = await db.execute(
-            select(models.Image).where(
-                and_(
-                    models.Image.owner_id == blog.id,
-                    models.Image.owner_type == 'blog'
-                )
-            ).order_by(models.Image.position)
-        )
-        images = images_result.scalars().all()
-        
-        blog_dict = blog_to_dict(blog)
-        blog_dict['images'] = [
-            {
-                "id": img.id,
-                "url": img.url,
-                "is_primary": img.is_primary,
-                "position": img.position,
-                "uploaded_at": img.uploaded_at
-            } for img in images
-        ]
+        blog_dict = blog_summary_to_dict(blog)
+        blog_dict['images'] = [image_to_dict(img) for img in images_map[blog.id]]
         blog_dicts.append(blog_dict)
     
     return blog_dicts
 
 
+# Blog views are buffered in memory and written in batches, so reading a post
+# stays a read-only, cacheable request
+blog_views = ViewCounter(models.Blog, "view_count", interval=settings.blog_view_flush_seconds)
+# Assembled blog detail payloads keyed by ("id", id) / ("slug", slug); the
+# stored view count they hold goes stale once buffered views are written
+blog_detail_cache = TTLCache(maxsize=512, ttl=settings.blog_cache_seconds)
+invalidate_on_write(("blogs", "images"), blog_detail_cache.clear)
+blog_views.on_flush(blog_detail_cache.clear)
+
+
+async def _blog_detail(db: AsyncSession, cache_key: tuple, condition) -> dict:
+    blog_dict = blog_detail_cache.get(cache_key)
+    if blog_dict is None:
+        result = await db.execute(select(models.Blog).where(condition))
+        blog = result.scalar_one_or_none()
+        if not blog:
+            raise HTTPException(status_code=404, detail="Blog not found")
+        blog_dict = blog_to_dict(blog)
+        images = (await load_images_map(db, 'blog', [blog.id]))[blog.id]
+        blog_dict['images'] = [image_to_dict(img) for img in images]
+        blog_detail_cache.set(cache_key, blog_dict)
+
+    blog_views.increment(blog_dict['id'])
+    return {**blog_dict, 'view_count': (blog_dict['view_count'] or 0) + blog_views.pending(blog_dict['id'])}
+
+
 @router.get("/blogs/{blog_id}", response_model=schemas.BlogResponse)
-async def get_blog(blog_id: int, db: AsyncSession = Depends(get_db)):
+async def get_blog(blog_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get blog details by ID"""
-    result = await db.execute(select(models.Blog).where(models.Blog.id == blog_id))
-    blog = result.scalar_one_or_none()
-    if not blog:
-        raise HTTPException(status_code=404, detail="Blog not found")
-    
-    # Load images for the blog within the session
-    images_result = await db.execute(
-        select(models.Image).where(
-            and_(
-                models.Image.owner_id == blog.id,
-                models.Image.owner_type == 'blog'
-            )
-        ).order_by(models.Image.position)
-    )
-    images = images_result.scalars().all()
-    
-    blog_dict = blog_to_dict(blog)
-    blog_dict['images'] = [
-        {
-            "id": img.id,
-            "url": img.url,
-            "is_primary": img.is_primary,
-            "position": img.position,
-            "uploaded_at": img.uploaded_at
-        } for img in images
-    ]
-    
-    # Increment view count
-    blog.view_count += 1
-    await db.commit()
-    blog_dict['view_count'] = blog.view_count
-    
-    return blog_dict
+    return await _blog_detail(db, ("id", blog_id), models.Blog.id == blog_id)
 
 
 @router.get("/blogs/slug/{slug}", response_model=schemas.BlogResponse)
-async def get_blog_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
+async def get_blog_by_slug(slug: str, db: AsyncSession = Depends(get_read_db)):
     """Get blog details by slug"""
-    result = await db.execute(select(models.Blog).where(models.Blog.slug == slug))
-    blog = result.scalar_one_or_none()
-    if not blog:
-        raise HTTPException(status_code=404, detail="Blog not found")
-    
-    # Load images for the blog within the session
-    images_result = await db.execute(
-        select(models.Image).where(
-            and_(
-                models.Image.owner_id == blog.id,
-                models.Image.owner_type == 'blog'
-            )
-        ).order_by(models.Image.position)
-    )
-    images = images_result.scalars().all()
-    
-    blog_dict = blog_to_dict(blog)
-    blog_dict['images'] = [
-        {
-            "id": img.id,
-            "url": img.url,
-            "is_primary": img.is_primary,
-            "position": img.position,
-            "uploaded_at": img.uploaded_at
-        } for img in images
-    ]
-    
-    # Increment view count
-    blog.view_count += 1
-    await db.commit()
-    blog_dict['view_count'] = blog.view_count
-    
-    return blog_dict
+    return await _blog_detail(db, ("slug", slug), models.Blog.slug == slug)
 
 
 @router.post("/blogs", response_model=schemas.BlogResponse)
@@ -2790,6 +2906,7 @@ async def create_blog(
         counter += 1
     
     db_blog = models.Blog(**blog.model_dump(), slug=slug)
+    apply_blog_content(db_blog)
     db.add(db_blog)
     await db.commit()
     
@@ -2839,6 +2956,8 @@ async def update_blog(
     
     for field, value in update_data.items():
         setattr(blog, field, value)
+    if 'content' in update_data:
+        apply_blog_content(blog)
     
     await db.commit()
     await db.refresh(blog)
@@ -2864,7 +2983,7 @@ async def delete_blog(
 
 # Blog filter endpoints
 @router.get("/filters/blog-categories", response_model=List[str])
-async def get_blog_categories(db: AsyncSession = Depends(get_db)):
+async def get_blog_categories(db: AsyncSession = Depends(get_read_db)):
     """Get all unique blog categories for dropdown"""
     result = await db.execute(
         select(models.Blog.category).distinct().where(models.Blog.category.isnot(None))
@@ -2877,7 +2996,7 @@ async def get_blog_categories(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/filters/blog-tags", response_model=List[str])
-async def get_blog_tags(db: AsyncSession = Depends(get_db)):
+async def get_blog_tags(db: AsyncSession = Depends(get_read_db)):
     """Get all unique blog tags for dropdown"""
     result = await db.execute(
         select(models.Blog.tags).distinct().where(models.Blog.tags.isnot(None))
@@ -2918,7 +3037,7 @@ async def create_banner(
 @router.get("/banners", response_model=List[schemas.BannerResponse])
 async def get_banners(
     active_only: bool = Query(True, description="Get only active banners"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all banners for frontend display"""
     query = select(models.Banner).order_by(models.Banner.position, models.Banner.created_at.desc())
@@ -2933,7 +3052,7 @@ async def get_banners(
 
 
 @router.get("/banners/{banner_id}", response_model=schemas.BannerResponse)
-async def get_banner(banner_id: int, db: AsyncSession = Depends(get_db)):
+async def get_banner(banner_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get a specific banner by ID"""
     result = await db.execute(select(models.Banner).where(models.Banner.id == banner_id))
     banner = result.scalar_one_or_none()
@@ -3004,7 +3123,7 @@ async def create_partner(
 @router.get("/partners", response_model=List[schemas.PartnerHospitalResponse])
 async def get_partners(
     active_only: bool = Query(True, description="Get only active partners"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all partner hospitals for frontend display"""
     # PartnerHospital may not have a `position` or `is_active` column in some deployments
@@ -3033,7 +3152,7 @@ async def get_partners(
 
 
 @router.get("/partners/{partner_id}", response_model=schemas.PartnerHospitalResponse)
-async def get_partner(partner_id: int, db: AsyncSession = Depends(get_db)):
+async def get_partner(partner_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get a specific partner hospital by ID"""
     result = await db.execute(select(models.PartnerHospital).where(models.PartnerHospital.id == partner_id))
     partner = result.scalar_one_or_none()
@@ -3043,45 +3162,42 @@ async def get_partner(partner_id: int, db: AsyncSession = Depends(get_db)):
 
 
 # About Us endpoints
-@router.get("/about-us", response_model=List[schemas.AboutUsResponse])
-async def get_about_us_list(db: AsyncSession = Depends(get_db)):
-    """Return all AboutUs entries with featured cards"""
-    result = await db.execute(
-        select(models.AboutUs).order_by(models.AboutUs.position, models.AboutUs.created_at.desc())
-    )
-    items = result.scalars().all()
-    # Eager-load featured cards for each item within the session
-    about_list = []
-    # Prepare lists of ids for batch image queries
-    about_ids = [it.id for it in items]
-    # batch fetch about images
-    about_images_map = {}
+
+# Assembled about-us payloads keyed by "list" / ("id", id), kept until an
+# about-us section, featured card or image is written
+about_us_cache = TTLCache(maxsize=256, ttl=settings.about_us_cache_seconds)
+invalidate_on_write(("about_us", "featured_cards", "images"), about_us_cache.clear)
+
+
+async def _about_us_payloads(db: AsyncSession, items: List[models.AboutUs]) -> List[dict]:
+    """Attach featured cards and images to ``items``: one query for all cards, one for all images"""
+    about_ids = [item.id for item in items]
+    cards_map: Dict[int, list] = {about_id: [] for about_id in about_ids}
+    images_map: Dict[tuple, list] = {}
     if about_ids:
-        imgs_res = await db.execute(
-            select(models.Image).where(models.Image.owner_type == 'about_us', models.Image.owner_id.in_(about_ids)).order_by(models.Image.position.asc().nullslast(), models.Image.id.asc())
+        cards_result = await db.execute(
+            select(models.FeaturedCard)
+            .where(models.FeaturedCard.about_us_id.in_(about_ids))
+            .order_by(models.FeaturedCard.about_us_id, models.FeaturedCard.position)
         )
-        imgs = imgs_res.scalars().all()
-        for img in imgs:
-            about_images_map.setdefault(img.owner_id, []).append(img)
-    for item in items:
-        # load featured cards
-        fc_result = await db.execute(
-            select(models.FeaturedCard).where(models.FeaturedCard.about_us_id == item.id).order_by(models.FeaturedCard.position)
+        cards = cards_result.scalars().all()
+        for card in cards:
+            cards_map[card.about_us_id].append(card)
+
+        # Section images and card images together
+        owners = [and_(models.Image.owner_type == 'about_us', models.Image.owner_id.in_(about_ids))]
+        if cards:
+            owners.append(and_(models.Image.owner_type == 'featured_card',
+                               models.Image.owner_id.in_([card.id for card in cards])))
+        images_result = await db.execute(
+            select(models.Image).where(or_(*owners))
+            .order_by(models.Image.position.asc().nullslast(), models.Image.id.asc())
         )
-        fcs = fc_result.scalars().all()
-        featured_cards_data = [
-            {
-                "id": fc.id,
-                "about_us_id": fc.about_us_id,
-                "heading": fc.heading,
-                "description": fc.description,
-                "position": fc.position,
-                "created_at": fc.created_at,
-            }
-            for fc in fcs
-        ]
+        for img in images_result.scalars().all():
+            images_map.setdefault((img.owner_type, img.owner_id), []).append(image_to_dict(img))
 
-    about_list.append({
+    return [
+        {
             "id": item.id,
             "heading": item.heading,
             "description": item.description,
@@ -3099,113 +3215,53 @@ async def get_about_us_list(db: AsyncSession = Depends(get_db)):
             "is_active": item.is_active,
             "created_at": item.created_at,
             "updated_at": item.updated_at,
-            "featured_cards": featured_cards_data,
-            # include images for about section
-            "images": [
+            "featured_cards": [
                 {
-                    "id": img.id,
-                    "url": img.url,
-                    "is_primary": img.is_primary,
-                    "position": img.position,
-                    "uploaded_at": img.uploaded_at
-                } for img in about_images_map.get(item.id, [])
-            ]
-        })
-
-    return about_list
-
-
-@router.get("/about-us/{about_id}", response_model=schemas.AboutUsResponse)
-async def get_about_us(about_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(models.AboutUs).where(models.AboutUs.id == about_id))
-    item = result.scalar_one_or_none()
-    if not item:
-        raise HTTPException(status_code=404, detail="AboutUs not found")
-    fc_result = await db.execute(
-        select(models.FeaturedCard).where(models.FeaturedCard.about_us_id == item.id).order_by(models.FeaturedCard.position)
-    )
-    fcs = fc_result.scalars().all()
-    featured_cards_data = [
-        {
-            "id": fc.id,
-            "about_us_id": fc.about_us_id,
-            "heading": fc.heading,
-            "description": fc.description,
-            "position": fc.position,
-            "created_at": fc.created_at,
+                    "id": card.id,
+                    "about_us_id": card.about_us_id,
+                    "heading": card.heading,
+                    "description": card.description,
+                    "position": card.position,
+                    "created_at": card.created_at,
+                    "images": images_map.get(('featured_card', card.id), []),
+                }
+                for card in cards_map[item.id]
+            ],
+            "images": images_map.get(('about_us', item.id), []),
         }
-        for fc in fcs
+        for item in items
     ]
-    # load images for the about section
-    images_result = await db.execute(
-        select(models.Image).where(models.Image.owner_type == 'about_us', models.Image.owner_id == item.id).order_by(models.Image.position.asc().nullslast(), models.Image.id.asc())
-    )
-    images = images_result.scalars().all()
 
-    # attach images to featured cards as well
-    # fetch featured card ids
-    card_ids = [fc.id for fc in fcs] if fcs else []
-    featured_images_map = {}
-    if card_ids:
-        feat_imgs_res = await db.execute(
-            select(models.Image).where(models.Image.owner_type == 'featured_card', models.Image.owner_id.in_(card_ids)).order_by(models.Image.position.asc().nullslast(), models.Image.id.asc())
+
+@router.get("/about-us", response_model=List[schemas.AboutUsResponse])
+async def get_about_us_list(db: AsyncSession = Depends(get_read_db)):
+    """Return all AboutUs entries with featured cards"""
+    about_list = about_us_cache.get("list")
+    if about_list is None:
+        result = await db.execute(
+            select(models.AboutUs).order_by(models.AboutUs.position, models.AboutUs.created_at.desc())
         )
-        feat_imgs = feat_imgs_res.scalars().all()
-        for img in feat_imgs:
-            featured_images_map.setdefault(img.owner_id, []).append({
-                "id": img.id,
-                "url": img.url,
-                "is_primary": img.is_primary,
-                "position": img.position,
-                "uploaded_at": img.uploaded_at
-            })
+        about_list = await _about_us_payloads(db, result.scalars().all())
+        about_us_cache.set("list", about_list)
+    return about_list
 
-    return {
-        "id": item.id,
-        "heading": item.heading,
-        "description": item.description,
-        "vision_heading": item.vision_heading,
-        "vision_desc": item.vision_desc,
-        "vision": item.vision,
-        "mission": item.mission,
-        "bottom_heading": item.bottom_heading,
-        "bottom_desc": item.bottom_desc,
-        "bottom_list": item.bottom_list,
-        "feature_title": item.feature_title,
-        "feature_desc": item.feature_desc,
-        "position": item.position,
-        "is_featured": item.is_featured,
-        "is_active": item.is_active,
-        "created_at": item.created_at,
-        "updated_at": item.updated_at,
-        "featured_cards": [
-            {
-                **{
-                    "id": fc["id"],
-                    "about_us_id": fc["about_us_id"],
-                    "heading": fc["heading"],
-                    "description": fc["description"],
-                    "position": fc["position"],
-                    "created_at": fc["created_at"],
-                },
-                "images": featured_images_map.get(fc["id"], [])
-            } for fc in featured_cards_data
-        ],
-        "images": [
-            {
-                "id": img.id,
-                "url": img.url,
-                "is_primary": img.is_primary,
-                "position": img.position,
-                "uploaded_at": img.uploaded_at
-            } for img in images
-        ],
-    }
+
+@router.get("/about-us/{about_id}", response_model=schemas.AboutUsResponse)
+async def get_about_us(about_id: int, db: AsyncSession = Depends(get_read_db)):
+    about = about_us_cache.get(("id", about_id))
+    if about is None:
+        result = await db.execute(select(models.AboutUs).where(models.AboutUs.id == about_id))
+        item = result.scalar_one_or_none()
+        if not item:
+            raise HTTPException(status_code=404, detail="AboutUs not found")
+        about = (await _about_us_payloads(db, [item]))[0]
+        about_us_cache.set(("id", about_id), about)
+    return about
 
 
 # Contact Us Page endpoint
 @router.get("/contact-us", response_model=schemas.ContactUsPageResponse)
-async def get_contact_us_page(db: AsyncSession = Depends(get_db)):
+async def get_contact_us_page(db: AsyncSession = Depends(get_read_db)):
     # Prefer active page, otherwise return the first available
     result = await db.execute(select(models.ContactUsPage).where(models.ContactUsPage.is_active == True).order_by(models.ContactUsPage.created_at.desc()).limit(1))
     page = result.scalar_one_or_none()
@@ -3285,7 +3341,7 @@ async def get_patient_stories(
     featured_only: bool = Query(False, description="Get only featured stories"),
     treatment_type: Optional[str] = Query(None),
     location: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get patient stories for frontend display"""
     query = select(models.PatientStory)
@@ -3312,7 +3368,7 @@ async def get_patient_stories(
 
 
 @router.get("/stories/{story_id}", response_model=schemas.PatientStoryResponse)
-async def get_patient_story(story_id: int, db: AsyncSession = Depends(get_db)):
+async def get_patient_story(story_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get a specific patient story by ID"""
     result = await db.execute(select(models.PatientStory).where(models.PatientStory.id == story_id))
     story = result.scalar_one_or_none()
@@ -3365,7 +3421,7 @@ async def delete_patient_story(
 @router.get("/stories/featured", response_model=List[schemas.PatientStoryResponse])
 async def get_featured_stories(
     limit: int = Query(5, ge=1, le=20, description="Number of featured stories to return"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get featured patient stories for homepage/highlights"""
     query = select(models.PatientStory).where(
@@ -3510,7 +3566,7 @@ async def get_offers(
     current_only: bool = Query(False, description="Get only currently active offers"),
     treatment_type: Optional[str] = Query(None),
     location: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all offers with filtering"""
     from datetime import datetime
@@ -3540,19 +3596,11 @@ async def get_offers(
     result = await db.execute(query)
     offers = result.scalars().all()
     
-    # Load images for each offer within the session
+    # Load images for all offers in one query
+    images_map = await load_images_map(db, 'offer', [offer.id for offer in offers])
+
     offer_results = []
     for offer in offers:
-        images_result = await db.execute(
-            select(models.Image).where(
-                and_(
-                    models.Image.owner_id == offer.id,
-                    models.Image.owner_type == 'offer'
-                )
-            ).order_by(models.Image.position)
-        )
-        images = images_result.scalars().all()
-        
         offer_dict = {
             "id": offer.id,
             "name": offer.name,
@@ -3567,15 +3615,7 @@ async def get_offers(
             "is_active": offer.is_active,
             "created_at": offer.created_at,
             "updated_at": offer.updated_at,
-            "images": [
-                {
-                    "id": img.id,
-                    "url": img.url,
-                    "is_primary": img.is_primary,
-                    "position": img.position,
-                    "uploaded_at": img.uploaded_at
-                } for img in images
-            ]
+            "images": [image_to_dict(img) for img in images_map[offer.id]]
         }
         offer_results.append(offer_dict)
     
@@ -3583,7 +3623,7 @@ async def get_offers(
 
 
 @router.get("/offers/{offer_id}", response_model=schemas.OfferResponse)
-async def get_offer(offer_id: int, db: AsyncSession = Depends(get_db)):
+async def get_offer(offer_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get a specific offer by ID"""
     result = await db.execute(select(models.Offer).where(models.Offer.id == offer_id))
     offer = result.scalar_one_or_none()
@@ -3671,7 +3711,7 @@ async def delete_offer(
 # ================================
 
 @router.get("/filters/treatment-types", response_model=List[str])
-async def get_treatment_types(db: AsyncSession = Depends(get_db)):
+async def get_treatment_types(db: AsyncSession = Depends(get_read_db)):
     """Get all unique treatment types from patient stories"""
     result = await db.execute(
         select(models.PatientStory.treatment_type).distinct().where(
@@ -3689,7 +3729,7 @@ async def get_treatment_types(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/filters/story-hospitals", response_model=List[str])
-async def get_story_hospitals(db: AsyncSession = Depends(get_db)):
+async def get_story_hospitals(db: AsyncSession = Depends(get_read_db)):
     """Get all unique hospital names from patient stories"""
     result = await db.execute(
         select(models.PatientStory.hospital_name).distinct().where(
@@ -3707,7 +3747,7 @@ async def get_story_hospitals(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/filters/offer-locations", response_model=List[str])
-async def get_offer_locations(db: AsyncSession = Depends(get_db)):
+async def get_offer_locations(db: AsyncSession = Depends(get_read_db)):
     """Get all unique locations from offers"""
     result = await db.execute(
         select(models.Offer.location).distinct().where(
@@ -3725,7 +3765,7 @@ async def get_offer_locations(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/filters/offer-treatment-types", response_model=List[str])
-async def get_offer_treatment_types(db: AsyncSession = Depends(get_db)):
+async def get_offer_treatment_types(db: AsyncSession = Depends(get_read_db)):
     """Get all unique treatment types from offers"""
     result = await db.execute(
         select(models.Offer.treatment_type).distinct().where(
@@ -3743,7 +3783,7 @@ async def get_offer_treatment_types(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/filters/treatment-features", response_model=List[str])
-async def get_treatment_features(db: AsyncSession = Depends(get_db)):
+async def get_treatment_features(db: AsyncSession = Depends(get_read_db)):
     """Get all unique features from treatments"""
     result = await db.execute(
         select(models.Treatment.features).distinct().where(models.Treatment.features.isnot(None))
@@ -1,3 +1,4 @@
+import logging
 import secrets
 import smtplib
 from datetime import datetime, timedelta
@@ -27,6 +28,8 @@ SMTP_USERNAME = settings.smtp_username
 SMTP_PASSWORD = settings.smtp_password
 FROM_EMAIL = settings.from_email or settings.smtp_username
 
+logger = logging.getLogger(__name__)
+
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
     salt = bcrypt.gensalt()
@@ -67,12 +70,16 @@ def send_email(to_email: str, subject: str, body: str, is_html: bool = False):
     try:
         # Validate email configuration
         if not SMTP_SERVER or not SMTP_USERNAME or not SMTP_PASSWORD:
-            print(f"❌ Email configuration missing: SMTP_SERVER={SMTP_SERVER}, SMTP_USERNAME={SMTP_USERNAME}, SMTP_PASSWORD={'***' if SMTP_PASSWORD else 'None'}")
+            logger.error(
+                "Email configuration missing",
+                extra={"smtp_server": SMTP_SERVER, "smtp_username": SMTP_USERNAME, "smtp_password_set": bool(SMTP_PASSWORD)},
+            )
             return False
         
-        print(f"📧 Attempting to send email to {to_email}")
-        print(f"📧 Using SMTP: {SMTP_SERVER}:{SMTP_PORT}")
-        print(f"📧 From: {FROM_EMAIL}")
+        logger.debug(
+            "Sending email",
+            extra={"to": to_email, "smtp_server": SMTP_SERVER, "smtp_port": SMTP_PORT, "from_email": FROM_EMAIL},
+        )
         
         msg = MIMEMultipart()
         msg['From'] = f"CureOn Medical Tourism <{FROM_EMAIL}>"
@@ -98,12 +105,10 @@ def send_email(to_email: str, subject: str, body: str, is_html: bool = False):
         server.sendmail(FROM_EMAIL, to_email, text)
         server.quit()
         
-        print(f"✅ Email sent successfully to {to_email}")
+        logger.info("Email sent", extra={"to": to_email})
         return True
     except Exception as e:
-        print(f"❌ Failed to send email to {to_email}: {str(e)}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception("Failed to send email", extra={"to": to_email})
         return False
 
 def send_verification_email(to_email: str, token: str, user_name: str, base_url: str = None):
@@ -7,6 +7,25 @@ from pathlib import Path
 class Settings(BaseSettings):
     # Database
     database_url: str
+    # Connection pool (ignored for SQLite)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a connection is replaced (-1 disables)
+    db_statement_cache_size: int = 100  # asyncpg prepared statement cache (0 for pgbouncer)
+    # Optional read replica for read-only public GET routes
+    read_database_url: Optional[str] = None
+    read_replica_connect_timeout: float = 2.0  # Seconds before falling back to the primary
+    read_replica_retry_seconds: int = 30  # How long to stay on the primary after a failure
+    # Opt-in SQLite tuning for file databases: WAL pragmas, and writes open with
+    # BEGIN IMMEDIATE so concurrent writers wait on busy_timeout instead of failing
+    sqlite_tuned: bool = False
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 268435456  # 256MB
+    sqlite_cache_size: int = -65536  # Negative values are KiB (64MB)
+    sqlite_temp_store: str = "MEMORY"
     
     # Environment
     debug: bool = False
@@ -27,7 +46,51 @@ class Settings(BaseSettings):
     # Security
     secret_key: str
     access_token_expire_minutes: int = 30
-    
+    # Authenticated principal cache (0 seconds disables it)
+    principal_cache_ttl_seconds: int = 30
+    principal_cache_max_entries: int = 2048
+
+    # Admin dashboard statistics snapshot (0 seconds disables it)
+    dashboard_stats_cache_seconds: int = 60
+    # Longest the active-offers snapshot is kept (0 disables it); it is rebuilt
+    # earlier at the next offer start/end and on offer or image writes
+    offers_snapshot_max_seconds: int = 300
+    # Assembled about-us page cache (0 disables it); writes clear it sooner
+    about_us_cache_seconds: int = 300
+    # /api/v1/home: per-section cache lifetime (0 disables it) and cards per section
+    home_cache_seconds: int = 300
+    home_section_limit: int = 12
+    # Doctor booking: slot length, how far ahead free slots are searched, and the
+    # timezone appointment times (stored naive) are expressed in
+    appointment_slot_minutes: int = 30
+    appointment_search_days: int = 14
+    # Unpaid online bookings stop holding their slot after this long (0 keeps them)
+    appointment_hold_minutes: int = 30
+    clinic_timezone: str = "Asia/Kolkata"
+    # Blog detail payload cache (0 disables it) and how often buffered view counts are written
+    blog_cache_seconds: int = 60
+    blog_view_flush_seconds: float = 30.0
+    # Rows fetched per batch when streaming admin CSV exports
+    export_batch_size: int = 1000
+    # Hours a finished background export stays downloadable
+    export_job_ttl_hours: int = 24
+    # How often expired export files are purged in the background (0 disables)
+    export_purge_interval_seconds: int = 3600
+
+    # Logging: LOG_LEVEL defaults to DEBUG in debug mode, INFO otherwise;
+    # LOG_LEVELS overrides single loggers ("app.admin_web=WARNING,sqlalchemy.engine=INFO")
+    log_level: Optional[str] = None
+    log_levels: str = ""
+    log_format: str = "json"  # "json" or "text"
+
+    # Per-route request/SQL metrics served at /metrics (Prometheus text format)
+    metrics_enabled: bool = False
+    metrics_token: Optional[str] = None  # Require "Authorization: Bearer <token>" to scrape
+    # Debug mode logs SQL shapes repeated this many times in one request (0 disables)
+    n_plus_one_threshold: int = 5
+    # Super admins may profile a request with ?__profile=1 or an X-Profile header
+    profiling_enabled: bool = True
+
     # Razorpay Configuration
     razorpay_key_id: Optional[str] = None
     razorpay_key_secret: Optional[str] = None
@@ -1,26 +1,143 @@
-from typing import AsyncGenerator
+import asyncio
+import logging
+import threading
+import time
+from typing import AsyncGenerator, Optional
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
-# Create async engine with appropriate configuration
-if settings.database_url.startswith("sqlite"):
-    # SQLite-specific configuration
-    engine = create_async_engine(
-        settings.database_url,
-        echo=settings.debug,
-        future=True,
-        connect_args={"check_same_thread": False}
-    )
-else:
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait and how often they time out"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+
+    def recreate(self):
+        # Keep counters across engine.dispose()
+        pool = super().recreate()
+        pool.checkouts = self.checkouts
+        pool.wait_seconds_total = self.wait_seconds_total
+        pool.wait_seconds_max = self.wait_seconds_max
+        pool.timeouts = self.timeouts
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+def _server_connect_args(url: str) -> dict:
+    if "+asyncpg" in url:
+        return {
+            # asyncpg's own statement cache and SQLAlchemy's prepared statement cache
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        }
+    return {}
+
+
+def is_file_sqlite(url: str) -> bool:
+    """True for SQLite URLs backed by a file (not an in-memory database)"""
+    return url.startswith("sqlite") and ":memory:" not in url and "mode=memory" not in url and not url.rstrip("/").endswith(":")
+
+
+def sqlite_pragmas() -> list:
+    """PRAGMA statements applied to every new SQLite connection in tuned mode"""
+    return [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+        f"PRAGMA cache_size={settings.sqlite_cache_size}",
+        f"PRAGMA temp_store={settings.sqlite_temp_store}",
+    ]
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in sqlite_pragmas():
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def create_engine_for(url: str, sqlite_role: str = "writer", sqlite_tuned: Optional[bool] = None):
+    """Create an async engine for ``url`` with the configured pool settings.
+
+    For file-backed SQLite in tuned mode every connection gets the WAL and
+    cache pragmas from Settings and both roles keep a normal pool. On the
+    ``writer`` engine the driver opens write transactions with BEGIN
+    IMMEDIATE: a writer takes the lock before its first write and others
+    wait up to busy_timeout for it, instead of failing with "database is
+    locked" when a read transaction tries to upgrade. Plain SELECTs run
+    outside a transaction, so long reads such as streaming exports never
+    hold the lock. The ``reader`` engine serves the read-only routes.
+    """
+    if url.startswith("sqlite"):
+        tuned = settings.sqlite_tuned if sqlite_tuned is None else sqlite_tuned
+        if not (tuned and is_file_sqlite(url)):
+            # SQLite-specific configuration
+            return create_async_engine(
+                url,
+                echo=settings.debug,
+                future=True,
+                connect_args={"check_same_thread": False}
+            )
+        connect_args = {"check_same_thread": False}
+        if sqlite_role == "writer":
+            connect_args["isolation_level"] = "IMMEDIATE"
+        sqlite_engine = create_async_engine(
+            url,
+            echo=settings.debug,
+            future=True,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            connect_args=connect_args,
+        )
+        event.listen(sqlite_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+        return sqlite_engine
     # PostgreSQL/MySQL configuration
-    engine = create_async_engine(
-        settings.database_url,
+    return create_async_engine(
+        url,
         echo=settings.debug,
         future=True,
         pool_pre_ping=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        connect_args=_server_connect_args(url),
     )
 
+
+# Create async engine with appropriate configuration
+engine = create_engine_for(settings.database_url)
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -28,9 +145,50 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Optional read replica for read-only public traffic. Tuned file-backed SQLite
+# gets a reader pool on the same file so reads never wait for the writer.
+if settings.read_database_url:
+    read_engine = create_engine_for(settings.read_database_url, sqlite_role="reader")
+elif settings.sqlite_tuned and is_file_sqlite(settings.database_url):
+    read_engine = create_engine_for(settings.database_url, sqlite_role="reader")
+else:
+    read_engine = None
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+) if read_engine is not None else None
+
+# While the replica is unreachable, reads go to the primary until this time
+_replica_retry_at = 0.0
+
 Base = declarative_base()
 
 
+def pool_metrics(target_engine=None) -> dict:
+    """Snapshot of connection pool usage for ``target_engine`` (default: the app engine)"""
+    pool = (target_engine or engine).sync_engine.pool
+    metrics = {"pool_class": type(pool).__name__}
+    if hasattr(pool, "checkedout"):
+        metrics.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout_seconds": pool.timeout(),
+        })
+    if isinstance(pool, InstrumentedQueuePool):
+        metrics.update({
+            "checkouts": pool.checkouts,
+            "wait_seconds_total": round(pool.wait_seconds_total, 6),
+            "wait_seconds_avg": round(pool.wait_seconds_total / pool.checkouts, 6) if pool.checkouts else 0.0,
+            "wait_seconds_max": round(pool.wait_seconds_max, 6),
+            "timeouts": pool.timeouts,
+        })
+    return metrics
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get database session"""
     async with AsyncSessionLocal() as session:
@@ -40,9 +198,43 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def _open_replica_session() -> Optional[AsyncSession]:
+    """Return a connected replica session, or None if there is no usable replica"""
+    global _replica_retry_at
+    if ReadSessionLocal is None or time.monotonic() < _replica_retry_at:
+        return None
+    session = ReadSessionLocal()
+    try:
+        await asyncio.wait_for(session.connection(), timeout=settings.read_replica_connect_timeout)
+    except (DBAPIError, OSError, asyncio.TimeoutError) as e:
+        await session.close()
+        _replica_retry_at = time.monotonic() + settings.read_replica_retry_seconds
+        logger.warning("Read replica unavailable, using primary for %ss: %s",
+                       settings.read_replica_retry_seconds, e)
+        return None
+    return session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a session for read-only queries.
+
+    Uses the read replica when READ_DATABASE_URL is set and reachable, and
+    the primary otherwise. Never use it for writes or for reads that must
+    see a write made earlier in the same flow.
+    """
+    session = await _open_replica_session()
+    if session is None:
+        session = AsyncSessionLocal()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
 async def init_db():
     """Initialize database tables"""
     async with engine.begin() as conn:
         # Import models to ensure they're registered
         from app import models
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+        await conn.run_sync(Base.metadata.create_all)
@@ -2,17 +2,88 @@
 FastAPI dependencies for admin and user authentication
 """
 
+import hashlib
+import time
+from typing import Optional, Type
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+from jose import JWTError, ExpiredSignatureError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, inspect
+from sqlalchemy.orm import make_transient_to_detached
 from app.db import get_db
 from app import models
 from app.auth_utils import SECRET_KEY, ALGORITHM
+from app.core.config import settings
+from app.utils.cache import TTLCache
 
 security = HTTPBearer()
 
+# Decoded JWT payloads keyed by a token digest, and detached Admin/User
+# snapshots keyed by (table, id). Both are short-lived so that a
+# deactivation on another worker still takes effect within the TTL.
+token_cache = TTLCache(
+    maxsize=settings.principal_cache_max_entries,
+    ttl=settings.principal_cache_ttl_seconds,
+)
+principal_cache = TTLCache(
+    maxsize=settings.principal_cache_max_entries,
+    ttl=settings.principal_cache_ttl_seconds,
+)
+
+
+def decode_token_cached(token: str, secret_key: str = SECRET_KEY, algorithm: str = ALGORITHM) -> dict:
+    """Decode a JWT, reusing the payload of a recently seen identical token.
+
+    Raises JWTError exactly like ``jwt.decode`` (including for cached tokens
+    whose ``exp`` has passed since they were cached). Callers get their own
+    copy of the payload, and the cache only keeps a digest of the token.
+    """
+    cache_key = hashlib.sha256(f"{algorithm}:{secret_key}:{token}".encode("utf-8")).hexdigest()
+    payload = token_cache.get(cache_key)
+    if payload is None:
+        payload = jwt.decode(token, secret_key, algorithms=[algorithm])
+        exp = payload.get("exp")
+        token_cache.set(cache_key, payload, ttl=(exp - time.time()) if exp else None)
+    elif payload.get("exp") and payload["exp"] <= time.time():
+        token_cache.invalidate(cache_key)
+        raise ExpiredSignatureError("Signature has expired.")
+    return dict(payload)
+
+
+def _detached_copy(instance):
+    """Copy the column state of ``instance`` into a new detached object"""
+    mapper = inspect(instance).mapper
+    copy = mapper.class_(**{attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs})
+    make_transient_to_detached(copy)
+    return copy
+
+
+async def load_principal(db: AsyncSession, model: Type, principal_id) -> Optional[object]:
+    """Load an Admin or User by id, served from the principal cache when possible.
+
+    The returned object is always attached to ``db`` so callers can modify
+    and commit it as if it had been SELECTed; the cached snapshot itself is
+    never handed out.
+    """
+    cache_key = (model.__tablename__, str(principal_id))
+    snapshot = principal_cache.get(cache_key)
+    if snapshot is not None:
+        return await db.merge(snapshot, load=False)
+
+    result = await db.execute(select(model).where(model.id == principal_id))
+    principal = result.scalar_one_or_none()
+    if principal is not None:
+        principal_cache.set(cache_key, _detached_copy(principal))
+    return principal
+
+
+def invalidate_principal(model: Type, principal_id) -> None:
+    """Forget a cached Admin/User after its status, password or existence changed"""
+    principal_cache.invalidate((model.__tablename__, str(principal_id)))
+
+
 async def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
@@ -22,21 +93,20 @@ async def get_current_admin(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token_cached(credentials.credentials)
         admin_id: int = payload.get("sub")
         user_type: str = payload.get("type", "admin")
         if admin_id is None or user_type != "admin":
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    
-    result = await db.execute(select(models.Admin).where(models.Admin.id == admin_id))
-    admin = result.scalar_one_or_none()
+
+    admin = await load_principal(db, models.Admin, admin_id)
     if admin is None or not admin.is_active:
         raise credentials_exception
-    
+
     return admin
 
 async def get_current_user(
@@ -48,21 +118,20 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token_cached(credentials.credentials)
         user_id: int = payload.get("sub")
         user_type: str = payload.get("type")
         if user_id is None or user_type != "user":
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    
-    result = await db.execute(select(models.User).where(models.User.id == user_id))
-    user = result.scalar_one_or_none()
+
+    user = await load_principal(db, models.User, user_id)
     if user is None or not user.is_active:
         raise credentials_exception
-    
+
     return user
 
 async def get_current_super_admin(
@@ -74,4 +143,4 @@ async def get_current_super_admin(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Super admin access required"
         )
-    return current_admin
\ No newline at end of file
+    return current_admin
@@ -1,33 +1,50 @@
 from fastapi import FastAPI, Request, Depends
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse
+from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 from contextlib import asynccontextmanager
+import logging
 import os
 
 from app.core.config import settings
-from app.db import get_db
+from app.core.logging_config import setup_logging, shutdown_logging, RequestIdMiddleware
+from app.db import engine, get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app import models
 from app.utils.static_files import CachedStaticFiles, MediaStaticFiles
+from app.utils import metrics
+from app.utils.query_recorder import QueryRecorderMiddleware
+from app.utils.profiling import ProfilingMiddleware
+from app.api.v1.routes import blog_views
+from app.utils.export_jobs import start_export_purger, stop_export_purger
+
+request_logger = logging.getLogger("app.requests")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
+    setup_logging()
     print("🚀 Starting CureOn Medical Tourism API...")
     
     # Create media directory for local uploads
     if settings.debug:
         os.makedirs("media/uploads", exist_ok=True)
         print("📁 Created media upload directory")
+
+    blog_views.start(engine)
+    start_export_purger(engine)
     
     yield
     
     # Shutdown
     print("🔄 Shutting down CureOn Medical Tourism API...")
+    await blog_views.stop()
+    await stop_export_purger()
+    shutdown_logging()
 
 
 # Create FastAPI application
@@ -49,6 +66,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# On-demand profiling for super admins (checked per request, see PROFILING_ENABLED)
+app.add_middleware(ProfilingMiddleware)
+
+# Per-route latency and SQL metrics; not installed at all unless enabled
+if settings.metrics_enabled:
+    app.add_middleware(metrics.MetricsMiddleware)
+
+# Repeated-query (N+1) warnings while developing
+if settings.debug and settings.n_plus_one_threshold > 0:
+    app.add_middleware(QueryRecorderMiddleware)
+
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -83,6 +111,17 @@ async def health_check():
     }
 
 
+# Prometheus scrape endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint(request: Request):
+    """Per-route request metrics in Prometheus text format"""
+    if not settings.metrics_enabled:
+        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+    if settings.metrics_token and request.headers.get("authorization") != f"Bearer {settings.metrics_token}":
+        return JSONResponse(status_code=401, content={"detail": "Invalid metrics token"})
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
+
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -143,12 +182,17 @@ if settings.debug:
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
         """Log requests in debug mode"""
-        print(f"📝 {request.method} {request.url}")
+        request_logger.debug("request %s %s", request.method, request.url)
         response = await call_next(request)
-        print(f"📤 {response.status_code}")
+        request_logger.debug("response %s", response.status_code)
         return response
 
 
+# Request ids for log records and the X-Request-ID response header; added
+# last so it is the outermost middleware and every log line carries the id
+app.add_middleware(RequestIdMiddleware)
+
+
 # Startup message
 if __name__ == "__main__":
     import uvicorn
@@ -1,7 +1,7 @@
 # app/models.py
 from datetime import datetime
 import pytz
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Float, Table, and_
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Float, Table, Index, and_, text
 from sqlalchemy.orm import relationship, declarative_base, foreign
 
 Base = declarative_base()
@@ -170,6 +170,18 @@ class Appointment(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     doctor = relationship("Doctor", back_populates="appointments", lazy="noload")
 
+    __table_args__ = (
+        # Doctor calendars and slot conflict checks
+        Index("ix_appointments_doctor_id_scheduled_at", "doctor_id", "scheduled_at"),
+        # One live appointment per doctor and start time; cancelled rows free the slot.
+        # MySQL has no partial indexes, so there the doctor row lock alone guards bookings.
+        Index(
+            "uq_appointments_doctor_slot", "doctor_id", "scheduled_at", unique=True,
+            postgresql_where=text("status <> 'cancelled'"),
+            sqlite_where=text("status <> 'cancelled'"),
+        ).ddl_if(dialect=("postgresql", "sqlite")),
+    )
+
 class Treatment(Base):
     __tablename__ = "treatments"
     id = Column(Integer, primary_key=True, index=True)
@@ -343,6 +355,11 @@ class Blog(Base):
     slug = Column(String(600), nullable=False, unique=True, index=True)  # URL-friendly version of title
     content = Column(Text, nullable=False)  # Rich HTML content from text editor
     excerpt = Column(Text, nullable=True)  # Short summary/preview
+    # Derived from content when the blog is saved (app/utils/blog_content.py)
+    content_html = Column(Text, nullable=True)  # sanitized content with heading anchors
+    auto_excerpt = Column(Text, nullable=True)  # plain text excerpt used when excerpt is blank
+    word_count = Column(Integer, nullable=True)
+    toc = Column(Text, nullable=True)  # JSON list of {"level", "id", "text"} headings
     featured_image = Column(String(1000), nullable=True)  # Main blog image
     meta_description = Column(String(500), nullable=True)  # SEO meta description
     tags = Column(String(1000), nullable=True)  # comma-separated tags
@@ -465,4 +482,21 @@ class ContactUsPage(Base):
     address = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ExportJob(Base):
+    __tablename__ = "export_jobs"
+    id = Column(Integer, primary_key=True, index=True)
+    resource = Column(String(50), nullable=False)  # Export source, e.g. "bookings"
+    filters = Column(Text, nullable=True)  # JSON object of the list filters used
+    status = Column(String(20), default="pending", index=True)  # pending, running, completed, failed, expired
+    total_rows = Column(Integer, nullable=True)  # Matching rows counted when the job starts
+    processed_rows = Column(Integer, default=0)  # Rows written to the file so far
+    file_path = Column(String(1000), nullable=True)  # Relative path under media/exports
+    file_size = Column(Integer, default=0)  # Bytes written so far
+    error = Column(Text, nullable=True)
+    created_by = Column(Integer, ForeignKey("admins.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True, index=True)  # Finished files are deleted after this
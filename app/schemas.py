@@ -678,6 +678,31 @@ class AppointmentResponse(AppointmentBase, BaseSchema):
     # doctor: Optional["DoctorResponse"] = None  # Removed to avoid greenlet issues
 
 
+class AppointmentBookingCreate(BaseModel):
+    """Public appointment request for a free doctor slot"""
+    patient_name: str = Field(..., min_length=1, max_length=250)
+    patient_contact: str = Field(..., min_length=1, max_length=80)
+    doctor_id: int
+    scheduled_at: datetime
+    hospital_preference: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class AppointmentWithPayment(AppointmentResponse):
+    """Created appointment with the Razorpay order to pay its consultation fee"""
+    razorpay_key_id: str
+    amount_in_paise: Optional[int] = None
+    currency: str = "INR"
+    error: Optional[str] = None
+
+
+class AvailableSlot(BaseModel):
+    doctor_id: int
+    doctor_name: str
+    start: datetime
+    end: datetime
+
+
 # Upload schemas
 class PresignedUploadRequest(BaseModel):
     owner_type: str
@@ -913,10 +938,41 @@ class BlogUpdate(BaseModel):
         return None
 
 
+class BlogTocEntry(BaseModel):
+    level: int
+    id: str  # anchor id of the heading in the blog content
+    text: str
+
+
+class BlogSummaryResponse(BaseSchema):
+    """Blog as listed in /blogs; the body is only returned by the detail endpoints"""
+    id: int
+    title: str
+    subtitle: Optional[str] = None
+    slug: str
+    excerpt: Optional[str] = None
+    featured_image: Optional[str] = None
+    meta_description: Optional[str] = None
+    tags: Optional[str] = None
+    category: Optional[str] = None
+    author_name: Optional[str] = None
+    reading_time: Optional[int] = None
+    word_count: int = 0
+    view_count: int = 0
+    is_published: bool = False
+    is_featured: bool = False
+    published_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+    images: List[ImageResponse] = []
+
+
 class BlogResponse(BlogBase, BaseSchema):
     id: int
     slug: str
     view_count: int = 0
+    word_count: int = 0
+    toc: List[BlogTocEntry] = []
     created_at: datetime
     updated_at: datetime
     images: List[ImageResponse] = []
@@ -1098,6 +1154,7 @@ HospitalResponse.model_rebuild()
 TreatmentResponse.model_rebuild()
 AppointmentResponse.model_rebuild()
 BlogResponse.model_rebuild()
+BlogSummaryResponse.model_rebuild()
 BannerResponse.model_rebuild()
 PartnerHospitalResponse.model_rebuild()
 PatientStoryResponse.model_rebuild()
@@ -1153,4 +1210,90 @@ class ContactUsPageResponse(BaseSchema):
 
 AboutUsResponse.model_rebuild()
 FeaturedCardResponse.model_rebuild()
-ContactUsPageResponse.model_rebuild()
\ No newline at end of file
+ContactUsPageResponse.model_rebuild()
+
+# Homepage aggregate (/api/v1/home): compact cards, one list per section
+class HomeBanner(BaseModel):
+    id: int
+    name: str
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    description: Optional[str] = None
+    image_url: Optional[str] = None
+    link_url: Optional[str] = None
+    button_text: Optional[str] = None
+
+
+class HomeSlider(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    image_url: Optional[str] = None
+    link: Optional[str] = None
+    tags: Optional[str] = None
+
+
+class HomeTreatment(BaseModel):
+    id: int
+    name: str
+    short_description: Optional[str] = None
+    treatment_type: Optional[str] = None
+    location: Optional[str] = None
+    price_min: Optional[float] = None
+    price_max: Optional[float] = None
+    price_exact: Optional[float] = None
+    rating: Optional[float] = None
+    hospital_id: Optional[int] = None
+    is_ayushman: Optional[bool] = None
+    image_url: Optional[str] = None  # primary image
+
+
+class HomeDoctor(BaseModel):
+    id: int
+    name: str
+    profile_photo: Optional[str] = None
+    designation: Optional[str] = None
+    specialization: Optional[str] = None
+    experience_years: Optional[int] = None
+    rating: Optional[float] = None
+    location: Optional[str] = None
+    hospital_id: Optional[int] = None
+    image_url: Optional[str] = None  # primary image
+
+
+class HomeHospital(BaseModel):
+    id: int
+    name: str
+    location: Optional[str] = None
+    rating: Optional[float] = None
+    specializations: Optional[str] = None
+    bed_count: Optional[int] = None
+    image_url: Optional[str] = None  # primary image
+
+
+class HomeStory(BaseModel):
+    id: int
+    patient_name: str
+    description: str
+    rating: int
+    profile_photo: Optional[str] = None
+    treatment_type: Optional[str] = None
+    hospital_name: Optional[str] = None
+    location: Optional[str] = None
+
+
+class HomePartner(BaseModel):
+    id: int
+    name: str
+    logo_url: Optional[str] = None
+    hospital_id: Optional[int] = None
+
+
+class HomeResponse(BaseModel):
+    banners: List[HomeBanner] = []
+    sliders: List[HomeSlider] = []
+    featured_treatments: List[HomeTreatment] = []
+    featured_doctors: List[HomeDoctor] = []
+    featured_hospitals: List[HomeHospital] = []
+    stories: List[HomeStory] = []
+    partners: List[HomePartner] = []
@@ -0,0 +1,211 @@
+"""
+Doctor availability parsed from ``Doctor.time_slots``
+
+``time_slots`` holds the JSON written by the admin doctor form, e.g.
+``{"Monday": "9:00 AM - 5:00 PM", "Sunday": "Off"}``. It is parsed once per
+doctor into ``WeeklyAvailability``: working intervals in minutes since
+midnight for each weekday. Parsed values are cached per doctor id together
+with the raw string they came from, so an edited doctor is re-parsed the
+next time it is seen and untouched doctors are never parsed again.
+
+``next_free_slots`` walks the slot grids of many doctors in chronological
+order with a single heap merge, skipping slots that hold a booked
+appointment, and stops as soon as enough free slots are found. A slot is
+taken when an appointment starts inside ``slot_window``; the booking
+endpoint checks the same window in SQL.
+"""
+import heapq
+import json
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+_TIME = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*([AaPp]\.?[Mm]\.?)?\s*$")
+
+
+def parse_clock(value: str) -> Optional[int]:
+    """Minutes since midnight for "9:30 AM", "09:30" or "9 PM"; None if unparseable"""
+    match = _TIME.match(value or "")
+    if not match:
+        return None
+    hours, minutes, modifier = int(match.group(1)), int(match.group(2) or 0), match.group(3)
+    if modifier:
+        if not 1 <= hours <= 12:
+            return None
+        hours = hours % 12 + (12 if modifier[0] in "Pp" else 0)
+    if hours > 23 or minutes > 59:
+        return None
+    return hours * 60 + minutes
+
+
+def _day_intervals(value) -> Tuple[Tuple[int, int], ...]:
+    """``"9:00 AM - 1:00 PM, 2:00 PM - 6:00 PM"`` -> ((540, 780), (840, 1080))"""
+    if not isinstance(value, str) or value.strip().lower() in ("", "off", "closed"):
+        return ()
+    intervals = []
+    for part in value.split(","):
+        start, _, end = part.partition("-")
+        start, end = parse_clock(start), parse_clock(end)
+        if start is None or end is None:
+            continue
+        if end == 0:
+            end = 24 * 60  # "... - 12:00 AM" ends at midnight
+        if end > start:
+            intervals.append((start, end))
+    return tuple(sorted(intervals))
+
+
+@dataclass(frozen=True)
+class WeeklyAvailability:
+    # The stored JSON object, as returned to API clients
+    days: Dict[str, str] = field(default_factory=dict)
+    # Working intervals (start, end minutes) indexed by date.weekday()
+    intervals: Tuple[Tuple[Tuple[int, int], ...], ...] = ((),) * 7
+
+    @property
+    def is_empty(self) -> bool:
+        return not any(self.intervals)
+
+    def day_range(self, day: str) -> Optional[Tuple[int, int]]:
+        """First start and last end of ``day`` ("Monday"...), None when off"""
+        try:
+            intervals = self.intervals[DAYS.index(day)]
+        except ValueError:
+            return None
+        if not intervals:
+            return None
+        return intervals[0][0], intervals[-1][1]
+
+    def is_slot_start(self, at: datetime, slot_minutes: int) -> bool:
+        """True when ``at`` begins a whole slot of the working hours that day"""
+        if at.second or at.microsecond:
+            return False
+        minute = at.hour * 60 + at.minute
+        return any(
+            start <= minute <= end - slot_minutes and (minute - start) % slot_minutes == 0
+            for start, end in self.intervals[at.weekday()]
+        )
+
+    def slots_from(self, start: datetime, slot_minutes: int, days: int) -> Iterator[datetime]:
+        """Start times of whole slots at or after ``start``, for ``days`` days, in order"""
+        first_day = start.date()
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            midnight = datetime.combine(day, datetime.min.time())
+            for interval_start, interval_end in self.intervals[day.weekday()]:
+                minute = interval_start
+                while minute + slot_minutes <= interval_end:
+                    slot = midnight + timedelta(minutes=minute)
+                    if slot >= start:
+                        yield slot
+                    minute += slot_minutes
+
+
+EMPTY_AVAILABILITY = WeeklyAvailability()
+
+
+def parse_time_slots(raw) -> WeeklyAvailability:
+    """Parse a ``time_slots`` JSON string (or already decoded dict)"""
+    if not raw:
+        return EMPTY_AVAILABILITY
+    try:
+        days = json.loads(raw) if isinstance(raw, str) else raw
+    except ValueError:
+        return EMPTY_AVAILABILITY
+    if not isinstance(days, dict):
+        return EMPTY_AVAILABILITY
+    by_name = {str(name).strip().lower(): value for name, value in days.items()}
+    return WeeklyAvailability(
+        days=days,
+        intervals=tuple(_day_intervals(by_name.get(day.lower())) for day in DAYS),
+    )
+
+
+class AvailabilityCache:
+    """Parsed availability per doctor id, re-parsed when the raw JSON changes"""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, doctor_id: Optional[int], raw) -> WeeklyAvailability:
+        if doctor_id is None:
+            return parse_time_slots(raw)
+        with self._lock:
+            entry = self._data.get(doctor_id)
+            if entry is not None and entry[0] == raw:
+                self._data.move_to_end(doctor_id)
+                return entry[1]
+        availability = parse_time_slots(raw)
+        with self._lock:
+            self._data[doctor_id] = (raw, availability)
+            self._data.move_to_end(doctor_id)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return availability
+
+    def invalidate(self, doctor_id: int) -> None:
+        with self._lock:
+            self._data.pop(doctor_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+doctor_availability = AvailabilityCache()
+
+
+def availability_for(doctor) -> WeeklyAvailability:
+    """Cached availability of a Doctor (or any object with ``id`` and ``time_slots``)"""
+    return doctor_availability.get(doctor.id, doctor.time_slots)
+
+
+def slot_window(slot: datetime, slot_minutes: int) -> Tuple[datetime, datetime]:
+    """``(start, end)``: an appointment starting in ``[start, end)`` takes the slot"""
+    return slot, slot + timedelta(minutes=slot_minutes)
+
+
+def slot_taken(booked: List[datetime], slot: datetime, slot_minutes: int) -> bool:
+    """True when an appointment in the sorted ``booked`` times falls in ``slot_window``"""
+    start, end = slot_window(slot, slot_minutes)
+    index = bisect_left(booked, start)
+    return index < len(booked) and booked[index] < end
+
+
+def next_free_slots(
+    doctors: Iterable[Tuple[int, WeeklyAvailability]],
+    booked: Dict[int, List[datetime]],
+    start: datetime,
+    count: int,
+    slot_minutes: int = 30,
+    days: int = 14,
+) -> List[Tuple[datetime, int]]:
+    """
+    The ``count`` earliest free ``(slot start, doctor id)`` pairs across ``doctors``.
+
+    ``booked`` maps doctor id -> sorted appointment times; see ``slot_taken``.
+    Ties are ordered by doctor id.
+    """
+    def free(doctor_id: int, availability: WeeklyAvailability) -> Iterator[Tuple[datetime, int]]:
+        taken = booked.get(doctor_id, [])
+        for slot in availability.slots_from(start, slot_minutes, days):
+            if not slot_taken(taken, slot, slot_minutes):
+                yield slot, doctor_id
+
+    streams = [free(doctor_id, availability) for doctor_id, availability in doctors if not availability.is_empty]
+    slots = []
+    for slot in heapq.merge(*streams):
+        slots.append(slot)
+        if len(slots) >= count:
+            break
+    return slots
@@ -0,0 +1,241 @@
+"""
+Fields derived from a blog's rich-text HTML
+
+The admin editor (Quill) submits raw HTML. When a blog is saved the HTML is
+parsed once to produce everything the public API needs: sanitized HTML with
+anchor ids on headings, a table of contents, the plain text excerpt and the
+word count. Storing these means list endpoints never have to load ``content``
+and nothing is re-parsed per request.
+
+Sanitizing uses an allowlist of the tags and attributes Quill produces; other
+tags are dropped (their text is kept) and script-like elements are removed
+together with their contents.
+"""
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from html import escape
+from html.parser import HTMLParser
+from typing import List, Optional
+
+# Average adult reading speed used for the reading time estimate
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 200
+# Headings listed in the table of contents
+TOC_LEVELS = {"h1": 1, "h2": 2, "h3": 3}
+
+ALLOWED_TAGS = {
+    "a", "b", "blockquote", "br", "code", "div", "em", "figcaption", "figure",
+    "h1", "h2", "h3", "h4", "h5", "h6", "hr", "i", "iframe", "img", "li", "ol",
+    "p", "pre", "s", "span", "strike", "strong", "sub", "sup", "table", "tbody",
+    "td", "th", "thead", "tr", "u", "ul",
+}
+VOID_TAGS = {"br", "hr", "img"}
+# Removed together with everything inside them
+DROPPED_TAGS = {"script", "style", "noscript", "template", "object", "embed", "head", "title"}
+# Tags that separate words in the plain text
+BLOCK_TAGS = {
+    "blockquote", "br", "div", "figcaption", "figure", "h1", "h2", "h3", "h4",
+    "h5", "h6", "hr", "li", "p", "pre", "td", "th", "tr",
+}
+ALLOWED_ATTRIBUTES = {
+    "*": {"class", "style"},
+    "a": {"href", "title", "target", "rel"},
+    "img": {"src", "alt", "title", "width", "height"},
+    "iframe": {"src", "frameborder", "allowfullscreen"},
+    "td": {"colspan", "rowspan"},
+    "th": {"colspan", "rowspan"},
+}
+# CSS properties Quill writes for colors, alignment and image sizes
+ALLOWED_STYLES = {"color", "background-color", "text-align", "width", "height", "max-width", "cursor"}
+_SAFE_STYLE_VALUE = re.compile(r"^[#\w\s.,%()-]+$")
+_SAFE_URL = re.compile(r"^(https?:|mailto:|tel:|/|#|\.|[^:]*$)", re.IGNORECASE)
+
+
+@dataclass
+class BlogContent:
+    html: str
+    text: str
+    word_count: int
+    toc: List[dict] = field(default_factory=list)
+
+    @property
+    def excerpt(self) -> str:
+        return make_excerpt(self.text)
+
+    @property
+    def reading_time(self) -> int:
+        return reading_time_for(self.word_count)
+
+
+def make_excerpt(text: str, length: int = EXCERPT_LENGTH) -> str:
+    """First ``length`` characters of ``text``, cut at a word boundary"""
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(" ", 1)[0] or text[:length]
+    return cut.rstrip(" ,;:.-") + "…"
+
+
+def reading_time_for(word_count: Optional[int]) -> Optional[int]:
+    """Estimated reading time in minutes, at least one for any text"""
+    if not word_count:
+        return None
+    return max(1, math.ceil(word_count / WORDS_PER_MINUTE))
+
+
+def _slugify(text: str) -> str:
+    slug = re.sub(r"[^a-z0-9\s-]", "", text.lower())
+    return re.sub(r"[\s-]+", "-", slug).strip("-") or "section"
+
+
+def _safe_url(tag: str, value: str) -> bool:
+    value = value.strip()
+    if tag == "img" and value.lower().startswith("data:image/"):
+        return True
+    if tag == "iframe":
+        return value.lower().startswith("https://")
+    return bool(_SAFE_URL.match(value))
+
+
+def _clean_style(value: str) -> str:
+    declarations = []
+    for declaration in value.split(";"):
+        name, _, style_value = declaration.partition(":")
+        name, style_value = name.strip().lower(), style_value.strip()
+        lowered = style_value.lower()
+        if (name in ALLOWED_STYLES and _SAFE_STYLE_VALUE.match(style_value)
+                and "url(" not in lowered and "expression" not in lowered):
+            declarations.append(f"{name}: {style_value}")
+    return "; ".join(declarations)
+
+
+class _BlogHTMLParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out: List[str] = []
+        self.text: List[str] = []
+        self.toc: List[dict] = []
+        self._open: List[str] = []
+        self._skip = 0
+        self._heading: Optional[dict] = None
+        self._ids: set = set()
+
+    def _attributes(self, tag: str, attrs) -> List[tuple]:
+        allowed = ALLOWED_ATTRIBUTES["*"] | ALLOWED_ATTRIBUTES.get(tag, set())
+        cleaned = []
+        for name, value in attrs:
+            name = name.lower()
+            value = value or ""
+            if name not in allowed:
+                continue
+            if name in ("href", "src") and not _safe_url(tag, value):
+                continue
+            if name == "style":
+                value = _clean_style(value)
+                if not value:
+                    continue
+            cleaned.append((name, value))
+        if tag == "a" and ("target", "_blank") in cleaned:
+            cleaned = [(name, value) for name, value in cleaned if name != "rel"]
+            cleaned.append(("rel", "noopener noreferrer"))
+        return cleaned
+
+    @staticmethod
+    def _render(tag: str, attrs: List[tuple]) -> str:
+        rendered = "".join(f' {name}="{escape(value, quote=True)}"' for name, value in attrs)
+        return f"<{tag}{rendered}>"
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROPPED_TAGS:
+            self._skip += 1
+            return
+        if self._skip:
+            return
+        if tag in BLOCK_TAGS:
+            self.text.append(" ")
+        if tag not in ALLOWED_TAGS:
+            return
+        if tag in ("li", "p") and self._open and self._open[-1] == tag:
+            # An unclosed <li>/<p> ends where the next one starts
+            self.handle_endtag(tag)
+        attrs = self._attributes(tag, attrs)
+        if tag in TOC_LEVELS and self._heading is None:
+            self._heading = {"tag": tag, "index": len(self.out), "attrs": attrs, "text": []}
+        self.out.append(self._render(tag, attrs))
+        if tag not in VOID_TAGS:
+            self._open.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in DROPPED_TAGS:
+            self._skip = max(0, self._skip - 1)
+            return
+        if self._skip:
+            return
+        if tag in BLOCK_TAGS:
+            self.text.append(" ")
+        if tag in VOID_TAGS or tag not in self._open:
+            return
+        while self._open:
+            open_tag = self._open.pop()
+            self.out.append(f"</{open_tag}>")
+            if self._heading is not None and open_tag == self._heading["tag"]:
+                self._close_heading()
+            if open_tag == tag:
+                break
+
+    def _close_heading(self) -> None:
+        heading, self._heading = self._heading, None
+        text = " ".join("".join(heading["text"]).split())
+        if not text:
+            return
+        anchor = base = _slugify(text)
+        counter = 2
+        while anchor in self._ids:
+            anchor = f"{base}-{counter}"
+            counter += 1
+        self._ids.add(anchor)
+        self.out[heading["index"]] = self._render(heading["tag"], [("id", anchor)] + heading["attrs"])
+        self.toc.append({"level": TOC_LEVELS[heading["tag"]], "id": anchor, "text": text})
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        self.out.append(escape(data, quote=False))
+        self.text.append(data)
+        if self._heading is not None:
+            self._heading["text"].append(data)
+
+    def close(self):
+        super().close()
+        while self._open:
+            self.handle_endtag(self._open[-1])
+
+
+def parse_blog_content(html: Optional[str]) -> BlogContent:
+    """Sanitize ``html`` and derive its plain text, word count and headings"""
+    parser = _BlogHTMLParser()
+    parser.feed(html or "")
+    parser.close()
+    text = " ".join("".join(parser.text).split())
+    return BlogContent(
+        html="".join(parser.out),
+        text=text,
+        word_count=len(text.split()),
+        toc=parser.toc,
+    )
+
+
+def apply_blog_content(blog) -> BlogContent:
+    """Store the fields derived from ``blog.content`` on the model"""
+    derived = parse_blog_content(blog.content)
+    blog.content_html = derived.html
+    blog.auto_excerpt = derived.excerpt or None
+    blog.word_count = derived.word_count
+    blog.toc = json.dumps(derived.toc)
+    return derived
@@ -0,0 +1,242 @@
+"""
+Bulk CSV import of hospitals, doctors and treatments for the admin panel
+
+The uploaded CSV is read row by row in the threadpool. Each row is validated against the
+matching ``*Create`` schema, hospital names are resolved through a single
+name -> id lookup map, and valid rows are inserted in batches inside one
+transaction. Invalid rows are collected into a per-row error report instead
+of aborting the import.
+"""
+import csv
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models import Doctor, Hospital, Treatment, doctor_hospital_association
+from app.schemas import DoctorCreate, HospitalCreate, TreatmentCreate
+
+# Column holding a hospital name instead of a numeric hospital_id
+HOSPITAL_NAME_COLUMN = "hospital_name"
+# Doctors only: extra hospitals, by name, separated by semicolons
+ASSOCIATED_HOSPITALS_COLUMN = "associated_hospital_names"
+
+
+@dataclass
+class BulkImportTarget:
+    schema: Type[BaseModel]
+    model: Type
+    # Schema fields that are not columns of the model
+    extra_fields: tuple = ()
+
+    @property
+    def columns(self) -> List[str]:
+        names = [name for name in self.schema.model_fields if name not in self.extra_fields]
+        if "hospital_id" in names:
+            names.append(HOSPITAL_NAME_COLUMN)
+        if self.model is Doctor:
+            names.append(ASSOCIATED_HOSPITALS_COLUMN)
+        return names
+
+
+BULK_IMPORT_TARGETS: Dict[str, BulkImportTarget] = {
+    "hospitals": BulkImportTarget(HospitalCreate, Hospital),
+    "doctors": BulkImportTarget(DoctorCreate, Doctor, extra_fields=("associated_hospitals",)),
+    "treatments": BulkImportTarget(TreatmentCreate, Treatment),
+}
+
+
+@dataclass
+class BulkImportReport:
+    resource: str
+    total_rows: int = 0
+    inserted: int = 0
+    errors: List[dict] = field(default_factory=list)
+
+    def add_error(self, row: int, message: str, field_name: Optional[str] = None) -> None:
+        self.errors.append({"row": row, "field": field_name, "message": message})
+
+    def as_dict(self) -> dict:
+        failed_rows = {error["row"] for error in self.errors}
+        return {
+            "resource": self.resource,
+            "total_rows": self.total_rows,
+            "inserted": self.inserted,
+            "failed": len(failed_rows),
+            "errors": self.errors,
+        }
+
+
+async def _hospital_lookup(db: AsyncSession) -> Dict[str, int]:
+    """Map of lower-cased hospital name -> id, loaded with one query"""
+    result = await db.execute(select(Hospital.id, Hospital.name))
+    return {name.strip().lower(): hospital_id for hospital_id, name in result.all() if name}
+
+
+def _clean(row: dict) -> dict:
+    """Strip cells and drop empty ones so schema defaults apply"""
+    cleaned = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        key = key.strip()
+        value = value.strip() if isinstance(value, str) else value
+        if key and value not in (None, ""):
+            cleaned[key] = value
+    return cleaned
+
+
+class _RowError(Exception):
+    def __init__(self, field_name: str, message: str):
+        super().__init__(message)
+        self.field_name = field_name
+        self.message = message
+
+
+def _resolve_hospitals(target: BulkImportTarget, data: dict, hospitals: Dict[str, int],
+                       hospital_ids: set) -> List[int]:
+    """Replace hospital names with ids in ``data``; return associated hospital ids"""
+    name = data.pop(HOSPITAL_NAME_COLUMN, None)
+    if name and "hospital_id" not in data:
+        hospital_id = hospitals.get(name.lower())
+        if hospital_id is not None:
+            data["hospital_id"] = hospital_id
+        elif target.model is Treatment:
+            # Treatments can reference hospitals that are not in the catalog
+            data.setdefault("other_hospital_name", name)
+        else:
+            raise _RowError(HOSPITAL_NAME_COLUMN, f"Unknown hospital '{name}'")
+    elif "hospital_id" in data:
+        try:
+            hospital_id = int(data["hospital_id"])
+        except ValueError:
+            raise _RowError("hospital_id", "hospital_id must be a number")
+        if hospital_id not in hospital_ids:
+            raise _RowError("hospital_id", f"Unknown hospital id {hospital_id}")
+
+    associated = []
+    for associated_name in (data.pop(ASSOCIATED_HOSPITALS_COLUMN, None) or "").split(";"):
+        associated_name = associated_name.strip()
+        if not associated_name:
+            continue
+        hospital_id = hospitals.get(associated_name.lower())
+        if hospital_id is None:
+            raise _RowError(ASSOCIATED_HOSPITALS_COLUMN, f"Unknown hospital '{associated_name}'")
+        if hospital_id not in associated:
+            associated.append(hospital_id)
+    return associated
+
+
+async def _insert_rows(db: AsyncSession, target: BulkImportTarget, rows: List[dict]) -> List[int]:
+    values = [row["values"] for row in rows]
+    result = await db.execute(
+        insert(target.model).returning(target.model.id, sort_by_parameter_order=True),
+        values,
+    )
+    ids = list(result.scalars().all())
+    associations = [
+        {"doctor_id": doctor_id, "hospital_id": hospital_id}
+        for doctor_id, row in zip(ids, rows)
+        for hospital_id in row["associated"]
+    ]
+    if associations:
+        await db.execute(insert(doctor_hospital_association), associations)
+    return ids
+
+
+async def _flush_batch(db: AsyncSession, target: BulkImportTarget, batch: List[dict],
+                       report: BulkImportReport) -> None:
+    if not batch:
+        return
+    try:
+        async with db.begin_nested():
+            await _insert_rows(db, target, batch)
+        report.inserted += len(batch)
+        return
+    except SQLAlchemyError:
+        pass
+    # Something in the batch was rejected by the database: retry row by row so
+    # only the offending rows are reported
+    for row in batch:
+        try:
+            async with db.begin_nested():
+                await _insert_rows(db, target, [row])
+            report.inserted += 1
+        except SQLAlchemyError as e:
+            report.add_error(row["row"], str(getattr(e, "orig", e)))
+
+
+def _parse_batch(reader: csv.DictReader, target: BulkImportTarget, report: BulkImportReport,
+                 hospitals: Dict[str, int], hospital_ids: set, columns: set,
+                 batch_size: int) -> Tuple[List[dict], bool]:
+    """
+    Read and validate up to ``batch_size`` valid records from ``reader``.
+
+    Runs in a worker thread: reading the upload, decoding it and validating
+    rows are blocking. Returns the batch and whether the file is exhausted.
+    """
+    batch: List[dict] = []
+    for raw_row in reader:
+        row_number = reader.line_num
+        data = _clean(raw_row)
+        if not data:
+            continue
+        report.total_rows += 1
+        try:
+            associated = _resolve_hospitals(target, data, hospitals, hospital_ids)
+        except _RowError as e:
+            report.add_error(row_number, e.message, e.field_name)
+            continue
+        try:
+            validated = target.schema(**data)
+        except ValidationError as e:
+            for error in e.errors():
+                field_name = ".".join(str(part) for part in error["loc"]) or None
+                report.add_error(row_number, error["msg"], field_name)
+            continue
+
+        values = {
+            key: value
+            for key, value in validated.model_dump(exclude=set(target.extra_fields)).items()
+            if key in columns
+        }
+        batch.append({"row": row_number, "values": values, "associated": associated})
+        if len(batch) >= batch_size:
+            return batch, False
+    return batch, True
+
+
+async def bulk_import_csv(
+    db: AsyncSession,
+    resource: str,
+    lines: Iterable[str],
+    batch_size: Optional[int] = None,
+) -> BulkImportReport:
+    """
+    Import CSV ``lines`` (header first) as ``resource`` and commit once.
+
+    Row numbers in the report are 1-based file line numbers of the records
+    (the header is row 1). The file is read and validated batch by batch in
+    the threadpool so a large upload does not block the event loop.
+    """
+    target = BULK_IMPORT_TARGETS[resource]
+    batch_size = batch_size or settings.export_batch_size
+    report = BulkImportReport(resource)
+    hospitals = await _hospital_lookup(db)
+    hospital_ids = set(hospitals.values())
+    columns = set(target.model.__table__.columns.keys())
+
+    reader = csv.DictReader(lines)
+    done = False
+    while not done:
+        batch, done = await run_in_threadpool(
+            _parse_batch, reader, target, report, hospitals, hospital_ids, columns, batch_size
+        )
+        await _flush_batch(db, target, batch, report)
+    await db.commit()
+    return report
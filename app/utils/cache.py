@@ -0,0 +1,141 @@
+"""
+Small in-process caches shared by the API and admin routes
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is reached.
+    A ``ttl`` of 0 disables the cache entirely so callers never need to
+    special-case the "caching turned off" configuration.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` if missing/expired"""
+        if not self.enabled:
+            return default
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``; ``ttl`` may shorten the default lifetime"""
+        if not self.enabled:
+            return
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + lifetime)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# (table names, callback) pairs registered through invalidate_on_write()
+_write_listeners: List[Tuple[frozenset, Callable[[], None]]] = []
+_write_hooks_installed = False
+
+
+def _notify_written(tables: Set[str]) -> None:
+    if not tables:
+        return
+    for watched, callback in _write_listeners:
+        if watched & tables:
+            callback()
+
+
+def _flushed_tables(session: Session) -> Set[str]:
+    tables = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        mapper = inspect(obj).mapper
+        tables.update(table.name for table in mapper.tables)
+    return tables
+
+
+# Tables written by a session's current transaction, kept in Session.info until it ends
+_PENDING_KEY = "cache_written_tables"
+
+
+def _record_written(session: Session, tables: Set[str]) -> None:
+    if tables:
+        session.info.setdefault(_PENDING_KEY, set()).update(tables)
+
+
+def _on_after_flush(session, flush_context) -> None:
+    _record_written(session, _flushed_tables(session))
+
+
+def _on_orm_execute(orm_execute_state) -> None:
+    # Core/ORM-enabled insert(), update() and delete() bypass the unit of work
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and getattr(table, "name", None):
+            _record_written(orm_execute_state.session, {table.name})
+
+
+def _on_after_commit(session) -> None:
+    _notify_written(session.info.pop(_PENDING_KEY, set()))
+
+
+def _on_after_rollback(session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def invalidate_on_write(tables: Iterable[str], callback: Callable[[], None]) -> None:
+    """
+    Call ``callback`` once a Session commits a write to any of ``tables``.
+
+    Covers ORM flushes (new, changed and deleted objects) as well as
+    insert()/update()/delete() statements executed through a Session.
+    Written tables are collected per session and the callbacks run after
+    commit, so a concurrent reader cannot refill the cache with data from
+    before the commit; a rollback discards them.
+    """
+    global _write_hooks_installed
+    _write_listeners.append((frozenset(tables), callback))
+    if not _write_hooks_installed:
+        event.listen(Session, "after_flush", _on_after_flush)
+        event.listen(Session, "do_orm_execute", _on_orm_execute)
+        event.listen(Session, "after_commit", _on_after_commit)
+        event.listen(Session, "after_rollback", _on_after_rollback)
+        _write_hooks_installed = True
@@ -1,337 +1,295 @@
 #!/usr/bin/env python3
 """
-JSON export/import utilities for small datasets
+Streaming NDJSON export/import utilities
+
+The export writes one JSON object per line: a header line describing the
+dump, then ``{"table": ..., "row": {...}}`` for every row of every table in
+foreign-key order. Tables are read with ``yield_per`` so memory use does not
+grow with the size of the database. The import streams the file back and
+inserts rows with batched executemany ``insert()`` calls inside a single
+transaction, keeping the original primary keys so relationships survive.
 """
 import asyncio
 import json
 import sys
-from datetime import datetime
-from typing import Dict, Any, List
+import time
+from datetime import date, datetime
+from typing import Dict, Optional
 from pathlib import Path
 
 # Add parent directory to path to import app modules
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.db import AsyncSessionLocal
+from sqlalchemy import Date, DateTime, Table, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.config import settings
+from app.db import engine
 from app import models
 
+FORMAT_NAME = "meditour-ndjson"
+FORMAT_VERSION = 1
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """JSON encoder for datetime objects"""
     def default(self, obj):
-        if isinstance(obj, datetime):
+        if isinstance(obj, (datetime, date)):
             return obj.isoformat()
         return super().default(obj)
 
 
-async def export_to_json(output_file: str = "meditour_data.json") -> None:
-    """Export all data to JSON file"""
-    async with AsyncSessionLocal() as db:
-        data = {}
-        
-        # Export sliders
-        result = await db.execute(select(models.Slider))
-        sliders = result.scalars().all()
-        data['sliders'] = [
-            {
-                'id': s.id,
-                'title': s.title,
-                'description': s.description,
-                'image_url': s.image_url,
-                'link': s.link,
-                'tags': s.tags,
-                'is_active': s.is_active,
-                'created_at': s.created_at
-            } for s in sliders
-        ]
-        
-        # Export hospitals
-        result = await db.execute(select(models.Hospital))
-        hospitals = result.scalars().all()
-        data['hospitals'] = [
-            {
-                'id': h.id,
-                'name': h.name,
-                'description': h.description,
-                'location': h.location,
-                'phone': h.phone,
-                'features': h.features,
-                'facilities': h.facilities,
-                'created_at': h.created_at
-            } for h in hospitals
-        ]
-        
-        # Export doctors
-        result = await db.execute(select(models.Doctor))
-        doctors = result.scalars().all()
-        data['doctors'] = [
-            {
-                'id': d.id,
-                'name': d.name,
-                'profile_photo': d.profile_photo,
-                'description': d.description,
-                'designation': d.designation,
-                'experience_years': d.experience_years,
-                'hospital_id': d.hospital_id,
-                'gender': d.gender,
-                'skills': d.skills,
-                'qualifications': d.qualifications,
-                'highlights': d.highlights,
-                'awards': d.awards,
-                'created_at': d.created_at
-            } for d in doctors
-        ]
-        
-        # Export treatments
-        result = await db.execute(select(models.Treatment))
-        treatments = result.scalars().all()
-        data['treatments'] = [
-            {
-                'id': t.id,
-                'name': t.name,
-                'short_description': t.short_description,
-                'long_description': t.long_description,
-                'treatment_type': t.treatment_type,
-                'price_min': t.price_min,
-                'price_max': t.price_max,
-                'price_exact': t.price_exact,
-                'hospital_id': t.hospital_id,
-                'other_hospital_name': t.other_hospital_name,
-                'doctor_id': t.doctor_id,
-                'other_doctor_name': t.other_doctor_name,
-                'location': t.location,
-                'created_at': t.created_at
-            } for t in treatments
-        ]
-        
-        # Export package bookings
-        result = await db.execute(select(models.PackageBooking))
-        bookings = result.scalars().all()
-        data['package_bookings'] = [
-            {
-                'id': b.id,
-                'name': b.name,
-                'email': b.email,
-                'phone': b.phone,
-                'service_type': b.service_type,
-                'service_ref': b.service_ref,
-                'budget_range': b.budget_range,
-                'medical_history_file': b.medical_history_file,
-                'user_query': b.user_query,
-                'travel_assistant': b.travel_assistant,
-                'stay_assistant': b.stay_assistant,
-                'created_at': b.created_at
-            } for b in bookings
-        ]
-        
-        # Export appointments
-        result = await db.execute(select(models.Appointment))
-        appointments = result.scalars().all()
-        data['appointments'] = [
-            {
-                'id': a.id,
-                'patient_name': a.patient_name,
-                'patient_contact': a.patient_contact,
-                'doctor_id': a.doctor_id,
-                'scheduled_at': a.scheduled_at,
-                'notes': a.notes,
-                'status': a.status,
-                'created_at': a.created_at
-            } for a in appointments
-        ]
-        
-        # Export images
-        result = await db.execute(select(models.Image))
-        images = result.scalars().all()
-        data['images'] = [
-            {
-                'id': i.id,
-                'owner_type': i.owner_type,
-                'owner_id': i.owner_id,
-                'url': i.url,
-                'is_primary': i.is_primary,
-                'position': i.position,
-                'uploaded_at': i.uploaded_at
-            } for i in images
-        ]
-        
-        # Add metadata
-        data['export_metadata'] = {
-            'timestamp': datetime.utcnow(),
-            'total_records': sum(len(data[key]) for key in data if key != 'export_metadata')
+def export_tables() -> list:
+    """Every table of the current models, parents before children"""
+    return list(models.Base.metadata.sorted_tables)
+
+
+class ThroughputReport:
+    """Rows, elapsed time and rows/second per table for an export or import"""
+
+    def __init__(self, action: str):
+        self.action = action
+        self.tables: Dict[str, dict] = {}
+        self.skipped: Dict[str, int] = {}
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.bytes = 0
+
+    def add(self, table: str, rows: int, seconds: float) -> None:
+        entry = self.tables.setdefault(table, {"rows": 0, "seconds": 0.0})
+        entry["rows"] += rows
+        entry["seconds"] += seconds
+
+    def finish(self) -> "ThroughputReport":
+        self.finished = time.perf_counter()
+        return self
+
+    @property
+    def total_rows(self) -> int:
+        return sum(entry["rows"] for entry in self.tables.values())
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    def as_dict(self) -> dict:
+        return {
+            "action": self.action,
+            "total_rows": self.total_rows,
+            "seconds": round(self.elapsed, 3),
+            "rows_per_second": round(self.total_rows / self.elapsed, 1) if self.elapsed else None,
+            "bytes": self.bytes,
+            "tables": {
+                name: {
+                    "rows": entry["rows"],
+                    "seconds": round(entry["seconds"], 3),
+                    "rows_per_second": round(entry["rows"] / entry["seconds"], 1) if entry["seconds"] else None,
+                }
+                for name, entry in self.tables.items()
+            },
+            "skipped": dict(self.skipped),
         }
-        
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, cls=DateTimeEncoder, indent=2, ensure_ascii=False)
-        
-        print(f"✅ Exported {data['export_metadata']['total_records']} records to {output_file}")
-
-
-async def import_from_json(input_file: str) -> None:
-    """Import data from JSON file"""
-    if not Path(input_file).exists():
-        print(f"❌ File {input_file} not found")
+
+    def print(self) -> None:
+        report = self.as_dict()
+        print(f"{'Table':<32} {'Rows':>10} {'Seconds':>9} {'Rows/s':>11}")
+        print("-" * 65)
+        for name, entry in report["tables"].items():
+            rate = entry["rows_per_second"]
+            print(f"{name:<32} {entry['rows']:>10} {entry['seconds']:>9.3f} {rate if rate is not None else '-':>11}")
+        print("-" * 65)
+        rate = report["rows_per_second"]
+        print(f"{'TOTAL':<32} {report['total_rows']:>10} {report['seconds']:>9.3f} {rate if rate is not None else '-':>11}")
+        if report["bytes"]:
+            print(f"📦 {report['bytes'] / (1024 * 1024):.2f} MB {self.action}ed")
+        for name, count in report["skipped"].items():
+            print(f"⚠️  Skipped {count} rows for unknown table {name}")
+
+
+def _decode_row(table: Table, row: dict) -> dict:
+    """Keep the columns the table still has and turn ISO strings back into datetimes"""
+    values = {}
+    for key, value in row.items():
+        column = table.c.get(key)
+        if column is None:
+            continue
+        if isinstance(value, str):
+            if isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+        values[key] = value
+    return values
+
+
+async def export_to_ndjson(
+    output_file: str = "meditour_data.ndjson",
+    batch_size: Optional[int] = None,
+    bind: Optional[AsyncEngine] = None,
+) -> ThroughputReport:
+    """Export every table to ``output_file``, one JSON row per line"""
+    batch_size = batch_size or settings.export_batch_size
+    bind = bind or engine
+    report = ThroughputReport("export")
+    tables = export_tables()
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        header = {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "exported_at": datetime.utcnow(),
+            "tables": [table.name for table in tables],
+        }
+        f.write(json.dumps(header, cls=DateTimeEncoder) + "\n")
+
+        async with bind.connect() as conn:
+            for table in tables:
+                started = time.perf_counter()
+                rows = 0
+                query = select(table)
+                if table.primary_key.columns:
+                    query = query.order_by(*table.primary_key.columns)
+                result = await conn.stream(query.execution_options(yield_per=batch_size))
+                async for partition in result.mappings().partitions():
+                    f.writelines(
+                        json.dumps({"table": table.name, "row": dict(row)}, cls=DateTimeEncoder, ensure_ascii=False) + "\n"
+                        for row in partition
+                    )
+                    rows += len(partition)
+                report.add(table.name, rows, time.perf_counter() - started)
+        report.bytes = f.tell()
+
+    return report.finish()
+
+
+async def _reset_sequences(conn, tables) -> None:
+    """Move PostgreSQL serial sequences past the imported primary keys"""
+    if conn.dialect.name != "postgresql":
         return
-    
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    async with AsyncSessionLocal() as db:
-        imported_counts = {}
-        
-        # Import hospitals first (referenced by doctors and treatments)
-        if 'hospitals' in data:
-            for hospital_data in data['hospitals']:
-                # Remove id to let DB assign new ones
-                hospital_data.pop('id', None)
-                # Convert datetime string back to datetime
-                if 'created_at' in hospital_data and isinstance(hospital_data['created_at'], str):
-                    hospital_data['created_at'] = datetime.fromisoformat(hospital_data['created_at'])
-                
-                hospital = models.Hospital(**hospital_data)
-                db.add(hospital)
-            await db.commit()
-            imported_counts['hospitals'] = len(data['hospitals'])
-        
-        # Import doctors
-        if 'doctors' in data:
-            for doctor_data in data['doctors']:
-                doctor_data.pop('id', None)
-                if 'created_at' in doctor_data and isinstance(doctor_data['created_at'], str):
-                    doctor_data['created_at'] = datetime.fromisoformat(doctor_data['created_at'])
-                
-                doctor = models.Doctor(**doctor_data)
-                db.add(doctor)
-            await db.commit()
-            imported_counts['doctors'] = len(data['doctors'])
-        
-        # Import treatments
-        if 'treatments' in data:
-            for treatment_data in data['treatments']:
-                treatment_data.pop('id', None)
-                if 'created_at' in treatment_data and isinstance(treatment_data['created_at'], str):
-                    treatment_data['created_at'] = datetime.fromisoformat(treatment_data['created_at'])
-                
-                treatment = models.Treatment(**treatment_data)
-                db.add(treatment)
-            await db.commit()
-            imported_counts['treatments'] = len(data['treatments'])
-        
-        # Import sliders
-        if 'sliders' in data:
-            for slider_data in data['sliders']:
-                slider_data.pop('id', None)
-                if 'created_at' in slider_data and isinstance(slider_data['created_at'], str):
-                    slider_data['created_at'] = datetime.fromisoformat(slider_data['created_at'])
-                
-                slider = models.Slider(**slider_data)
-                db.add(slider)
-            await db.commit()
-            imported_counts['sliders'] = len(data['sliders'])
-        
-        # Import appointments
-        if 'appointments' in data:
-            for appointment_data in data['appointments']:
-                appointment_data.pop('id', None)
-                if 'created_at' in appointment_data and isinstance(appointment_data['created_at'], str):
-                    appointment_data['created_at'] = datetime.fromisoformat(appointment_data['created_at'])
-                if 'scheduled_at' in appointment_data and isinstance(appointment_data['scheduled_at'], str):
-                    appointment_data['scheduled_at'] = datetime.fromisoformat(appointment_data['scheduled_at'])
-                
-                appointment = models.Appointment(**appointment_data)
-                db.add(appointment)
-            await db.commit()
-            imported_counts['appointments'] = len(data['appointments'])
-        
-        # Import package bookings
-        if 'package_bookings' in data:
-            for booking_data in data['package_bookings']:
-                booking_data.pop('id', None)
-                if 'created_at' in booking_data and isinstance(booking_data['created_at'], str):
-                    booking_data['created_at'] = datetime.fromisoformat(booking_data['created_at'])
-                
-                booking = models.PackageBooking(**booking_data)
-                db.add(booking)
-            await db.commit()
-            imported_counts['package_bookings'] = len(data['package_bookings'])
-        
-        # Import images
-        if 'images' in data:
-            for image_data in data['images']:
-                image_data.pop('id', None)
-                if 'uploaded_at' in image_data and isinstance(image_data['uploaded_at'], str):
-                    image_data['uploaded_at'] = datetime.fromisoformat(image_data['uploaded_at'])
-                
-                image = models.Image(**image_data)
-                db.add(image)
-            await db.commit()
-            imported_counts['images'] = len(data['images'])
-        
-        total_imported = sum(imported_counts.values())
-        print(f"✅ Imported {total_imported} records:")
-        for table, count in imported_counts.items():
-            print(f"   {table}: {count}")
-
-
-async def clear_all_data() -> None:
+    for table in tables:
+        pk = list(table.primary_key.columns)
+        if len(pk) != 1 or not pk[0].autoincrement:
+            continue
+        max_id = await conn.scalar(select(func.max(pk[0])))
+        if max_id is not None:
+            await conn.execute(
+                text("SELECT setval(pg_get_serial_sequence(:table, :column), :value)"),
+                {"table": table.name, "column": pk[0].name, "value": max_id},
+            )
+
+
+async def import_from_ndjson(
+    input_file: str,
+    batch_size: Optional[int] = None,
+    bind: Optional[AsyncEngine] = None,
+) -> ThroughputReport:
+    """Stream ``input_file`` into the database in batched executemany inserts"""
+    batch_size = batch_size or settings.export_batch_size
+    bind = bind or engine
+    tables = {table.name: table for table in export_tables()}
+    report = ThroughputReport("import")
+    touched = []
+
+    async with bind.begin() as conn:
+        batch = []
+        batch_table: Optional[Table] = None
+        batch_started = time.perf_counter()
+
+        async def flush():
+            nonlocal batch, batch_started
+            if batch:
+                await conn.execute(insert(batch_table), batch)
+                report.add(batch_table.name, len(batch), time.perf_counter() - batch_started)
+            batch = []
+            batch_started = time.perf_counter()
+
+        with open(input_file, "r", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("format") != FORMAT_NAME:
+                raise ValueError(f"{input_file} is not a {FORMAT_NAME} file")
+
+            for line in f:
+                report.bytes += len(line.encode("utf-8"))
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                table = tables.get(record["table"])
+                if table is None:
+                    report.skipped[record["table"]] = report.skipped.get(record["table"], 0) + 1
+                    continue
+                if table is not batch_table or len(batch) >= batch_size:
+                    await flush()
+                    if table is not batch_table:
+                        touched.append(table)
+                    batch_table = table
+                batch.append(_decode_row(table, record["row"]))
+            await flush()
+
+        await _reset_sequences(conn, touched)
+
+    return report.finish()
+
+
+async def clear_all_data(bind: Optional[AsyncEngine] = None) -> None:
     """Clear all data from database (use with caution!)"""
-    async with AsyncSessionLocal() as db:
-        # Delete in order to respect foreign key constraints
-        tables = [
-            models.Image,
-            models.Appointment,
-            models.Treatment,
-            models.Doctor,
-            models.Hospital,
-            models.PackageBooking,
-            models.Slider
-        ]
-        
-        for table in tables:
-            result = await db.execute(select(table))
-            records = result.scalars().all()
-            for record in records:
-                await db.delete(record)
-        
-        await db.commit()
-        print("✅ All data cleared from database")
+    bind = bind or engine
+    async with bind.begin() as conn:
+        # Delete children before parents to respect foreign key constraints
+        for table in reversed(export_tables()):
+            await conn.execute(delete(table))
+    print("✅ All data cleared from database")
+
+
+def _batch_size_arg(args: list) -> Optional[int]:
+    if "--batch-size" in args:
+        index = args.index("--batch-size")
+        value = int(args[index + 1])
+        del args[index:index + 2]
+        return value
+    return None
 
 
 async def main():
     """Main function to handle command line arguments"""
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    batch_size = _batch_size_arg(args)
+
+    if not args:
         print("Usage:")
-        print("  python export_import.py export [filename]")
-        print("  python export_import.py import <filename>")
+        print("  python export_import.py export [filename] [--batch-size N]")
+        print("  python export_import.py import <filename> [--batch-size N]")
         print("  python export_import.py clear")
         return
-    
-    command = sys.argv[1].lower()
-    
+
+    command = args[0].lower()
+
     if command == 'export':
-        filename = sys.argv[2] if len(sys.argv) > 2 else "meditour_data.json"
-        await export_to_json(filename)
-    
+        filename = args[1] if len(args) > 1 else "meditour_data.ndjson"
+        report = await export_to_ndjson(filename, batch_size=batch_size)
+        report.print()
+        print(f"✅ Exported {report.total_rows} records to {filename}")
+
     elif command == 'import':
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print("❌ Please specify input filename")
             return
-        filename = sys.argv[2]
-        await import_from_json(filename)
-    
+        filename = args[1]
+        if not Path(filename).exists():
+            print(f"❌ File {filename} not found")
+            return
+        report = await import_from_ndjson(filename, batch_size=batch_size)
+        report.print()
+        print(f"✅ Imported {report.total_rows} records from {filename}")
+
     elif command == 'clear':
         confirm = input("⚠️  This will delete ALL data. Type 'yes' to confirm: ")
         if confirm.lower() == 'yes':
             await clear_all_data()
         else:
             print("Operation cancelled")
-    
+
     else:
         print(f"❌ Unknown command: {command}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
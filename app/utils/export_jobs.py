@@ -0,0 +1,314 @@
+"""
+Background export jobs for the admin panel
+
+An export job writes a CSV file under ``media/exports`` batch by batch and
+records its progress in the ``export_jobs`` table, so large exports never
+have to fit inside a single HTTP request. Finished files are served with
+HTTP Range support and deleted once they expire.
+"""
+import asyncio
+import csv
+import json
+import logging
+import os
+import re
+import secrets
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+import anyio
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import desc, func, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.sql import Select
+
+from app.core.config import settings
+from app.models import ExportJob
+
+logger = logging.getLogger(__name__)
+
+EXPORT_DIR = os.path.join("media", "exports")
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@dataclass
+class ExportSource:
+    """How to build, and render as CSV, one exportable resource"""
+    build_query: Callable[[dict], Select]
+    header: Sequence[str]
+    to_row: Callable[[object], Iterable]
+
+
+export_sources: Dict[str, ExportSource] = {}
+
+
+def register_export_source(name: str, build_query: Callable[[dict], Select],
+                           header: Sequence[str], to_row: Callable[[object], Iterable]) -> None:
+    """Make ``name`` available as an export job resource"""
+    export_sources[name] = ExportSource(build_query, header, to_row)
+
+
+def job_to_dict(job: ExportJob) -> dict:
+    """Progress payload returned to the admin UI"""
+    percent = None
+    if job.total_rows:
+        percent = round(100.0 * (job.processed_rows or 0) / job.total_rows, 1)
+    elif job.status == "completed":
+        percent = 100.0
+    return {
+        "id": job.id,
+        "resource": job.resource,
+        "status": job.status,
+        "total_rows": job.total_rows,
+        "processed_rows": job.processed_rows or 0,
+        "percent": percent,
+        "file_size": job.file_size or 0,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "expires_at": job.expires_at.isoformat() if job.expires_at else None,
+        "progress_url": f"/admin/export-jobs/{job.id}",
+        "download_url": f"/admin/export-jobs/{job.id}/download" if job.status == "completed" else None,
+    }
+
+
+def export_file_path(job: ExportJob) -> Optional[str]:
+    return os.path.join(EXPORT_DIR, job.file_path) if job.file_path else None
+
+
+async def create_export_job(db: AsyncSession, resource: str, filters: dict,
+                            admin_id: Optional[int] = None) -> ExportJob:
+    """Record a pending job; the caller schedules ``run_export_job`` for it"""
+    if resource not in export_sources:
+        raise ValueError(f"Unknown export resource: {resource}")
+    job = ExportJob(
+        resource=resource,
+        filters=json.dumps({k: v for k, v in filters.items() if v not in (None, "")}),
+        status="pending",
+        created_by=admin_id,
+    )
+    db.add(job)
+    await db.commit()
+    return job
+
+
+def _write_batch(output, writer, rows: list) -> int:
+    """Append CSV rows and return the file size so far (runs in a worker thread)"""
+    writer.writerows(rows)
+    output.flush()
+    return output.tell()
+
+
+async def run_export_job(job_id: int, bind: AsyncEngine, batch_size: Optional[int] = None) -> None:
+    """
+    Write the CSV for ``job_id`` and keep its progress columns up to date.
+
+    Rows are read with keyset pagination on the primary key (newest first)
+    rather than one long-lived cursor, so progress can be committed between
+    batches without holding a read transaction open for the whole export.
+    File writes run in the threadpool to keep the event loop free. Any
+    failure, including while preparing the query, marks the job failed.
+    """
+    batch_size = batch_size or settings.export_batch_size
+    sessions = async_sessionmaker(bind, class_=AsyncSession, expire_on_commit=False)
+
+    async with sessions() as db:
+        job = await db.get(ExportJob, job_id)
+        if job is None or job.status != "pending":
+            return
+
+        path = None
+        try:
+            source = export_sources[job.resource]
+            query = source.build_query(json.loads(job.filters or "{}"))
+            pk = inspect(query.column_descriptions[0]["entity"]).primary_key[0]
+
+            await run_in_threadpool(os.makedirs, EXPORT_DIR, exist_ok=True)
+            job.file_path = f"{job.resource}_{job.id}_{secrets.token_hex(8)}.csv"
+            job.total_rows = await db.scalar(
+                select(func.count()).select_from(query.order_by(None).subquery())
+            )
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+            await db.commit()
+            path = export_file_path(job)
+
+            processed = 0
+            last_key = None
+            output = await run_in_threadpool(open, path, "w", newline="", encoding="utf-8")
+            try:
+                writer = csv.writer(output)
+                await run_in_threadpool(_write_batch, output, writer, [source.header])
+                while True:
+                    batch_query = query.order_by(desc(pk)).limit(batch_size)
+                    if last_key is not None:
+                        batch_query = batch_query.where(pk < last_key)
+                    rows = (await db.execute(batch_query)).scalars().all()
+                    if not rows:
+                        break
+                    lines = [source.to_row(row) for row in rows]
+                    file_size = await run_in_threadpool(_write_batch, output, writer, lines)
+                    processed += len(rows)
+                    last_key = getattr(rows[-1], pk.key)
+                    for row in rows:
+                        db.expunge(row)
+                    await db.execute(
+                        update(ExportJob)
+                        .where(ExportJob.id == job_id)
+                        .values(processed_rows=processed, file_size=file_size)
+                    )
+                    await db.commit()
+            finally:
+                await run_in_threadpool(output.close)
+
+            now = datetime.utcnow()
+            await db.execute(
+                update(ExportJob)
+                .where(ExportJob.id == job_id)
+                .values(
+                    status="completed",
+                    processed_rows=processed,
+                    file_size=os.path.getsize(path),
+                    completed_at=now,
+                    expires_at=now + timedelta(hours=settings.export_job_ttl_hours),
+                )
+            )
+            await db.commit()
+        except Exception as e:
+            logger.exception("Export job failed", extra={"export_job_id": job_id})
+            await db.rollback()
+            if path and os.path.exists(path):
+                os.remove(path)
+            await db.execute(
+                update(ExportJob)
+                .where(ExportJob.id == job_id)
+                .values(status="failed", error=str(e) or type(e).__name__, file_path=None,
+                        completed_at=datetime.utcnow())
+            )
+            await db.commit()
+
+
+async def purge_expired_exports(db: AsyncSession) -> int:
+    """Delete the files of finished jobs past their expiry and mark them expired"""
+    result = await db.execute(
+        select(ExportJob).where(
+            ExportJob.status == "completed",
+            ExportJob.expires_at <= datetime.utcnow(),
+        )
+    )
+    expired = result.scalars().all()
+    for job in expired:
+        path = export_file_path(job)
+        if path and os.path.exists(path):
+            os.remove(path)
+        job.status = "expired"
+        job.file_path = None
+    if expired:
+        await db.commit()
+    return len(expired)
+
+
+_purge_task: Optional[asyncio.Task] = None
+
+
+async def _purge_periodically(bind: AsyncEngine, interval: float) -> None:
+    sessions = async_sessionmaker(bind, class_=AsyncSession, expire_on_commit=False)
+    while True:
+        try:
+            async with sessions() as db:
+                await purge_expired_exports(db)
+        except Exception:
+            logger.exception("Purging expired exports failed")
+        await asyncio.sleep(interval)
+
+
+def start_export_purger(bind: AsyncEngine, interval: Optional[float] = None) -> None:
+    """Purge expired export files every ``interval`` seconds in the background"""
+    global _purge_task
+    interval = settings.export_purge_interval_seconds if interval is None else interval
+    if interval > 0 and _purge_task is None:
+        _purge_task = asyncio.create_task(_purge_periodically(bind, interval))
+
+
+async def stop_export_purger() -> None:
+    """Stop the background purge started by ``start_export_purger``"""
+    global _purge_task
+    if _purge_task is not None:
+        _purge_task.cancel()
+        try:
+            await _purge_task
+        except asyncio.CancelledError:
+            pass
+        _purge_task = None
+
+
+def _parse_range(range_header: Optional[str], size: int):
+    """Return ``(start, end)`` for a single byte range, None for the whole file,
+    or raise ValueError when the range cannot be satisfied"""
+    if not range_header:
+        return None
+    match = _RANGE_RE.match(range_header.strip())
+    if not match:
+        # Multiple or malformed ranges: serve the whole file
+        return None
+    first, last = match.groups()
+    if first == "" and last == "":
+        return None
+    if first == "":
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        start, end = max(size - length, 0), size - 1
+    else:
+        start = int(first)
+        end = int(last) if last else size - 1
+        end = min(end, size - 1)
+    if start >= size or start > end:
+        raise ValueError("range not satisfiable")
+    return start, end
+
+
+async def _read_file(path: str, start: int, length: int):
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = await f.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def ranged_file_response(request: Request, path: str, filename: str,
+                         media_type: str = "text/csv") -> Response:
+    """Serve ``path`` honouring a single ``Range: bytes=`` request header"""
+    size = os.path.getsize(path)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f"attachment; filename={filename}",
+    }
+    try:
+        byte_range = _parse_range(request.headers.get("range"), size)
+    except ValueError:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, 200
+    else:
+        start, end = byte_range
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    length = end - start + 1 if size else 0
+    headers["Content-Length"] = str(length)
+    return StreamingResponse(
+        _read_file(path, start, length),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
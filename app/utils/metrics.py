@@ -0,0 +1,193 @@
+"""
+Per-route request metrics in Prometheus text format
+
+``MetricsMiddleware`` times every HTTP request and labels it with the route
+template (``/api/v1/hospitals/{hospital_id}``) rather than the raw path, so
+the number of series stays bounded. While a request is being handled its
+``RequestStats`` lives in a context variable; engine-wide
+``before/after_cursor_execute`` listeners add each SQL statement and its
+duration to it. Outside an instrumented request the listeners return after a
+single context variable lookup, and with ``metrics_enabled`` off the
+middleware is not installed at all.
+"""
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestStats:
+    """SQL activity of the request currently being handled"""
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+# The start time lives on the statement's execution context rather than on the
+# request, so concurrent sessions of one request (asyncio.gather) each time
+# their own statements
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and current_request_stats.get() is not None:
+        context._metrics_query_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_request_stats.get()
+    started = getattr(context, "_metrics_query_start", None)
+    if stats is not None and started is not None:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started
+        context._metrics_query_start = None
+
+
+class _RouteSeries:
+    __slots__ = ("buckets", "count", "seconds", "statuses", "queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.seconds = 0.0
+        self.statuses: Dict[int, int] = {}
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+class MetricsRegistry:
+    """Aggregated per-(method, route) series since start-up"""
+
+    def __init__(self) -> None:
+        self._series: Dict[Tuple[str, str], _RouteSeries] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        with self._lock:
+            series = self._series.get((method, route))
+            if series is None:
+                series = self._series[(method, route)] = _RouteSeries()
+            index = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+            if index < len(LATENCY_BUCKETS):
+                series.buckets[index] += 1
+            series.count += 1
+            series.seconds += seconds
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+            series.queries += stats.queries
+            series.db_seconds += stats.db_seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> str:
+        """All series in the Prometheus text exposition format"""
+        with self._lock:
+            series = sorted(self._series.items())
+            lines = [
+                "# HELP http_request_duration_seconds Request latency by route template",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for (method, route), data in series:
+                labels = _labels(method=method, route=route)
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, data.buckets):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {data.count}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {data.seconds:.6f}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {data.count}")
+
+            lines += [
+                "# HELP http_requests_total Responses by route template and status code",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route), data in series:
+                for status, count in sorted(data.statuses.items()):
+                    lines.append(f"http_requests_total{{{_labels(method=method, route=route, status=status)}}} {count}")
+
+            lines += [
+                "# HELP db_statements_total SQL statements executed while handling the route",
+                "# TYPE db_statements_total counter",
+            ]
+            for (method, route), data in series:
+                lines.append(f"db_statements_total{{{_labels(method=method, route=route)}}} {data.queries}")
+
+            lines += [
+                "# HELP db_statement_duration_seconds_total Time spent executing SQL for the route",
+                "# TYPE db_statement_duration_seconds_total counter",
+            ]
+            for (method, route), data in series:
+                lines.append(f"db_statement_duration_seconds_total{{{_labels(method=method, route=route)}}} {data.db_seconds:.6f}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels) -> str:
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+
+def route_template(scope: dict) -> str:
+    """Route path template the request was matched to"""
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    # Mounted apps (static/media files) only record their prefix
+    root_path = scope.get("root_path")
+    if root_path:
+        return root_path
+    return UNMATCHED_ROUTE
+
+
+registry = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, status and SQL usage per route"""
+
+    def __init__(self, app, metrics: MetricsRegistry = registry, skip_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.metrics = metrics
+        self.skip_paths = skip_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status_code = 500
+        started = time.perf_counter()
+        finished: Optional[float] = None
+
+        async def send_wrapper(message):
+            nonlocal status_code, finished
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Background tasks run after this point; they are not request latency
+                finished = time.perf_counter()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request_stats.reset(token)
+            self.metrics.observe(
+                scope["method"], route_template(scope), status_code,
+                (finished or time.perf_counter()) - started, stats,
+            )
@@ -0,0 +1,52 @@
+"""
+Batched loading of the images and FAQs attached to catalog rows
+
+Images and FAQs point at their owner through ``owner_type``/``owner_id``
+rather than a foreign key, so they are fetched for a whole page of owners
+in one query and grouped in Python. Shared by the public API and the admin
+pages.
+"""
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models
+
+
+async def load_images_map(db: AsyncSession, owner_type: str, owner_ids: List[int]) -> Dict[int, list]:
+    """Images of many owners in one query, grouped by owner id and ordered by position"""
+    images_map: Dict[int, list] = {owner_id: [] for owner_id in owner_ids}
+    if not owner_ids:
+        return images_map
+    result = await db.execute(
+        select(models.Image).where(
+            and_(
+                models.Image.owner_type == owner_type,
+                models.Image.owner_id.in_(owner_ids)
+            )
+        ).order_by(models.Image.owner_id, models.Image.position, models.Image.id)
+    )
+    for image in result.scalars().all():
+        images_map[image.owner_id].append(image)
+    return images_map
+
+
+async def load_faqs_map(db: AsyncSession, owner_type: str, owner_ids: List[int],
+                        active_only: bool = True, per_owner: Optional[int] = None) -> Dict[int, list]:
+    """FAQs of many owners in one query, grouped by owner id; ``per_owner`` keeps the first N"""
+    faqs_map: Dict[int, list] = {owner_id: [] for owner_id in owner_ids}
+    if not owner_ids:
+        return faqs_map
+    query = select(models.FAQ).where(
+        models.FAQ.owner_type == owner_type,
+        models.FAQ.owner_id.in_(owner_ids)
+    )
+    if active_only:
+        query = query.where(models.FAQ.is_active == True)
+    result = await db.execute(query.order_by(models.FAQ.owner_id, models.FAQ.position, models.FAQ.id))
+    for faq in result.scalars().all():
+        faqs = faqs_map[faq.owner_id]
+        if per_owner is None or len(faqs) < per_owner:
+            faqs.append(faq)
+    return faqs_map
@@ -0,0 +1,270 @@
+"""
+On-demand request profiling for super admins
+
+A request carrying ``?__profile=1`` (or ``__profile=json``) or an
+``X-Profile`` header is profiled when the admin session cookie belongs to an
+active super admin. The normal response body is discarded and replaced by
+the profile: a call tree built from stack samples of the event loop thread,
+plus the split between time spent executing SQL (from the cursor execute
+events) and everything else. Anyone else gets the normal response, so the
+parameter is harmless on public URLs.
+
+Samples taken while the loop is not inside this request (waiting on I/O,
+including aiosqlite's worker thread, or running other tasks) are reported
+as a single "waiting" node.
+"""
+import html
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from http.cookies import SimpleCookie
+from typing import List, Optional
+from urllib.parse import parse_qs
+
+from fastapi.responses import HTMLResponse, JSONResponse
+
+from app.core.config import settings
+from app.utils.metrics import RequestStats, current_request_stats, route_template
+
+PROFILE_PARAM = "__profile"
+PROFILE_HEADER = b"x-profile"
+SAMPLE_INTERVAL = 0.001
+WAITING_NODE = "<waiting: I/O or other tasks>"
+# Call tree nodes below this share of the total time are dropped
+MIN_NODE_FRACTION = 0.005
+
+# The GIL switch interval is process-wide: the first running sampler lowers it
+# and the last one to stop restores the original
+_switch_lock = threading.Lock()
+_active_samplers = 0
+_saved_switch_interval: Optional[float] = None
+
+
+def requested_format(scope) -> Optional[str]:
+    """``"json"``/``"html"`` if the request asks to be profiled, else None"""
+    value = None
+    for name, header_value in scope.get("headers", []):
+        if name == PROFILE_HEADER:
+            value = header_value.decode("latin-1")
+            break
+    if value is None and PROFILE_PARAM.encode() in scope.get("query_string", b""):
+        values = parse_qs(scope["query_string"].decode("latin-1")).get(PROFILE_PARAM)
+        value = values[0] if values else None
+    if not value or value.lower() in ("0", "false", "off"):
+        return None
+    if value.lower() == "json":
+        return "json"
+    if value.lower() == "html":
+        return "html"
+    for name, header_value in scope.get("headers", []):
+        if name == b"accept" and b"application/json" in header_value:
+            return "json"
+    return "html"
+
+
+async def is_super_admin_request(scope) -> bool:
+    """Check the admin session cookie against an active super admin"""
+    from app.admin_web import get_current_admin_from_session
+    from app.db import get_db
+    from app.dependencies import load_principal
+    from app.models import Admin
+
+    cookie_header = b"; ".join(value for name, value in scope.get("headers", []) if name == b"cookie")
+    cookies = SimpleCookie()
+    cookies.load(cookie_header.decode("latin-1"))
+    session_token = cookies["session_token"].value if "session_token" in cookies else None
+    token_data = get_current_admin_from_session(session_token)
+    if not token_data or not token_data["is_super_admin"]:
+        return False
+
+    # Use the same session provider as the routes (honours dependency overrides)
+    app = scope.get("app")
+    provider = getattr(app, "dependency_overrides", {}).get(get_db, get_db)
+    sessions = provider()
+    try:
+        db = await sessions.__anext__()
+        admin = await load_principal(db, Admin, token_data["admin_id"])
+        return bool(admin and admin.is_active and admin.is_super_admin)
+    finally:
+        await sessions.aclose()
+
+
+def _label(code) -> str:
+    filename = code.co_filename
+    if filename.startswith(os.getcwd()):
+        filename = os.path.relpath(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples the Python stack of one thread from a background thread"""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        # Stack (outermost code object first) -> seconds attributed to it
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        global _active_samplers, _saved_switch_interval
+        # The default 5ms GIL switch interval would starve the sampler thread on
+        # short requests, so hand the GIL over as often as we sample
+        with _switch_lock:
+            if _active_samplers == 0:
+                _saved_switch_interval = sys.getswitchinterval()
+                sys.setswitchinterval(min(_saved_switch_interval, self.interval / 2))
+            _active_samplers += 1
+        self._thread.start()
+
+    def stop(self) -> None:
+        global _active_samplers, _saved_switch_interval
+        self._stop.set()
+        self._thread.join()
+        with _switch_lock:
+            _active_samplers -= 1
+            if _active_samplers == 0:
+                sys.setswitchinterval(_saved_switch_interval)
+                _saved_switch_interval = None
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            stack.reverse()
+            # Weight by elapsed time: the sampler may be delayed waiting for the GIL
+            self.samples[tuple(stack)] += now - last
+            last = now
+
+
+def call_tree(samples: Counter, root_code, total_seconds: float) -> List[dict]:
+    """Nested ``{"function", "seconds", "own", "children"}`` nodes below ``root_code``"""
+    root = {"children": {}, "seconds": 0.0, "own": 0.0}
+    waiting = 0.0
+    for stack, seconds in samples.items():
+        try:
+            start = stack.index(root_code) + 1
+        except ValueError:
+            waiting += seconds
+            continue
+        node = root
+        for code in stack[start:]:
+            node = node["children"].setdefault(code, {"children": {}, "seconds": 0.0, "own": 0.0})
+            node["seconds"] += seconds
+        node["own"] += seconds
+
+    threshold = total_seconds * MIN_NODE_FRACTION
+
+    def convert(children: dict) -> List[dict]:
+        nodes = []
+        for code, node in sorted(children.items(), key=lambda item: -item[1]["seconds"]):
+            if node["seconds"] < threshold:
+                continue
+            nodes.append({
+                "function": _label(code),
+                "seconds": round(node["seconds"], 6),
+                "own": round(node["own"], 6),
+                "children": convert(node["children"]),
+            })
+        return nodes
+
+    tree = convert(root["children"])
+    if waiting >= threshold:
+        tree.append({"function": WAITING_NODE, "seconds": round(waiting, 6), "own": round(waiting, 6), "children": []})
+    return sorted(tree, key=lambda node: -node["seconds"])
+
+
+def _render_html(report: dict) -> str:
+    def render_nodes(nodes) -> str:
+        items = []
+        for node in nodes:
+            share = 100.0 * node["seconds"] / report["total_seconds"] if report["total_seconds"] else 0
+            summary = (
+                f"{share:5.1f}% {node['seconds'] * 1000:.2f} ms "
+                f"(own {node['own'] * 1000:.2f} ms) {html.escape(node['function'])}"
+            )
+            if node["children"]:
+                items.append(f"<li><details open><summary>{summary}</summary><ul>{render_nodes(node['children'])}</ul></details></li>")
+            else:
+                items.append(f"<li>{summary}</li>")
+        return "".join(items)
+
+    return (
+        "<!DOCTYPE html><html><head><title>Profile</title>"
+        "<style>body{font-family:monospace;font-size:13px}ul{list-style:none;padding-left:1.2em}</style>"
+        "</head><body>"
+        f"<h2>{html.escape(report['method'])} {html.escape(report['path'])}</h2>"
+        f"<p>Route {html.escape(report['route'])} &mdash; status {report['status']}</p>"
+        f"<p>Total {report['total_seconds'] * 1000:.2f} ms: SQL {report['sql_seconds'] * 1000:.2f} ms "
+        f"in {report['sql_queries']} statements, Python {report['python_seconds'] * 1000:.2f} ms</p>"
+        f"<ul>{render_nodes(report['call_tree'])}</ul></body></html>"
+    )
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware returning a profile instead of the response body"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.profiling_enabled:
+            await self.app(scope, receive, send)
+            return
+        output_format = requested_format(scope)
+        if output_format is None or not await is_super_admin_request(scope):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def capture(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        outer_stats = current_request_stats.get()
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        sampler = StackSampler(threading.get_ident())
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self._profiled(scope, receive, capture)
+        finally:
+            sampler.stop()
+            total_seconds = time.perf_counter() - started
+            current_request_stats.reset(token)
+            if outer_stats is not None:
+                outer_stats.queries += stats.queries
+                outer_stats.db_seconds += stats.db_seconds
+
+        report = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route_template(scope),
+            "status": status_code,
+            "total_seconds": round(total_seconds, 6),
+            "sql_seconds": round(stats.db_seconds, 6),
+            "sql_queries": stats.queries,
+            "python_seconds": round(max(total_seconds - stats.db_seconds, 0.0), 6),
+            "call_tree": call_tree(sampler.samples, self._profiled.__code__, total_seconds),
+        }
+        if output_format == "json":
+            response = JSONResponse(report)
+        else:
+            response = HTMLResponse(_render_html(report))
+        response.headers["Cache-Control"] = "no-store"
+        await response(scope, receive, send)
+
+    async def _profiled(self, scope, receive, send):
+        # Stack samples are rooted at this frame
+        await self.app(scope, receive, send)
@@ -0,0 +1,101 @@
+"""
+Request-scoped SQL recorder and N+1 query detector
+
+A ``QueryRecorder`` collects every statement executed while it is active
+(in the current task/context) and groups them by *shape*: the SQL with
+literals and ``IN (...)`` lists collapsed, so the same query issued once per
+row of a result shows up as one shape with a high count. In debug mode
+``QueryRecorderMiddleware`` records each request and logs the shapes that
+repeat at least ``n_plus_one_threshold`` times together with the route.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.utils.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*(?:\?|%s|:\w+|\$\d+|__\[POSTCOMPILE_\w+\])\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_current_recorder: ContextVar[Optional["QueryRecorder"]] = ContextVar("current_query_recorder", default=None)
+
+
+def sql_shape(statement: str) -> str:
+    """Normalise ``statement`` so queries differing only in values compare equal"""
+    shape = _STRING_RE.sub("?", statement)
+    shape = _NUMBER_RE.sub("?", shape)
+    shape = _IN_LIST_RE.sub("IN (...)", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+class QueryRecorder:
+    """Context manager recording the SQL statements executed inside it"""
+
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+        self.started = 0.0
+        self._token = None
+
+    def __enter__(self) -> "QueryRecorder":
+        self.started = time.perf_counter()
+        self._token = _current_recorder.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _current_recorder.reset(self._token)
+        self._token = None
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Shapes executed at least ``threshold`` times, most frequent first"""
+        counts = Counter(sql_shape(statement) for statement in self.statements)
+        return [(shape, count) for shape, count in counts.most_common() if count >= threshold]
+
+    def report(self, threshold: int = 2) -> str:
+        lines = [f"{self.count} SQL statements executed"]
+        for shape, count in self.repeated(threshold):
+            lines.append(f"  {count}x {shape[:300]}")
+        return "\n".join(lines)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        recorder.statements.append(statement)
+
+
+class QueryRecorderMiddleware:
+    """Debug-only ASGI middleware logging repeated query shapes per request"""
+
+    def __init__(self, app, threshold: Optional[int] = None):
+        self.app = app
+        self.threshold = threshold or settings.n_plus_one_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with QueryRecorder() as recorder:
+            await self.app(scope, receive, send)
+
+        for shape, count in recorder.repeated(self.threshold):
+            logger.warning(
+                "Possible N+1 query on %s %s: %d executions of %s",
+                scope["method"], route_template(scope), count, shape[:300],
+            )
@@ -2,6 +2,7 @@
 Custom static files handler with caching support
 """
 from fastapi.staticfiles import StaticFiles
+from starlette.exceptions import HTTPException
 from starlette.responses import Response
 from starlette.types import Scope, Receive, Send
 import os
@@ -120,8 +121,13 @@ class CachedStaticFiles(StaticFiles):
 class MediaStaticFiles(CachedStaticFiles):
     """
     Specialized static files handler for media uploads with optimized cache settings.
+    
+    Sub-directories listed in ``private_dirs`` (such as admin exports) live
+    under the media root but are never served publicly.
     """
     
+    private_dirs = ("exports",)
+    
     def __init__(
         self,
         *,
@@ -141,3 +147,12 @@ class MediaStaticFiles(CachedStaticFiles):
             check_dir=check_dir,
             cache_max_age=31536000,  # 1 year
         )
+    
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """
+        Refuse to serve anything inside a private sub-directory.
+        """
+        top_level = os.path.normpath(path).replace("\\", "/").lstrip("/").split("/", 1)[0]
+        if top_level in self.private_dirs:
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic catalog generator
+
+Fills an empty database with a realistic-looking catalog (hospitals, doctors
+with weekly ``time_slots``, treatments, association rows, images, FAQs,
+package bookings, appointments, contact messages and the home page content)
+at any scale. Rows are produced lazily per table and written with batched
+executemany Core ``insert()`` calls, so memory stays flat even for millions
+of rows. Image rows point at a small set of placeholder PNGs written under
+``media/synthetic``; nothing is downloaded.
+
+The same ``seed`` and ``reference_date`` always produce the same rows. Every
+table draws from its own random stream, so changing the size of one table
+does not reshuffle the others.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app import models
+from app.core.config import settings
+from app.db import engine
+from app.utils.blog_content import parse_blog_content
+from app.utils.export_import import ThroughputReport, _reset_sequences, clear_all_data
+
+PLACEHOLDER_DIR = os.path.join("media", "synthetic")
+PLACEHOLDER_VARIANTS = 8
+
+CITIES = [
+    ("Mumbai", "Maharashtra"), ("Delhi", "Delhi"), ("Bangalore", "Karnataka"), ("Chennai", "Tamil Nadu"),
+    ("Hyderabad", "Telangana"), ("Kolkata", "West Bengal"), ("Pune", "Maharashtra"), ("Ahmedabad", "Gujarat"),
+    ("Jaipur", "Rajasthan"), ("Indore", "Madhya Pradesh"), ("Kochi", "Kerala"), ("Lucknow", "Uttar Pradesh"),
+]
+HOSPITAL_BRANDS = ["Apollo", "Fortis", "Manipal", "Max", "Medanta", "Narayana", "Aster", "KIMS", "Care", "Lilavati", "Ruby", "Sunrise"]
+HOSPITAL_KINDS = ["Hospital", "Multispeciality Hospital", "Medical Centre", "Institute of Medical Sciences", "Heart Institute"]
+FIRST_NAMES = ["Aarav", "Priya", "Rajesh", "Sunita", "Amit", "Kavya", "Vikram", "Ananya", "Rohan", "Meera",
+               "Arjun", "Neha", "Sanjay", "Pooja", "Karan", "Divya", "Rahul", "Isha", "Nikhil", "Shreya"]
+LAST_NAMES = ["Sharma", "Patel", "Reddy", "Iyer", "Kumar", "Gupta", "Nair", "Singh", "Mehta", "Rao",
+              "Joshi", "Verma", "Das", "Kapoor", "Menon", "Chopra", "Bose", "Pillai", "Agarwal", "Shetty"]
+SPECIALIZATIONS = {
+    "Cardiology": ["Coronary Bypass Surgery", "Angioplasty", "Heart Valve Replacement", "Pacemaker Implantation"],
+    "Orthopedics": ["Total Knee Replacement", "Hip Replacement", "ACL Reconstruction", "Spinal Fusion"],
+    "Oncology": ["Chemotherapy", "Radiation Therapy", "Breast Cancer Surgery", "Bone Marrow Transplant"],
+    "Neurology": ["Stroke Rehabilitation", "Deep Brain Stimulation", "Epilepsy Surgery", "Brain Tumour Surgery"],
+    "Gastroenterology": ["Liver Transplant", "Bariatric Surgery", "Endoscopy", "Gallbladder Removal"],
+    "Ophthalmology": ["Cataract Surgery", "LASIK", "Glaucoma Surgery", "Retina Surgery"],
+    "Urology": ["Kidney Transplant", "Prostate Surgery", "Kidney Stone Removal", "Dialysis"],
+    "Fertility": ["IVF", "IUI", "Egg Freezing", "Laparoscopic Myomectomy"],
+    "Dental": ["Dental Implants", "Root Canal Treatment", "Full Mouth Rehabilitation", "Orthodontics"],
+    "Cosmetic": ["Rhinoplasty", "Hair Transplant", "Liposuction", "Facelift"],
+}
+TREATMENT_TYPES = ["Surgical Treatment", "Clinical Treatment", "Diagnostic", "Day Care", "Rehabilitation"]
+FEATURES = ["24/7 Emergency", "ICU", "Robotic Surgery", "International Patient Desk", "Pharmacy",
+            "Advanced Imaging", "Blood Bank", "Telemedicine", "Airport Pickup", "Interpreter Services"]
+QUALIFICATIONS = ["MBBS, MD", "MBBS, MS", "MBBS, MD, DM", "MBBS, MS, MCh", "BDS, MDS", "MBBS, DNB"]
+BUDGETS = ["Under 50k", "50k-1L", "1L-3L", "3L-5L", "Above 5L"]
+SERVICE_TYPES = ["Treatment Enquiry", "Second Opinion", "Visa Assistance", "Travel Assistance", "General"]
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+WORDS = ("care recovery patient surgery expert team modern safe comfortable advanced procedure outcome "
+         "consultation hospital doctor treatment travel support affordable quality experience").split()
+FAQ_QUESTIONS = [
+    "What is the expected recovery time?", "Is the procedure covered by insurance?",
+    "How long is the hospital stay?", "Do you offer airport pickup?", "Can a family member stay with the patient?",
+    "What documents are required?", "Are follow-up consultations included?",
+]
+
+
+@dataclass
+class SyntheticScale:
+    """Number of rows to generate for each entity"""
+    hospitals: int
+    doctors: int
+    treatments: int
+    package_bookings: int
+    appointments: int
+    contacts: int
+    blogs: int = 50
+    offers: int = 30
+    stories: int = 30
+    banners: int = 5
+    sliders: int = 5
+    partners: int = 5
+
+    @classmethod
+    def for_treatments(cls, treatments: int, **overrides) -> "SyntheticScale":
+        """Proportions resembling production: ~20 treatments per hospital, 4 per doctor"""
+        scale = cls(
+            hospitals=max(5, treatments // 20),
+            doctors=max(10, treatments // 4),
+            treatments=treatments,
+            package_bookings=treatments,
+            appointments=treatments // 2,
+            contacts=max(10, treatments // 10),
+        )
+        for name, value in overrides.items():
+            if value is not None:
+                setattr(scale, name, value)
+        return scale
+
+
+def _rng(seed: int, table: str) -> random.Random:
+    return random.Random(f"{seed}:{table}")
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _person(rng: random.Random) -> tuple:
+    return rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+
+def _phone(rng: random.Random) -> str:
+    return f"+91-{rng.randint(70000, 99999)}{rng.randint(10000, 99999)}"
+
+
+def _clock(minutes: int) -> str:
+    hour, minute = divmod(minutes, 60)
+    suffix = "AM" if hour < 12 else "PM"
+    return f"{(hour - 1) % 12 + 1}:{minute:02d} {suffix}"
+
+
+def weekly_time_slots(rng: random.Random) -> str:
+    """Availability JSON in the admin form format, e.g. ``{"Monday": "9:00 AM - 5:00 PM", "Sunday": "Off"}``"""
+    start = rng.choice([8, 9, 10, 11]) * 60 + rng.choice([0, 30])
+    length = rng.choice([4, 6, 8]) * 60
+    days_off = set(rng.sample(DAYS, rng.randint(1, 2)))
+    slots = {}
+    for day in DAYS:
+        if day in days_off:
+            slots[day] = "Off"
+        elif day == "Saturday":
+            slots[day] = f"{_clock(start)} - {_clock(start + length // 2)}"
+        else:
+            slots[day] = f"{_clock(start)} - {_clock(start + length)}"
+    return json.dumps(slots)
+
+
+def _png(width: int, height: int, rgb: tuple) -> bytes:
+    """A solid-colour PNG, built without any imaging library"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    row = b"\x00" + bytes(rgb) * width
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * height, 9))
+        + chunk(b"IEND", b"")
+    )
+
+
+def write_placeholder_images(directory: str = PLACEHOLDER_DIR, variants: int = PLACEHOLDER_VARIANTS) -> dict:
+    """Write a few placeholder PNGs per owner type; return owner type -> list of URLs
+
+    The URLs assume ``directory`` is served as ``/media/synthetic``.
+    """
+    os.makedirs(directory, exist_ok=True)
+    urls = {}
+    for index, owner_type in enumerate(("hospital", "doctor", "treatment", "blog", "offer", "slider", "banner", "partner", "patient")):
+        urls[owner_type] = []
+        for variant in range(variants):
+            filename = f"{owner_type}-{variant}.png"
+            path = os.path.join(directory, filename)
+            if not os.path.exists(path):
+                hue = (index * 37 + variant * 23) % 256
+                with open(path, "wb") as f:
+                    f.write(_png(64, 48, (hue, 160, 255 - hue)))
+            urls[owner_type].append(f"/media/synthetic/{filename}")
+    return urls
+
+
+class SyntheticCatalog:
+    """Lazy row generators for every table, keyed by table name"""
+
+    def __init__(self, scale: SyntheticScale, seed: int = 1, reference_date: Optional[date] = None,
+                 image_urls: Optional[dict] = None):
+        self.scale = scale
+        self.seed = seed
+        self.now = datetime.combine(reference_date or date.today(), datetime.min.time())
+        self.image_urls = image_urls or {}
+
+    def _created_at(self, rng: random.Random, max_days: int = 730) -> datetime:
+        return self.now - timedelta(days=rng.randint(0, max_days), minutes=rng.randint(0, 1439))
+
+    def _city(self, rng: random.Random) -> str:
+        city, state = rng.choice(CITIES)
+        return f"{city}, {state}"
+
+    def _image(self, rng: random.Random, owner_type: str) -> Optional[str]:
+        urls = self.image_urls.get(owner_type)
+        return rng.choice(urls) if urls else None
+
+    def hospitals(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "hospitals")
+        for i in range(1, self.scale.hospitals + 1):
+            city, state = rng.choice(CITIES)
+            specializations = rng.sample(list(SPECIALIZATIONS), 4)
+            yield {
+                "id": i,
+                "name": f"{rng.choice(HOSPITAL_BRANDS)} {rng.choice(HOSPITAL_KINDS)} {city} {i}",
+                "description": _sentence(rng, 30),
+                "location": f"{city}, {state}",
+                "address": f"{rng.randint(1, 400)} {rng.choice(LAST_NAMES)} Road, {city}",
+                "phone": _phone(rng),
+                "email": f"contact{i}@hospital.example",
+                "established_year": rng.randint(1950, 2020),
+                "bed_count": rng.randrange(50, 1500, 10),
+                "specializations": ",".join(specializations),
+                "rating": round(rng.uniform(3.5, 5.0), 1),
+                "features": ",".join(rng.sample(FEATURES, 4)),
+                "facilities": ",".join(specializations),
+                "is_featured": rng.random() < 0.05,
+                "is_active": rng.random() < 0.97,
+                "created_at": self._created_at(rng),
+            }
+
+    def doctors(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "doctors")
+        for i in range(1, self.scale.doctors + 1):
+            first, last = _person(rng)
+            specialization = rng.choice(list(SPECIALIZATIONS))
+            experience = rng.randint(2, 35)
+            yield {
+                "id": i,
+                "name": f"Dr. {first} {last}",
+                "short_description": f"{specialization} specialist with {experience} years of experience.",
+                "long_description": _sentence(rng, 40),
+                "designation": rng.choice(["Consultant", "Senior Consultant", "Head of Department", "Director"]) + f" - {specialization}",
+                "specialization": specialization,
+                "qualification": rng.choice(QUALIFICATIONS),
+                "experience_years": experience,
+                "rating": round(rng.uniform(3.5, 5.0), 1),
+                "consultancy_fee": float(rng.randrange(500, 5000, 100)),
+                "hospital_id": rng.randint(1, self.scale.hospitals),
+                "location": self._city(rng),
+                "gender": rng.choice(["Male", "Female"]),
+                "skills": ",".join(rng.sample(SPECIALIZATIONS[specialization], 2)),
+                "profile_photo": self._image(rng, "doctor"),
+                "time_slots": weekly_time_slots(rng),
+                "is_featured": rng.random() < 0.02,
+                "is_active": rng.random() < 0.97,
+                "created_at": self._created_at(rng),
+            }
+
+    def doctor_hospitals(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "doctor_hospital_association")
+        for doctor_id in range(1, self.scale.doctors + 1):
+            count = min(self.scale.hospitals, rng.choice([1, 1, 2, 3]))
+            for hospital_id in sorted(rng.sample(range(1, self.scale.hospitals + 1), count)):
+                yield {"doctor_id": doctor_id, "hospital_id": hospital_id}
+
+    def treatments(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "treatments")
+        for i in range(1, self.scale.treatments + 1):
+            specialization = rng.choice(list(SPECIALIZATIONS))
+            price_min = float(rng.randrange(20000, 400000, 5000))
+            yield {
+                "id": i,
+                "name": f"{rng.choice(SPECIALIZATIONS[specialization])} Package {i}",
+                "short_description": _sentence(rng, 10),
+                "long_description": _sentence(rng, 60),
+                "treatment_type": rng.choice(TREATMENT_TYPES),
+                "price_min": price_min,
+                "price_max": price_min * rng.choice([1.5, 2, 3]),
+                "rating": round(rng.uniform(3.5, 5.0), 1),
+                "hospital_id": rng.randint(1, self.scale.hospitals),
+                "doctor_id": rng.randint(1, self.scale.doctors),
+                "location": self._city(rng),
+                "features": ",".join(rng.sample(FEATURES, 3)),
+                "is_ayushman": rng.random() < 0.2,
+                "Includes": "Surgery, Hospital stay, Medicines",
+                "excludes": "Flights, Visa fees",
+                "is_featured": rng.random() < 0.01,
+                "created_at": self._created_at(rng),
+            }
+
+    def treatment_doctors(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "treatment_doctor_association")
+        for treatment_id in range(1, self.scale.treatments + 1):
+            count = min(self.scale.doctors, rng.choice([1, 2, 3]))
+            for doctor_id in sorted(rng.sample(range(1, self.scale.doctors + 1), count)):
+                yield {"treatment_id": treatment_id, "doctor_id": doctor_id}
+
+    def images(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "images")
+        owners = (("hospital", self.scale.hospitals), ("doctor", self.scale.doctors), ("treatment", self.scale.treatments),
+                  ("blog", self.scale.blogs), ("offer", self.scale.offers), ("slider", self.scale.sliders))
+        for owner_type, count in owners:
+            for owner_id in range(1, count + 1):
+                for position in range(rng.randint(1, 3)):
+                    yield {
+                        "owner_type": owner_type,
+                        "owner_id": owner_id,
+                        "url": self._image(rng, owner_type) or f"/media/synthetic/{owner_type}-0.png",
+                        "is_primary": position == 0,
+                        "position": position,
+                        "uploaded_at": self._created_at(rng),
+                    }
+
+    def faqs(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "faqs")
+        owners = (("hospital", self.scale.hospitals), ("doctor", self.scale.doctors), ("treatment", self.scale.treatments))
+        for owner_type, count in owners:
+            for owner_id in range(1, count + 1):
+                for position, question in enumerate(rng.sample(FAQ_QUESTIONS, rng.randint(0, 5))):
+                    yield {
+                        "owner_type": owner_type,
+                        "owner_id": owner_id,
+                        "question": question,
+                        "answer": _sentence(rng, 20),
+                        "position": position,
+                        "is_active": rng.random() < 0.95,
+                        "created_at": self.now,
+                        "updated_at": self.now,
+                    }
+
+    def package_bookings(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "package_bookings")
+        for i in range(1, self.scale.package_bookings + 1):
+            first, last = _person(rng)
+            paid = rng.random() < 0.6
+            created_at = self._created_at(rng, 365)
+            yield {
+                "id": i,
+                "first_name": first,
+                "last_name": last,
+                "email": f"{first.lower()}.{last.lower()}{i}@example.com",
+                "mobile_no": _phone(rng),
+                "treatment_id": rng.randint(1, self.scale.treatments) if self.scale.treatments else None,
+                "budget": rng.choice(BUDGETS),
+                "doctor_preference": f"Dr. {' '.join(_person(rng))}" if rng.random() < 0.3 else None,
+                "hospital_preference": rng.choice(HOSPITAL_BRANDS) if rng.random() < 0.3 else None,
+                "preferred_time_slot": rng.choice(["Morning", "Afternoon", "Evening"]),
+                "is_ayushman_treatment": rng.random() < 0.1,
+                "user_query": _sentence(rng, 15),
+                "travel_assistant": rng.random() < 0.4,
+                "stay_assistant": rng.random() < 0.4,
+                "personal_assistant": rng.random() < 0.2,
+                "amount": float(rng.randrange(1000, 50000, 500)),
+                "payment_status": "paid" if paid else rng.choice(["pending", "failed"]),
+                "payment_date": created_at + timedelta(minutes=5) if paid else None,
+                "created_at": created_at,
+            }
+
+    def appointments(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "appointments")
+        for i in range(1, self.scale.appointments + 1):
+            first, last = _person(rng)
+            # Half in the past, half booked over the next 30 days on 30-minute boundaries
+            scheduled_at = self.now + timedelta(days=rng.randint(-180, 30), minutes=rng.randrange(9 * 60, 18 * 60, 30))
+            yield {
+                "id": i,
+                "patient_name": f"{first} {last}",
+                "patient_contact": _phone(rng),
+                "doctor_id": rng.randint(1, self.scale.doctors),
+                "scheduled_at": scheduled_at,
+                "notes": _sentence(rng, 8),
+                "status": "completed" if scheduled_at < self.now else "scheduled",
+                "consultation_fees": float(rng.randrange(500, 5000, 100)),
+                "payment_status": rng.choice(["pending", "completed", "completed", "failed"]),
+                "created_at": scheduled_at - timedelta(days=rng.randint(1, 14)),
+            }
+
+    def contacts(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "contact_us")
+        for i in range(1, self.scale.contacts + 1):
+            first, last = _person(rng)
+            is_read = rng.random() < 0.7
+            created_at = self._created_at(rng, 365)
+            yield {
+                "id": i,
+                "first_name": first,
+                "last_name": last,
+                "email": f"{first.lower()}.{last.lower()}{i}@example.com",
+                "phone": _phone(rng),
+                "subject": _sentence(rng, 5),
+                "message": _sentence(rng, 30),
+                "service_type": rng.choice(SERVICE_TYPES),
+                "is_read": is_read,
+                "admin_response": _sentence(rng, 12) if is_read and rng.random() < 0.5 else None,
+                "created_at": created_at,
+            }
+
+    def blogs(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "blogs")
+        for i in range(1, self.scale.blogs + 1):
+            specialization = rng.choice(list(SPECIALIZATIONS))
+            published_at = self._created_at(rng, 365)
+            content = "".join(f"<h2>Section {n + 1}</h2><p>{_sentence(rng, 80)}</p>" for n in range(rng.randint(3, 8)))
+            derived = parse_blog_content(content)
+            yield {
+                "id": i,
+                "title": f"A guide to {specialization.lower()} care in India, part {i}",
+                "slug": f"guide-to-{specialization.lower()}-care-{i}",
+                "content": content,
+                "content_html": derived.html,
+                "auto_excerpt": derived.excerpt,
+                "word_count": derived.word_count,
+                "toc": json.dumps(derived.toc),
+                "featured_image": self._image(rng, "blog"),
+                "tags": ",".join(rng.sample(["health", "travel", "recovery", "costs", "visa", "ayurveda"], 3)),
+                "category": specialization,
+                "author_name": " ".join(_person(rng)),
+                "view_count": rng.randint(0, 5000),
+                "is_published": rng.random() < 0.9,
+                "is_featured": i <= 3,
+                "published_at": published_at,
+                "created_at": published_at,
+                "updated_at": published_at,
+            }
+
+    def offers(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "offers")
+        for i in range(1, self.scale.offers + 1):
+            start = self.now + timedelta(days=rng.randint(-60, 10))
+            yield {
+                "id": i,
+                "name": f"{rng.choice(list(SPECIALIZATIONS))} offer {i}",
+                "description": _sentence(rng, 25),
+                "treatment_type": rng.choice(TREATMENT_TYPES),
+                "location": self._city(rng),
+                "start_date": start,
+                "end_date": start + timedelta(days=rng.randint(7, 90)),
+                "discount_percentage": float(rng.choice([5, 10, 15, 20, 25])),
+                "is_free_camp": rng.random() < 0.1,
+                "treatment_id": rng.randint(1, self.scale.treatments) if self.scale.treatments else None,
+                "is_active": rng.random() < 0.9,
+                "created_at": start,
+                "updated_at": start,
+            }
+
+    def stories(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "patient_stories")
+        for i in range(1, self.scale.stories + 1):
+            city, _ = rng.choice(CITIES)
+            yield {
+                "id": i,
+                "patient_name": " ".join(_person(rng)),
+                "description": _sentence(rng, 40),
+                "rating": rng.randint(3, 5),
+                "profile_photo": self._image(rng, "patient"),
+                "treatment_type": rng.choice(list(SPECIALIZATIONS)),
+                "hospital_name": f"{rng.choice(HOSPITAL_BRANDS)} Hospital",
+                "location": city,
+                "date_of_treatment": self._created_at(rng, 365),
+                "position": i,
+                "is_featured": i <= 6,
+                "is_active": True,
+            }
+
+    def banners(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "banners")
+        for i in range(1, self.scale.banners + 1):
+            yield {
+                "id": i, "name": f"Banner {i}", "title": _sentence(rng, 5), "subtitle": _sentence(rng, 10),
+                "image_url": self._image(rng, "banner"), "position": i, "is_active": True,
+            }
+
+    def sliders(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "sliders")
+        for i in range(1, self.scale.sliders + 1):
+            yield {
+                "id": i, "title": _sentence(rng, 5), "description": _sentence(rng, 15),
+                "image_url": self._image(rng, "slider"), "tags": "home", "is_active": True,
+            }
+
+    def partners(self) -> Iterator[dict]:
+        rng = _rng(self.seed, "partner_hospitals")
+        for i in range(1, self.scale.partners + 1):
+            yield {
+                "id": i, "name": f"{rng.choice(HOSPITAL_BRANDS)} Partner {i}", "logo_url": self._image(rng, "partner"),
+                "hospital_id": rng.randint(1, self.scale.hospitals),
+            }
+
+    def tables(self) -> list:
+        """``(table, rows)`` pairs in foreign-key order"""
+        return [
+            (models.Hospital.__table__, self.hospitals()),
+            (models.Doctor.__table__, self.doctors()),
+            (models.doctor_hospital_association, self.doctor_hospitals()),
+            (models.Treatment.__table__, self.treatments()),
+            (models.treatment_doctor_association, self.treatment_doctors()),
+            (models.Image.__table__, self.images()),
+            (models.FAQ.__table__, self.faqs()),
+            (models.PackageBooking.__table__, self.package_bookings()),
+            (models.Appointment.__table__, self.appointments()),
+            (models.ContactUs.__table__, self.contacts()),
+            (models.Blog.__table__, self.blogs()),
+            (models.Offer.__table__, self.offers()),
+            (models.PatientStory.__table__, self.stories()),
+            (models.Banner.__table__, self.banners()),
+            (models.Slider.__table__, self.sliders()),
+            (models.PartnerHospital.__table__, self.partners()),
+        ]
+
+
+def _batches(rows: Iterable[dict], size: int) -> Iterator[list]:
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+async def generate_catalog(
+    scale: SyntheticScale,
+    seed: int = 1,
+    reference_date: Optional[date] = None,
+    batch_size: Optional[int] = None,
+    bind: Optional[AsyncEngine] = None,
+    media_dir: Optional[str] = PLACEHOLDER_DIR,
+) -> ThroughputReport:
+    """
+    Create the schema if needed and insert a synthetic catalog in one transaction.
+
+    The catalog tables must be empty because rows are inserted with fixed ids.
+    Pass ``media_dir=None`` to skip writing placeholder image files.
+    """
+    batch_size = batch_size or settings.export_batch_size
+    bind = bind or engine
+    image_urls = write_placeholder_images(media_dir) if media_dir else {}
+    catalog = SyntheticCatalog(scale, seed=seed, reference_date=reference_date, image_urls=image_urls)
+    report = ThroughputReport("generate")
+
+    async with bind.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+        if await conn.scalar(select(func.count()).select_from(models.Hospital.__table__)):
+            raise ValueError("The database already contains hospitals; clear it before generating a catalog")
+
+        tables = catalog.tables()
+        for table, rows in tables:
+            started = time.perf_counter()
+            count = 0
+            for batch in _batches(rows, batch_size):
+                await conn.execute(insert(table), batch)
+                count += len(batch)
+            report.add(table.name, count, time.perf_counter() - started)
+        await _reset_sequences(conn, [table for table, _ in tables])
+
+    return report.finish()
+
+
+async def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic catalog")
+    parser.add_argument("--treatments", type=int, default=1000, help="catalog size; other tables scale from it")
+    for name in ("hospitals", "doctors", "package-bookings", "appointments", "contacts"):
+        parser.add_argument(f"--{name}", type=int, help=f"override the number of {name.replace('-', ' ')}")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--reference-date", type=date.fromisoformat, help="date the generated timeline is anchored to (default: today)")
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("--clear", action="store_true", help="delete ALL existing data first")
+    args = parser.parse_args()
+
+    scale = SyntheticScale.for_treatments(
+        args.treatments,
+        hospitals=args.hospitals,
+        doctors=args.doctors,
+        package_bookings=args.package_bookings,
+        appointments=args.appointments,
+        contacts=args.contacts,
+    )
+    try:
+        if args.clear:
+            await clear_all_data()
+        print(f"🧪 Generating synthetic catalog (seed {args.seed}): {json.dumps(asdict(scale))}")
+        report = await generate_catalog(scale, seed=args.seed, reference_date=args.reference_date, batch_size=args.batch_size)
+    finally:
+        # aiosqlite worker threads keep the interpreter alive until disposed
+        await engine.dispose()
+    report.print()
+    print(f"✅ Generated {report.total_rows} rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+In-process benchmark of every public GET endpoint
+
+For each dataset size a SQLite database is seeded (``benchmarks/seed.py``,
+backed by the synthetic catalog generator), the ASGI app is imported
+against it and every public ``GET /api/...`` route is driven through httpx's
+ASGI transport (no server, no network). Per endpoint we record p50/p95/mean
+latency, SQL statements per request and the peak memory allocated while
+serving one request. Each size runs in its own subprocess so caches, engines
+and memory never leak from one size into the next.
+
+Usage:
+    python -m benchmarks.api_benchmark --sizes 100,10000,100000 --requests 30
+    python -m benchmarks.api_benchmark --sizes 1000 --endpoint /api/v1/hospitals --output results.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+# Path parameter -> (table, column) used to pick a real value from the seeded data
+PATH_PARAM_SOURCES = {
+    "hospital_id": ("hospitals", "id"),
+    "doctor_id": ("doctors", "id"),
+    "treatment_id": ("treatments", "id"),
+    "blog_id": ("blogs", "id"),
+    "slug": ("blogs", "slug"),
+    "slider_id": ("sliders", "id"),
+    "image_id": ("images", "id"),
+    "banner_id": ("banners", "id"),
+    "partner_id": ("partner_hospitals", "id"),
+    "about_id": ("about_us", "id"),
+    "story_id": ("patient_stories", "id"),
+    "offer_id": ("offers", "id"),
+    "booking_id": ("package_bookings", "id"),
+    "contact_id": ("contact_us", "id"),
+    "owner_id": ("hospitals", "id"),
+}
+FIXED_PATH_PARAMS = {"owner_type": "hospital"}
+# Routes that are public but not meaningful to benchmark
+SKIPPED_PATH_PARTS = ("/debug", "/medical-file")
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def public_get_routes(app):
+    """GET routes under /api that need no authenticated principal"""
+    from fastapi.routing import APIRoute
+    from app.dependencies import get_current_admin, get_current_super_admin, get_current_user
+
+    auth_calls = {get_current_admin, get_current_super_admin, get_current_user}
+
+    def needs_auth(dependant) -> bool:
+        return any(dep.call in auth_calls or needs_auth(dep) for dep in dependant.dependencies)
+
+    seen = set()
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods:
+            continue
+        if not route.path.startswith("/api") or any(part in route.path for part in SKIPPED_PATH_PARTS):
+            continue
+        if route.path in seen or needs_auth(route.dependant):
+            continue
+        seen.add(route.path)
+        yield route
+
+
+async def _path_values(engine) -> dict:
+    from sqlalchemy import text
+
+    values = dict(FIXED_PATH_PARAMS)
+    async with engine.connect() as conn:
+        for param, (table, column) in PATH_PARAM_SOURCES.items():
+            try:
+                value = await conn.scalar(text(f"SELECT {column} FROM {table} ORDER BY id LIMIT 1"))
+            except Exception:
+                value = None
+            if value is not None:
+                values[param] = value
+    return values
+
+
+async def _run_size(size: int, requests: int, only: list, seed: int) -> dict:
+    """Seed a database for ``size`` treatments and benchmark it (runs in a subprocess)"""
+    from app.db import engine, read_engine
+    from app.main import app
+    from benchmarks.seed import seed_catalog
+
+    try:
+        started = time.perf_counter()
+        counts = await seed_catalog(engine, size, seed=seed)
+        seed_seconds = time.perf_counter() - started
+        results = await _benchmark_routes(app, await _path_values(engine), size, requests, only)
+    finally:
+        # aiosqlite worker threads keep the interpreter alive until disposed
+        await engine.dispose()
+        if read_engine is not None:
+            await read_engine.dispose()
+    return {"size": size, "rows": counts, "seed_seconds": round(seed_seconds, 2), "results": results}
+
+
+async def _benchmark_routes(app, path_values: dict, size: int, requests: int, only: list) -> list:
+    from httpx import ASGITransport, AsyncClient
+
+    from app.utils.query_recorder import QueryRecorder
+
+    results = []
+    # Unhandled errors become 500 responses and are reported like any other status
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for route in public_get_routes(app):
+            if only and route.path not in only:
+                continue
+            try:
+                url = route.path.format(**{name: path_values[name] for name in route.param_convertors})
+            except KeyError as e:
+                results.append({"size": size, "endpoint": route.path, "skipped": f"no value for {e.args[0]}"})
+                continue
+
+            response = await client.get(url)  # warm-up: template compilation, caches
+            latencies, queries = [], []
+            for _ in range(requests):
+                with QueryRecorder() as recorder:
+                    request_started = time.perf_counter()
+                    response = await client.get(url)
+                    latencies.append(time.perf_counter() - request_started)
+                queries.append(recorder.count)
+
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+            await client.get(url)
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            results.append({
+                "size": size,
+                "endpoint": route.path,
+                "url": url,
+                "status": response.status_code,
+                "response_bytes": len(response.content),
+                "requests": requests,
+                "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+                "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+                "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+                "queries_per_request": round(statistics.fmean(queries), 2),
+                "peak_memory_kib": round(peak_bytes / 1024, 1),
+            })
+    return results
+
+
+def _run_size_subprocess(size: int, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / f'bench_{size}.db'}"
+        env.setdefault("SECRET_KEY", "benchmark-secret-key")
+        env["DEBUG"] = "false"
+        env["METRICS_ENABLED"] = "false"
+        command = [
+            sys.executable, "-m", "benchmarks.api_benchmark", "--single-size", str(size),
+            "--requests", str(args.requests), "--seed", str(args.seed),
+        ]
+        for endpoint in args.endpoint:
+            command += ["--endpoint", endpoint]
+        completed = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, timeout=args.timeout)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Benchmark for size {size} failed:\n{completed.stderr}")
+        # The app prints start-up banners; the JSON result is the last line
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def _print_table(report: dict) -> None:
+    print(f"{'Size':>8}  {'Endpoint':<52} {'Status':>6} {'p50 ms':>9} {'p95 ms':>9} {'Queries':>8} {'Peak KiB':>10}")
+    print("-" * 108)
+    for run in report["runs"]:
+        for row in run["results"]:
+            if "skipped" in row:
+                print(f"{row['size']:>8}  {row['endpoint']:<52} skipped: {row['skipped']}")
+                continue
+            print(
+                f"{row['size']:>8}  {row['endpoint'][:52]:<52} {row['status']:>6} {row['p50_ms']:>9.2f} "
+                f"{row['p95_ms']:>9.2f} {row['queries_per_request']:>8} {row['peak_memory_kib']:>10}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,10000", help="comma-separated treatment counts")
+    parser.add_argument("--requests", type=int, default=20, help="measured requests per endpoint")
+    parser.add_argument("--endpoint", action="append", default=[], help="only benchmark this route path (repeatable)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=int, default=3600, help="seconds allowed per dataset size")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--single-size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single_size is not None:
+        result = asyncio.run(_run_size(args.single_size, args.requests, args.endpoint, args.seed))
+        print(json.dumps(result))
+        return
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    report = {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests_per_endpoint": args.requests,
+            "sizes": sizes,
+            "seed": args.seed,
+        },
+        "runs": [],
+    }
+    for size in sizes:
+        print(f"⏱️  Benchmarking {size} treatments...", file=sys.stderr)
+        report["runs"].append(_run_size_subprocess(size, args))
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{datetime.utcnow():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    _print_table(report)
+    print(f"\n📄 Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""
+Seed a benchmark database with a catalog of a given size
+
+The rows come from the synthetic catalog generator
+(``app.utils.synthetic_data``), so benchmarks and local development share
+one deterministic data set. No placeholder image files are written.
+"""
+from dataclasses import asdict
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.utils.synthetic_data import SyntheticScale, generate_catalog
+
+
+async def seed_catalog(engine: AsyncEngine, treatments: int, seed: int = 1) -> dict:
+    """Create the schema and insert ``treatments`` treatments plus related rows"""
+    scale = SyntheticScale.for_treatments(treatments)
+    await generate_catalog(scale, seed=seed, bind=engine, media_dir=None)
+    return asdict(scale)
@@ -2,22 +2,288 @@
 """
 Load Testing Script for Medi-Tour API
 Tests various endpoints with different load patterns
+
+Two modes are available:
+
+* ``burst`` (default) fires closed-loop bursts at one endpoint at a time and
+  reports averages per endpoint.
+* ``scenario`` replays a weighted mix of user journeys (browse, search, view
+  detail, book, admin) at an open-loop arrival rate that follows ramp-up
+  stages. Requests are sent on schedule whether or not earlier ones have
+  finished, and latency is measured from the *intended* send time, so a
+  stalled server shows up in the tail instead of silently lowering the load
+  (coordinated omission). Latencies go into HDR-style histograms.
 """
 
 import asyncio
 import aiohttp
+import math
+import random
 import time
 import json
+import os
+import re
 import statistics
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import argparse
 
 
+class LatencyHistogram:
+    """
+    HDR-style log-linear latency histogram
+
+    Values are recorded in microseconds. Below ``2**SUB_BUCKET_BITS`` every
+    value has its own bucket; above that each power of two is split into
+    ``2**SUB_BUCKET_BITS`` linear buckets, so any value is reported within
+    1/128 (< 0.8%) of its true value using a small, bounded number of buckets.
+    Percentiles are exact ranks over the recorded values, not averages of
+    averages, so p99 and p99.9 stay meaningful.
+    """
+
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.total = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+        self.sum_us = 0
+
+    @classmethod
+    def _index(cls, value_us: int) -> int:
+        if value_us < cls.SUB_BUCKETS:
+            return value_us
+        shift = value_us.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return ((shift + 1) << cls.SUB_BUCKET_BITS) + (value_us >> shift) - cls.SUB_BUCKETS
+
+    @classmethod
+    def _highest_equivalent(cls, index: int) -> int:
+        if index < cls.SUB_BUCKETS:
+            return index
+        shift = (index >> cls.SUB_BUCKET_BITS) - 1
+        mantissa = (index & (cls.SUB_BUCKETS - 1)) + cls.SUB_BUCKETS
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value_ms: float, count: int = 1) -> None:
+        value_us = max(0, int(round(value_ms * 1000)))
+        self.counts[self._index(value_us)] += count
+        self.total += count
+        self.sum_us += value_us * count
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.sum_us += other.sum_us
+        for value in (other.min_us, other.max_us):
+            if value is not None:
+                self.min_us = value if self.min_us is None else min(self.min_us, value)
+                self.max_us = value if self.max_us is None else max(self.max_us, value)
+
+    def percentile(self, percentile: float) -> float:
+        """Value in ms below or at which ``percentile`` percent of samples fall"""
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'count': self.total,
+            'min_ms': (self.min_us or 0) / 1000,
+            'mean_ms': round(self.sum_us / self.total / 1000, 3) if self.total else 0.0,
+            'p50_ms': self.percentile(50),
+            'p90_ms': self.percentile(90),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'p99_9_ms': self.percentile(99.9),
+            'max_ms': (self.max_us or 0) / 1000,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary plus the raw buckets, so saved runs can be merged later"""
+        return {**self.summary(), 'buckets': sorted(self.counts.items())}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        for index, count in data.get('buckets', []):
+            histogram.counts[int(index)] += count
+        histogram.total = sum(histogram.counts.values())
+        if histogram.total:
+            histogram.min_us = int(round(data['min_ms'] * 1000))
+            histogram.max_us = int(round(data['max_ms'] * 1000))
+            histogram.sum_us = int(round(data['mean_ms'] * 1000 * histogram.total))
+        return histogram
+
+
+@dataclass
+class Stage:
+    """Arrival rate ramping linearly from ``start_rps`` to ``end_rps`` over ``duration`` seconds"""
+    duration: float
+    start_rps: float
+    end_rps: float
+
+    @classmethod
+    def parse(cls, spec: str) -> "Stage":
+        """``"60:20"`` holds 20 req/s for 60s; ``"30:5-50"`` ramps from 5 to 50 req/s over 30s"""
+        duration, rate = spec.split(':')
+        start, _, end = rate.partition('-')
+        return cls(float(duration), float(start), float(end or start))
+
+    def rate_at(self, elapsed: float) -> float:
+        return self.start_rps + (self.end_rps - self.start_rps) * min(elapsed / self.duration, 1.0)
+
+    @property
+    def label(self) -> str:
+        if self.start_rps == self.end_rps:
+            return f"{self.duration:g}s @ {self.start_rps:g} rps"
+        return f"{self.duration:g}s @ {self.start_rps:g}->{self.end_rps:g} rps"
+
+
+SEARCH_TERMS = ['cardio', 'knee', 'cancer', 'dental', 'ivf', 'apollo', 'mumbai', 'delhi', 'eye', 'spine']
+LOCATIONS = ['Mumbai', 'Delhi', 'Bangalore', 'Chennai', 'Hyderabad', 'Pune']
+
+# Scenario -> request templates; one template is picked at random per arrival.
+# ``{id}`` is replaced by a random id up to --max-id, ``{term}`` and
+# ``{location}`` by a random search term / city.
+SCENARIOS: Dict[str, List[Tuple[str, str, Dict[str, Any]]]] = {
+    'browse': [
+        ('GET', '/api/v1/hospitals', {'params': {'skip': 0, 'limit': 10}}),
+        ('GET', '/api/v1/doctors', {'params': {'skip': 0, 'limit': 10}}),
+        ('GET', '/api/v1/treatments', {'params': {'skip': 0, 'limit': 10}}),
+        ('GET', '/api/v1/blogs', {'params': {'skip': 0, 'limit': 10}}),
+        ('GET', '/api/v1/offers', {}),
+        ('GET', '/api/filters/locations', {}),
+    ],
+    'search': [
+        ('GET', '/api/v1/search', {'params': {'query': '{term}', 'limit': 10}}),
+        ('GET', '/api/v1/treatments', {'params': {'location': '{location}', 'limit': 10}}),
+        ('GET', '/api/v1/doctors', {'params': {'location': '{location}', 'limit': 10}}),
+    ],
+    'detail': [
+        ('GET', '/api/v1/hospitals/{id}', {}),
+        ('GET', '/api/v1/doctors/{id}', {}),
+        ('GET', '/api/v1/treatments/{id}', {}),
+    ],
+    'book': [
+        ('POST', '/api/v1/bookings/json', {'json': {
+            'first_name': 'Load', 'last_name': 'Test', 'email': 'load-test@example.com',
+            'mobile_no': '+91-9000000000', 'treatment_id': '{id}', 'budget': '1L-3L',
+            'user_query': 'Generated by load_test.py',
+        }}),
+    ],
+    'admin': [
+        ('GET', '/admin/dashboard', {}),
+        ('GET', '/admin/hospitals', {}),
+        ('GET', '/admin/bookings', {}),
+    ],
+}
+DEFAULT_MIX = 'browse=55,search=20,detail=20,book=4,admin=1'
+DEFAULT_STAGES = '30:1-20,60:20,30:20-50,60:50'
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """``"browse=60,search=40"`` -> ``{"browse": 60.0, "search": 40.0}``"""
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}' (choose from {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def _fill(value: Any, rng: random.Random, max_id: int) -> Any:
+    if isinstance(value, dict):
+        return {key: _fill(item, rng, max_id) for key, item in value.items()}
+    if value == '{id}':
+        return rng.randint(1, max_id)
+    if isinstance(value, str):
+        return (value.replace('{id}', str(rng.randint(1, max_id)))
+                .replace('{term}', rng.choice(SEARCH_TERMS))
+                .replace('{location}', rng.choice(LOCATIONS)))
+    return value
+
+
+@dataclass
+class ScenarioStats:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def requests(self) -> int:
+        return self.latency.total
+
+    def add(self, latency_ms: float, service_ms: float, error: Optional[str]) -> None:
+        self.latency.record(latency_ms)
+        self.service.record(service_ms)
+        if error:
+            self.errors[error] += 1
+
+    def merge(self, other: "ScenarioStats") -> None:
+        self.latency.merge(other.latency)
+        self.service.merge(other.service)
+        self.errors.update(other.errors)
+
+
+@dataclass
+class StageStats:
+    stage: Stage
+    sent: int = 0
+    scenarios: Dict[str, ScenarioStats] = field(default_factory=dict)
+
+    def scenario(self, name: str) -> ScenarioStats:
+        return self.scenarios.setdefault(name, ScenarioStats())
+
+    def combined(self) -> ScenarioStats:
+        total = ScenarioStats()
+        for stats in self.scenarios.values():
+            total.merge(stats)
+        return total
+
+    @staticmethod
+    def _entry(stats: ScenarioStats, duration: float) -> Dict[str, Any]:
+        errors = sum(stats.errors.values())
+        return {
+            'requests': stats.requests,
+            'throughput_rps': round(stats.requests / duration, 2) if duration else 0,
+            'errors': errors,
+            'error_rate': round(100 * errors / stats.requests, 2) if stats.requests else 0,
+            'error_breakdown': dict(stats.errors),
+            'latency': stats.latency.to_dict(),
+            'service_time': stats.service.summary(),
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        duration = self.stage.duration
+        return {
+            'stage': self.stage.label,
+            'duration': duration,
+            'offered_rps': round(self.sent / duration, 2) if duration else 0,
+            'total': self._entry(self.combined(), duration),
+            'scenarios': {name: self._entry(stats, duration) for name, stats in sorted(self.scenarios.items())},
+        }
+
+
 class LoadTester:
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip('/')
         self.results = []
+        self.scenario_results: List[Dict[str, Any]] = []
         
     async def make_request(self, session: aiohttp.ClientSession, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make a single HTTP request and measure response time"""
@@ -121,6 +387,7 @@ class LoadTester:
             stats = {
                 'endpoint': endpoint,
                 'method': method,
+                'params': request_kwargs.get('params'),
                 'total_requests': len(valid_results),
                 'successful_requests': success_count,
                 'failed_requests': error_count,
@@ -214,19 +481,323 @@ class LoadTester:
         
         print("=" * 80)
 
-    def save_results(self, filename: str):
-        """Save results to JSON file"""
+    def results_data(self) -> Dict[str, Any]:
+        """Everything a saved run contains"""
         results_data = {
             'test_timestamp': datetime.now().isoformat(),
             'base_url': self.base_url,
             'results': self.results
         }
-        
+        if self.scenario_results:
+            results_data['stages'] = self.scenario_results
+        return results_data
+
+    def save_results(self, filename: str):
+        """Save results to JSON file"""
         with open(filename, 'w') as f:
-            json.dump(results_data, f, indent=2)
+            json.dump(self.results_data(), f, indent=2)
         
         print(f"💾 Results saved to {filename}")
 
+    async def admin_login(self, session: aiohttp.ClientSession, username: str, password: str) -> bool:
+        """Log in to the admin panel so the session carries its cookie"""
+        try:
+            async with session.post(f"{self.base_url}/admin/login", data={'username': username, 'password': password},
+                                    allow_redirects=False) as response:
+                return response.status == 302 and 'session_token' in response.cookies
+        except aiohttp.ClientError:
+            return False
+
+    async def _timed_request(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                             stats: ScenarioStats, intended: float, method: str, endpoint: str, **kwargs):
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            sent = loop.time()
+            error = None
+            try:
+                async with session.request(method, f"{self.base_url}{endpoint}", allow_redirects=False, **kwargs) as response:
+                    await response.read()
+                    if response.status >= 400:
+                        error = f"HTTP {response.status}"
+            except Exception as e:
+                error = type(e).__name__
+            finished = loop.time()
+        # Latency counts from when the request *should* have been sent, so time
+        # spent queued behind a slow server is not hidden
+        stats.add((finished - intended) * 1000, (finished - sent) * 1000, error)
+
+    async def run_scenarios(self, stages: List[Stage], mix: Dict[str, float], max_in_flight: int = 200,
+                            max_id: int = 100, seed: int = 1, admin_credentials: Optional[Tuple[str, str]] = None):
+        """Replay the weighted scenario ``mix`` at the open-loop arrival rates of ``stages``"""
+        rng = random.Random(seed)
+        connector = aiohttp.TCPConnector(limit=max_in_flight, limit_per_host=max_in_flight)
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        # unsafe=True keeps cookies for IP-address hosts such as the default --url
+        cookie_jar = aiohttp.CookieJar(unsafe=True)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, cookie_jar=cookie_jar) as session:
+            if 'admin' in mix and not (admin_credentials and await self.admin_login(session, *admin_credentials)):
+                print("⚠️  Admin login unavailable; dropping the admin scenario")
+                mix = {name: weight for name, weight in mix.items() if name != 'admin'}
+            names, weights = list(mix), list(mix.values())
+
+            print(f"🎯 Scenario load test for {self.base_url}")
+            print(f"   Mix: {', '.join(f'{name}={weight:g}' for name, weight in mix.items())}")
+            print(f"   Stages: {', '.join(stage.label for stage in stages)}")
+
+            loop = asyncio.get_running_loop()
+            semaphore = asyncio.Semaphore(max_in_flight)
+            tasks = []
+            stage_stats = []
+            stage_start = loop.time()
+            for stage in stages:
+                current = StageStats(stage)
+                stage_stats.append(current)
+                elapsed = 0.0
+                while True:
+                    # Poisson arrivals at the rate the stage asks for at this moment
+                    rate = stage.rate_at(elapsed)
+                    elapsed += rng.expovariate(rate) if rate > 0 else 0.01
+                    if elapsed >= stage.duration:
+                        break
+                    intended = stage_start + elapsed
+                    delay = intended - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    if rate <= 0:
+                        continue
+                    name = rng.choices(names, weights)[0]
+                    method, endpoint, kwargs = rng.choice(SCENARIOS[name])
+                    tasks.append(asyncio.create_task(self._timed_request(
+                        session, semaphore, current.scenario(name), intended,
+                        method, _fill(endpoint, rng, max_id), **_fill(kwargs, rng, max_id),
+                    )))
+                    current.sent += 1
+                stage_start += stage.duration
+                print(f"   ✓ {stage.label}: {current.sent} requests scheduled")
+            await asyncio.gather(*tasks)
+
+        self.scenario_results = [stats.as_dict() for stats in stage_stats]
+        self.print_scenario_results()
+        return self.scenario_results
+
+    def print_scenario_results(self):
+        """Print per-stage throughput, latency percentiles and error breakdowns"""
+        header = f"{'':<24} {'Reqs':>7} {'Offered':>8} {'RPS':>8} {'Err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'p99.9':>8} {'Max':>8}"
+        print(f"\n📊 Scenario Results (latency in ms, measured from intended send time)")
+        for stage in self.scenario_results:
+            print("=" * len(header))
+            print(f"Stage {stage['stage']}")
+            print(header)
+            rows = [('TOTAL', stage['total'])] + list(stage['scenarios'].items())
+            for name, entry in rows:
+                latency = entry['latency']
+                offered = f"{stage['offered_rps']:.1f}" if name == 'TOTAL' else ''
+                print(f"{name:<24} {entry['requests']:>7} {offered:>8} {entry['throughput_rps']:>8.1f} "
+                      f"{entry['error_rate']:>6.2f} {latency['p50_ms']:>8.1f} {latency['p95_ms']:>8.1f} "
+                      f"{latency['p99_ms']:>8.1f} {latency['p99_9_ms']:>8.1f} {latency['max_ms']:>8.1f}")
+            for name, entry in stage['scenarios'].items():
+                for error, count in sorted(entry['error_breakdown'].items()):
+                    print(f"   ❌ {name}: {error} x{count}")
+        print("=" * len(header))
+
+
+DEFAULT_BASELINE_DIR = 'load_baselines'
+# Allowed regression before compare fails: percent slower for latencies,
+# percent fewer requests/second for rps, percentage points for error_rate
+DEFAULT_THRESHOLDS = 'p50=20,p95=20,p99=30,rps=15,error_rate=1'
+COMPARED_METRICS = ['p50', 'p95', 'p99', 'rps', 'error_rate']
+
+
+def _endpoint_key(result: Dict[str, Any]) -> str:
+    params = result.get('params') or {}
+    query = '&'.join(f"{key}={value}" for key, value in params.items())
+    return f"{result['method']} {result['endpoint']}" + (f"?{query}" if query else '')
+
+
+def run_metrics(run: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """
+    Per-endpoint p50/p95/p99 (ms), rps and error rate (%) of a saved run.
+
+    Burst results are keyed by method, path and query; scenario runs by
+    ``scenario:<name>`` with the histograms of all stages merged.
+    """
+    metrics = {}
+    for result in run.get('results', []):
+        key = _endpoint_key(result)
+        suffix = 2
+        while key in metrics:
+            key = f"{_endpoint_key(result)} #{suffix}"
+            suffix += 1
+        metrics[key] = {
+            'p50': result['median_response_time'],
+            'p95': result['p95_response_time'],
+            'p99': result['p99_response_time'],
+            'rps': result['requests_per_second'],
+            'error_rate': 100 - result['success_rate'] if result['total_requests'] else 0,
+            'requests': result['total_requests'],
+        }
+
+    stages = run.get('stages') or []
+    duration = sum(stage['duration'] for stage in stages)
+    merged: Dict[str, Tuple[LatencyHistogram, int]] = {}
+    for stage in stages:
+        for name, entry in [('TOTAL', stage['total'])] + list(stage['scenarios'].items()):
+            histogram, errors = merged.get(name, (LatencyHistogram(), 0))
+            histogram.merge(LatencyHistogram.from_dict(entry['latency']))
+            merged[name] = (histogram, errors + entry['errors'])
+    for name, (histogram, errors) in merged.items():
+        metrics[f"scenario:{name}"] = {
+            'p50': histogram.percentile(50),
+            'p95': histogram.percentile(95),
+            'p99': histogram.percentile(99),
+            'rps': round(histogram.total / duration, 2) if duration else 0,
+            'error_rate': round(100 * errors / histogram.total, 2) if histogram.total else 0,
+            'requests': histogram.total,
+        }
+    return metrics
+
+
+def parse_thresholds(spec: str) -> Dict[str, float]:
+    thresholds = {}
+    for part in spec.split(','):
+        metric, _, value = part.partition('=')
+        metric = metric.strip()
+        if metric not in COMPARED_METRICS:
+            raise ValueError(f"Unknown threshold metric '{metric}' (choose from {', '.join(COMPARED_METRICS)})")
+        thresholds[metric] = float(value)
+    return thresholds
+
+
+class BaselineRegistry:
+    """Named baselines, one JSON file each, under ``directory``"""
+
+    NAME_RE = re.compile(r'^[A-Za-z0-9._-]+$')
+
+    def __init__(self, directory: str = DEFAULT_BASELINE_DIR):
+        self.directory = directory
+
+    def path(self, name: str) -> str:
+        if not self.NAME_RE.match(name):
+            raise ValueError(f"Invalid baseline name '{name}' (use letters, digits, '.', '_' and '-')")
+        return os.path.join(self.directory, f"{name}.json")
+
+    def save(self, name: str, run: Dict[str, Any]) -> str:
+        path = self.path(name)
+        os.makedirs(self.directory, exist_ok=True)
+        baseline = {
+            'name': name,
+            'saved_at': datetime.now().isoformat(),
+            'run_timestamp': run.get('test_timestamp'),
+            'base_url': run.get('base_url'),
+            'endpoints': run_metrics(run),
+        }
+        with open(path, 'w') as f:
+            json.dump(baseline, f, indent=2)
+        return path
+
+    def load(self, name: str) -> Dict[str, Any]:
+        path = self.path(name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No baseline named '{name}' in {self.directory}")
+        with open(path) as f:
+            return json.load(f)
+
+    def list(self) -> List[Dict[str, Any]]:
+        if not os.path.isdir(self.directory):
+            return []
+        baselines = []
+        for filename in sorted(os.listdir(self.directory)):
+            if filename.endswith('.json'):
+                baseline = self.load(filename[:-len('.json')])
+                baselines.append({
+                    'name': baseline['name'],
+                    'saved_at': baseline['saved_at'],
+                    'base_url': baseline.get('base_url'),
+                    'endpoints': len(baseline.get('endpoints', {})),
+                })
+        return baselines
+
+
+def compare_metrics(baseline: Dict[str, Dict[str, float]], current: Dict[str, Dict[str, float]],
+                    thresholds: Dict[str, float], min_latency_delta: float = 5.0) -> List[Dict[str, Any]]:
+    """
+    One row per endpoint with baseline/current values and whether each metric regressed.
+
+    Latency regressions must also exceed ``min_latency_delta`` ms, so noise on
+    very fast endpoints does not fail a comparison.
+    """
+    rows = []
+    for endpoint in sorted(set(baseline) | set(current)):
+        before, after = baseline.get(endpoint), current.get(endpoint)
+        row = {'endpoint': endpoint, 'status': 'missing' if after is None else 'new' if before is None else 'compared',
+               'metrics': {}, 'regressed': False}
+        if before is not None and after is not None:
+            for metric in COMPARED_METRICS:
+                old, new = before[metric], after[metric]
+                change = (new - old) / old * 100 if old else None
+                limit = thresholds.get(metric)
+                regressed = False
+                if limit is not None:
+                    if metric == 'rps':
+                        regressed = new < old * (1 - limit / 100)
+                    elif metric == 'error_rate':
+                        regressed = new - old > limit
+                    else:
+                        regressed = new > old * (1 + limit / 100) and new - old >= min_latency_delta
+                row['metrics'][metric] = {'baseline': old, 'current': new, 'change_pct': change, 'regressed': regressed}
+                row['regressed'] |= regressed
+        rows.append(row)
+    return rows
+
+
+def print_comparison(name: str, rows: List[Dict[str, Any]]) -> None:
+    """Side-by-side table: baseline -> current (change) per metric"""
+    width = max([len(row['endpoint']) for row in rows] + [8])
+    labels = {'p50': 'p50 ms', 'p95': 'p95 ms', 'p99': 'p99 ms', 'rps': 'RPS', 'error_rate': 'Err %'}
+    header = f"{'Endpoint':<{width}} " + ' '.join(f"{labels[metric]:>26}" for metric in COMPARED_METRICS)
+    print(f"\n📐 Comparison against baseline '{name}'")
+    print("=" * len(header))
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        if row['status'] != 'compared':
+            note = 'missing from this run' if row['status'] == 'missing' else 'not in baseline'
+            print(f"{row['endpoint']:<{width}}    ({note})")
+            continue
+        cells = []
+        for metric in COMPARED_METRICS:
+            entry = row['metrics'][metric]
+            change = f"{entry['change_pct']:+.0f}%" if entry['change_pct'] is not None else 'n/a'
+            mark = '❌' if entry['regressed'] else '  '
+            cells.append(f"{entry['baseline']:>8.1f} → {entry['current']:>8.1f} {change:>5}{mark}")
+        print(f"{row['endpoint']:<{width}} " + ' '.join(f"{cell:>26}" for cell in cells))
+    print("=" * len(header))
+    regressions = [row['endpoint'] for row in rows if row['regressed']]
+    if regressions:
+        print(f"❌ {len(regressions)} endpoint(s) regressed beyond the thresholds")
+    else:
+        print("✅ No regressions beyond the thresholds")
+
+
+def compare_to_baseline(registry: BaselineRegistry, name: str, run: Dict[str, Any],
+                        thresholds: Dict[str, float], min_latency_delta: float) -> int:
+    """Print the comparison and return the process exit code (1 on regression)"""
+    baseline = registry.load(name)
+    rows = compare_metrics(baseline['endpoints'], run_metrics(run), thresholds, min_latency_delta)
+    print_comparison(name, rows)
+    return 1 if any(row['regressed'] for row in rows) else 0
+
+
+def add_baseline_options(parser: argparse.ArgumentParser, compare: bool = False) -> None:
+    parser.add_argument("--baseline-dir", default=DEFAULT_BASELINE_DIR, help="where baselines are stored")
+    if compare:
+        parser.add_argument("--thresholds", default=DEFAULT_THRESHOLDS,
+                            help="allowed regression: %% slower for p50/p95/p99, %% lower rps, points of error_rate")
+        parser.add_argument("--min-latency-delta", type=float, default=5.0,
+                            help="ignore latency regressions smaller than this many ms")
+
 
 async def main():
     parser = argparse.ArgumentParser(description="Load Test Medi-Tour API")
@@ -234,11 +805,60 @@ async def main():
     parser.add_argument("--users", type=int, default=10, help="Number of concurrent users")
     parser.add_argument("--requests", type=int, default=100, help="Total number of requests per test")
     parser.add_argument("--save", help="Save results to JSON file")
+    parser.add_argument("--mode", choices=["burst", "scenario"], default="burst",
+                        help="closed-loop bursts per endpoint, or an open-loop scenario mix")
+    parser.add_argument("--stages", default=DEFAULT_STAGES,
+                        help="scenario mode: comma-separated DURATION:RPS or DURATION:START-END ramps")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="scenario mode: weighted scenarios, e.g. browse=60,search=40")
+    parser.add_argument("--max-in-flight", type=int, default=200, help="scenario mode: cap on concurrent requests")
+    parser.add_argument("--max-id", type=int, default=100, help="scenario mode: highest id used for detail pages")
+    parser.add_argument("--seed", type=int, default=1, help="scenario mode: random seed for arrivals and choices")
+    parser.add_argument("--admin-username", help="scenario mode: admin login for the admin scenario")
+    parser.add_argument("--admin-password")
+    parser.add_argument("--save-baseline", metavar="NAME", help="store this run as a named baseline")
+    parser.add_argument("--compare-baseline", metavar="NAME", help="compare this run against a named baseline")
+
+    add_baseline_options(parser, compare=True)
+    commands = parser.add_subparsers(dest="command", metavar="{save-baseline,list-baselines,compare}")
+    save_command = commands.add_parser("save-baseline", help="store a saved run as a baseline")
+    add_baseline_options(save_command)
+    save_command.add_argument("name")
+    save_command.add_argument("run_file", help="JSON written by --save")
+    add_baseline_options(commands.add_parser("list-baselines", help="list stored baselines"))
+    compare_command = commands.add_parser("compare", help="compare a saved run against a baseline (exit 1 on regression)")
+    add_baseline_options(compare_command, compare=True)
+    compare_command.add_argument("name")
+    compare_command.add_argument("run_file", help="JSON written by --save")
     
     args = parser.parse_args()
+    registry = BaselineRegistry(args.baseline_dir)
+
+    if args.command == "list-baselines":
+        for baseline in registry.list():
+            print(f"{baseline['name']:<30} {baseline['saved_at']:<28} {baseline['endpoints']:>4} endpoints  {baseline['base_url']}")
+        return 0
+    if args.command in ("save-baseline", "compare"):
+        with open(args.run_file) as f:
+            run = json.load(f)
+        if args.command == "save-baseline":
+            print(f"📌 Baseline '{args.name}' saved to {registry.save(args.name, run)}")
+            return 0
+        return compare_to_baseline(registry, args.name, run, parse_thresholds(args.thresholds), args.min_latency_delta)
     
     # Initialize load tester
     tester = LoadTester(args.url)
+
+    if args.mode == "scenario":
+        credentials = (args.admin_username, args.admin_password) if args.admin_username else None
+        await tester.run_scenarios(
+            [Stage.parse(spec) for spec in args.stages.split(',')],
+            parse_mix(args.mix),
+            max_in_flight=args.max_in_flight,
+            max_id=args.max_id,
+            seed=args.seed,
+            admin_credentials=credentials,
+        )
+        return finish_run(tester, registry, args)
     
     # Define test scenarios
     test_config = [
@@ -303,11 +923,21 @@ async def main():
     
     # Run the tests
     await tester.run_load_tests(test_config)
-    
-    # Save results if requested
+    return finish_run(tester, registry, args)
+
+
+def finish_run(tester: LoadTester, registry: BaselineRegistry, args) -> int:
+    """Save the run and/or baseline as requested, then compare; returns the exit code"""
     if args.save:
         tester.save_results(args.save)
+    run = tester.results_data()
+    if args.save_baseline:
+        print(f"📌 Baseline '{args.save_baseline}' saved to {registry.save(args.save_baseline, run)}")
+    if args.compare_baseline:
+        return compare_to_baseline(registry, args.compare_baseline, run,
+                                   parse_thresholds(args.thresholds), args.min_latency_delta)
+    return 0
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the (doctor_id, scheduled_at) indexes on appointments:
+a composite index for doctor calendars and, on PostgreSQL and SQLite, a
+partial unique index that stops two live appointments sharing a doctor slot.
+Run this script once against an existing database; it is safe to re-run.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.models import Appointment
+from app.core.config import settings
+
+
+async def migrate_appointment_slot_indexes():
+    """Create the appointment slot indexes"""
+
+    engine = create_async_engine(settings.database_url, future=True)
+
+    try:
+        print("🚀 Starting migration for appointment slot indexes...")
+
+        async with engine.begin() as conn:
+            # The unique index cannot be built while a slot is double booked
+            duplicates = (await conn.execute(
+                select(Appointment.doctor_id, Appointment.scheduled_at, func.count())
+                .where(
+                    Appointment.doctor_id.isnot(None),
+                    Appointment.scheduled_at.isnot(None),
+                    Appointment.status != "cancelled"
+                )
+                .group_by(Appointment.doctor_id, Appointment.scheduled_at)
+                .having(func.count() > 1)
+            )).all()
+            if duplicates:
+                for doctor_id, scheduled_at, count in duplicates:
+                    print(f"Doctor {doctor_id} has {count} live appointments at {scheduled_at}")
+                raise RuntimeError("Cancel or move the double-booked appointments above, then re-run")
+
+            for index in Appointment.__table__.indexes:
+                await conn.run_sync(index.create, checkfirst=True)
+                print(f"Index '{index.name}' is in place")
+
+        print("✅ Appointment slot indexes created successfully!")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {str(e)}")
+        raise
+    finally:
+        await engine.dispose()
+
+if __name__ == "__main__":
+    print("🔧 Medi-Tour Database Migration")
+    print("=" * 50)
+    asyncio.run(migrate_appointment_slot_indexes())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the derived blog columns (sanitized HTML, excerpt,
+word count and table of contents) and fill them for existing blogs.
+Run this script once against an existing database; it is safe to re-run.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import inspect, select, text, update
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.models import Blog
+from app.core.config import settings
+from app.utils.blog_content import apply_blog_content
+
+NEW_COLUMNS = {
+    "content_html": "TEXT",
+    "auto_excerpt": "TEXT",
+    "word_count": "INTEGER",
+    "toc": "TEXT",
+}
+
+
+async def migrate_blog_derived_fields():
+    """Add the derived columns to blogs and backfill them"""
+
+    engine = create_async_engine(settings.database_url, future=True)
+
+    try:
+        print("🚀 Starting migration for derived blog fields...")
+
+        async with engine.begin() as conn:
+            existing = await conn.run_sync(
+                lambda sync_conn: {column["name"] for column in inspect(sync_conn).get_columns("blogs")}
+            )
+            for name, column_type in NEW_COLUMNS.items():
+                if name in existing:
+                    print(f"Column '{name}' already exists in blogs table")
+                    continue
+                await conn.execute(text(f"ALTER TABLE blogs ADD COLUMN {name} {column_type}"))
+                print(f"Added column '{name}' to blogs table")
+
+        async with engine.begin() as conn:
+            rows = (await conn.execute(select(Blog.id, Blog.content))).all()
+            for blog in rows:
+                values = Blog(content=blog.content)
+                apply_blog_content(values)
+                await conn.execute(
+                    update(Blog.__table__)
+                    .where(Blog.id == blog.id)
+                    .values(
+                        content_html=values.content_html,
+                        auto_excerpt=values.auto_excerpt,
+                        word_count=values.word_count,
+                        toc=values.toc,
+                        # Keep the edit timestamp; only derived data changes
+                        updated_at=Blog.updated_at,
+                    )
+                )
+
+        print(f"✅ Derived fields computed for {len(rows)} blogs!")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {str(e)}")
+        raise
+    finally:
+        await engine.dispose()
+
+if __name__ == "__main__":
+    print("🔧 Medi-Tour Database Migration")
+    print("=" * 50)
+    asyncio.run(migrate_blog_derived_fields())
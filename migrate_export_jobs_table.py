@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Migration script to create the export_jobs table used by background admin exports.
+Run this script once against an existing database.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.models import ExportJob
+from app.core.config import settings
+
+async def create_tables():
+    """Create the export_jobs table"""
+    
+    engine = create_async_engine(settings.database_url, future=True)
+    
+    try:
+        print("🚀 Starting migration for export jobs...")
+        
+        async with engine.begin() as conn:
+            await conn.run_sync(ExportJob.__table__.create, checkfirst=True)
+        
+        os.makedirs(os.path.join("media", "exports"), exist_ok=True)
+        print("✅ export_jobs table created successfully!")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {str(e)}")
+        raise
+    finally:
+        await engine.dispose()
+
+if __name__ == "__main__":
+    print("🔧 Medi-Tour Database Migration")
+    print("=" * 50)
+    asyncio.run(create_tables())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Concurrent read/write throughput on a file-backed SQLite database, with the
+default engine setup versus the tuned one (WAL pragmas, BEGIN IMMEDIATE
+writes and a separate reader pool).
+
+Usage:
+    python scripts/benchmark_sqlite.py [--seconds 5] [--readers 8] [--writers 4] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///./meditour.db")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+from sqlalchemy import exc, text
+
+from app.db import create_engine_for
+
+
+async def _setup(url: str) -> None:
+    engine = create_engine_for(url, sqlite_tuned=False)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, views INTEGER)"))
+        await conn.execute(
+            text("INSERT INTO items (name, views) VALUES (:name, 0)"),
+            [{"name": f"item {i}"} for i in range(1000)],
+        )
+    await engine.dispose()
+
+
+async def _run(url: str, tuned: bool, seconds: float, readers: int, writers: int) -> dict:
+    writer_engine = create_engine_for(url, sqlite_role="writer", sqlite_tuned=tuned)
+    reader_engine = create_engine_for(url, sqlite_role="reader", sqlite_tuned=tuned) if tuned else writer_engine
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    deadline = time.perf_counter() + seconds
+
+    async def reader(worker: int):
+        while time.perf_counter() < deadline:
+            try:
+                async with reader_engine.connect() as conn:
+                    await conn.execute(text("SELECT id, name, views FROM items WHERE id % 10 = :n"), {"n": worker % 10})
+                counts["reads"] += 1
+            except exc.DBAPIError:
+                counts["errors"] += 1
+
+    async def writer(worker: int):
+        n = 0
+        while time.perf_counter() < deadline:
+            n += 1
+            try:
+                async with writer_engine.begin() as conn:
+                    await conn.execute(
+                        text("UPDATE items SET views = views + 1 WHERE id = :id"),
+                        {"id": (worker * 997 + n) % 1000 + 1},
+                    )
+                counts["writes"] += 1
+            except exc.DBAPIError:
+                counts["errors"] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(reader(i) for i in range(readers)),
+        *(writer(i) for i in range(writers)),
+    )
+    elapsed = time.perf_counter() - started
+    await writer_engine.dispose()
+    if reader_engine is not writer_engine:
+        await reader_engine.dispose()
+    return {
+        "mode": "tuned" if tuned else "default",
+        "seconds": round(elapsed, 2),
+        "reads_per_second": round(counts["reads"] / elapsed, 1),
+        "writes_per_second": round(counts["writes"] / elapsed, 1),
+        "errors": counts["errors"],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for tuned in (False, True):
+            url = f"sqlite+aiosqlite:///{Path(tmp) / ('tuned.db' if tuned else 'default.db')}"
+            await _setup(url)
+            results.append(await _run(url, tuned, args.seconds, args.readers, args.writers))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'Mode':<10} {'Reads/s':>10} {'Writes/s':>10} {'Errors':>8}")
+    print("-" * 41)
+    for result in results:
+        print(f"{result['mode']:<10} {result['reads_per_second']:>10} {result['writes_per_second']:>10} {result['errors']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Standalone synthetic catalog generator that can be run independently
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils.synthetic_data import main
+
+if __name__ == "__main__":
+    import asyncio
+    asyncio.run(main())
@@ -1,12 +1,20 @@
+import os
+import uuid
 import pytest
-import asyncio
+import pytest_asyncio
 from typing import AsyncGenerator
-from httpx import AsyncClient
+from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
 
+# Settings are required at import time; fall back to test values without a .env
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///./test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
 from app.main import app
-from app.db import get_db, Base
+from app.db import get_db, get_read_db
+from app.models import Base
 from app.core.config import settings
 
 # Test database URL (SQLite for tests)
@@ -35,38 +43,67 @@ async def get_test_db():
             await session.close()
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture(scope="session")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def setup_database():
     """Create test database tables"""
     async with test_engine.begin() as conn:
+        # Start from an empty schema even if a previous run was interrupted
+        await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
     yield
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    # Close the StaticPool connection so the aiosqlite thread exits
+    await test_engine.dispose()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def db_session(setup_database) -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session"""
     async with TestSessionLocal() as session:
         yield session
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def client(setup_database) -> AsyncGenerator[AsyncClient, None]:
     """Create test client with overridden database dependency"""
     app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_read_db] = get_test_db
     
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
     
     # Clean up
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def admin_cookies(db_session) -> dict:
+    """Create an active super admin and return cookies for an admin web session"""
+    from app.models import Admin
+    from app.auth_utils import hash_password
+    from app.admin_web import create_access_token
+
+    suffix = uuid.uuid4().hex[:12]
+    admin = Admin(
+        username=f"admin-{suffix}",
+        email=f"admin-{suffix}@example.com",
+        password_hash=hash_password("secret123"),
+        is_active=True,
+        is_super_admin=True,
+    )
+    db_session.add(admin)
+    await db_session.commit()
+    return {"session_token": create_access_token(admin.id, admin.username, True)}
+
+
+@pytest.fixture
+def sql_statements():
+    """Record every SQL statement executed through the test engine"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
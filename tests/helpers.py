@@ -0,0 +1,27 @@
+"""
+Assertion helpers shared by the test modules
+"""
+
+from contextlib import contextmanager
+
+from app.utils.query_recorder import QueryRecorder
+
+
+def selects_from(statements: list, table: str) -> list:
+    """Filter recorded statements down to SELECTs reading ``table``"""
+    return [
+        s for s in statements
+        if s.lstrip().upper().startswith("SELECT") and f"FROM {table}" in s
+    ]
+
+
+@contextmanager
+def assert_max_queries(n: int, max_repeats: int = None):
+    """Fail if the block runs more than ``n`` SQL statements, or any statement
+    shape more than ``max_repeats`` times (an N+1 pattern)"""
+    with QueryRecorder() as recorder:
+        yield recorder
+    assert recorder.count <= n, f"Expected at most {n} queries\n{recorder.report()}"
+    if max_repeats is not None:
+        repeated = recorder.repeated(max_repeats + 1)
+        assert not repeated, f"Statements repeated more than {max_repeats} times\n{recorder.report()}"
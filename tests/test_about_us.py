@@ -0,0 +1,70 @@
+"""
+Tests for the batched, cached about-us endpoints
+"""
+
+import uuid
+
+import pytest
+
+from app import models
+from app.api.v1.routes import about_us_cache
+from tests.helpers import assert_max_queries
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _seed(db_session, sections: int = 3, cards: int = 2):
+    tag = uuid.uuid4().hex[:8]
+    items = [models.AboutUs(heading=f"About {tag} {i}", position=100 + i) for i in range(sections)]
+    db_session.add_all(items)
+    await db_session.flush()
+    featured = [
+        models.FeaturedCard(about_us_id=item.id, heading=f"Card {item.id}-{n}", position=n)
+        for item in items for n in range(cards)
+    ]
+    db_session.add_all(featured)
+    await db_session.flush()
+    db_session.add_all(
+        [models.Image(owner_type="about_us", owner_id=item.id, url=f"/media/about-{item.id}.jpg") for item in items]
+        + [models.Image(owner_type="featured_card", owner_id=card.id, url=f"/media/card-{card.id}.jpg") for card in featured]
+    )
+    await db_session.commit()
+    return items
+
+
+async def test_about_us_list_returns_every_section_with_three_queries(client, db_session):
+    items = await _seed(db_session)
+
+    with assert_max_queries(3, max_repeats=1):
+        response = await client.get("/api/v1/about-us")
+    assert response.status_code == 200
+    by_id = {about["id"]: about for about in response.json()}
+    for item in items:
+        about = by_id[item.id]
+        assert about["images"][0]["url"] == f"/media/about-{item.id}.jpg"
+        assert [card["heading"] for card in about["featured_cards"]] == [f"Card {item.id}-0", f"Card {item.id}-1"]
+        for card in about["featured_cards"]:
+            assert card["images"][0]["url"] == f"/media/card-{card['id']}.jpg"
+
+    with assert_max_queries(3, max_repeats=1):
+        detail = await client.get(f"/api/v1/about-us/{items[0].id}")
+    assert detail.json() == by_id[items[0].id]
+
+    # Served from the cache until something about-us related is written
+    with assert_max_queries(0):
+        assert (await client.get("/api/v1/about-us")).json() == response.json()
+        assert (await client.get(f"/api/v1/about-us/{items[0].id}")).status_code == 200
+
+
+async def test_about_us_write_clears_the_cached_page(client, db_session):
+    items = await _seed(db_session, sections=1, cards=1)
+    await client.get(f"/api/v1/about-us/{items[0].id}")
+    assert about_us_cache.get(("id", items[0].id)) is not None
+
+    db_session.add(models.FeaturedCard(about_us_id=items[0].id, heading="Added later", position=5))
+    await db_session.commit()
+
+    assert about_us_cache.get(("id", items[0].id)) is None
+    cards = (await client.get(f"/api/v1/about-us/{items[0].id}")).json()["featured_cards"]
+    assert [card["heading"] for card in cards][-1] == "Added later"
+    assert (await client.get("/api/v1/about-us/0")).status_code == 404
@@ -0,0 +1,52 @@
+"""
+Tests for the request-scoped admin context used by the admin web routes
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app.dependencies import principal_cache
+from tests.conftest import test_engine
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture
+def admin_selects():
+    """Record SELECTs against the admins table issued through the test engine"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM admins" in statement:
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.parametrize("method, url, data", [
+    ("GET", "/admin/hospitals", None),
+    ("GET", "/admin/hospitals/new", None),
+    ("POST", "/admin/hospitals", {"name": "Context Test Hospital"}),
+    ("GET", "/admin/api/featured-treatments-count", None),
+])
+async def test_one_admin_query_per_request(client, admin_cookies, admin_selects, method, url, data):
+    client.cookies.update(admin_cookies)
+    # Force a cold principal cache so the admin really is loaded from the DB
+    principal_cache.clear()
+
+    response = await client.request(method, url, data=data)
+    client.cookies.clear()
+
+    assert response.status_code in (200, 302)
+    assert response.headers.get("location") != "/admin"
+    assert len(admin_selects) == 1
+
+
+async def test_missing_session_redirects_without_admin_query(client, admin_selects):
+    response = await client.get("/admin/hospitals")
+
+    assert response.status_code == 302
+    assert response.headers["location"] == "/admin"
+    assert admin_selects == []
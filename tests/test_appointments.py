@@ -0,0 +1,122 @@
+"""
+Tests for public appointment booking and slot reservation
+"""
+
+import json
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app import models
+from app.api.v1 import routes
+from app.core.config import settings
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+MONDAY = datetime(2030, 1, 7)
+
+
+async def _doctor(db_session, **fields) -> models.Doctor:
+    fields = {"consultancy_fee": 950.0, "time_slots": json.dumps({"Monday": "9:00 AM - 12:00 PM"}), **fields}
+    doctor = models.Doctor(name=f"Booking {uuid.uuid4().hex[:8]}", **fields)
+    db_session.add(doctor)
+    await db_session.commit()
+    return doctor
+
+
+def _booking(doctor_id: int, at: datetime) -> dict:
+    return {"patient_name": "Asha", "patient_contact": "9000000000", "doctor_id": doctor_id,
+            "scheduled_at": at.isoformat(), "consultation_fees": "1.00"}
+
+
+async def test_booking_reserves_the_slot_and_opens_an_order_off_the_loop(client, db_session, monkeypatch):
+    doctor = await _doctor(db_session)
+    calls = []
+
+    def create_order(data):
+        calls.append((data, threading.current_thread() is threading.main_thread()))
+        return {"id": "order_test_1"}
+
+    monkeypatch.setattr(routes.razorpay_client.order, "create", create_order)
+
+    response = await client.post("/api/v1/appointments", json=_booking(doctor.id, MONDAY.replace(hour=10)))
+    assert response.status_code == 201
+    appointment = response.json()
+    assert appointment["payment_order_id"] == "order_test_1"
+    # The doctor's fee is charged, not the one posted by the form
+    assert appointment["consultation_fees"] == 950.0
+    assert appointment["amount_in_paise"] == 95000
+    assert calls == [({"amount": 95000, "currency": "INR", "receipt": f"appointment_{appointment['id']}",
+                       "notes": {"appointment_id": str(appointment["id"]), "patient_name": "Asha"}}, False)]
+
+    again = await client.post("/api/v1/appointments", json=_booking(doctor.id, MONDAY.replace(hour=10)))
+    assert again.status_code == 409
+
+    # Off-grid, off-hours and past times are refused
+    for at in (MONDAY.replace(hour=10, minute=10), MONDAY.replace(hour=13), datetime(2020, 1, 6, 10)):
+        assert (await client.post("/api/v1/appointments", json=_booking(doctor.id, at))).status_code == 400
+    assert (await client.post("/api/v1/appointments", json=_booking(0, MONDAY.replace(hour=9)))).status_code == 404
+
+    # An admin booking that starts inside a slot takes it too
+    db_session.add(models.Appointment(doctor_id=doctor.id, scheduled_at=MONDAY.replace(hour=11, minute=5)))
+    await db_session.commit()
+    assert (await client.post("/api/v1/appointments", json=_booking(doctor.id, MONDAY.replace(hour=11)))).status_code == 409
+
+    slots = await client.get("/api/v1/doctors/available-slots",
+                             params={"doctor_id": doctor.id, "start": MONDAY.replace(hour=9).isoformat(), "count": 4})
+    assert [slot["start"][11:16] for slot in slots.json()] == ["09:00", "09:30", "10:30", "11:30"]
+
+    # Every listed slot can be booked, including the one right after the unaligned booking
+    booked = await client.post("/api/v1/appointments", json=_booking(doctor.id, datetime.fromisoformat(slots.json()[-1]["start"])))
+    assert booked.status_code == 201
+
+
+async def test_unique_slot_index_allows_rebooking_cancelled_slots(client, db_session, monkeypatch):
+    doctor_id = (await _doctor(db_session, consultancy_fee=None)).id
+    monkeypatch.setattr(routes.razorpay_client.order, "create", pytest.fail)
+    at = MONDAY.replace(hour=9)
+
+    first = await client.post("/api/v1/appointments", json=_booking(doctor_id, at))
+    assert first.status_code == 201
+    assert first.json()["payment_order_id"] is None
+
+    # The database rejects a second live appointment even when the endpoint's check is bypassed
+    db_session.add(models.Appointment(doctor_id=doctor_id, scheduled_at=at, status="confirmed"))
+    with pytest.raises(IntegrityError):
+        await db_session.commit()
+    await db_session.rollback()
+
+    cancelled = await db_session.get(models.Appointment, first.json()["id"])
+    cancelled.status = "cancelled"
+    await db_session.commit()
+    assert (await client.post("/api/v1/appointments", json=_booking(doctor_id, at))).status_code == 201
+
+
+async def test_unpaid_online_booking_stops_holding_the_slot(client, db_session, monkeypatch):
+    doctor_id = (await _doctor(db_session)).id
+    monkeypatch.setattr(routes.razorpay_client.order, "create", lambda data: {"id": f"order_{uuid.uuid4().hex}"})
+    at = MONDAY.replace(hour=9)
+
+    first = await client.post("/api/v1/appointments", json=_booking(doctor_id, at))
+    assert first.status_code == 201
+    assert (await client.post("/api/v1/appointments", json=_booking(doctor_id, at))).status_code == 409
+
+    # An admin-entered unpaid appointment has no order id and keeps its slot
+    db_session.add(models.Appointment(doctor_id=doctor_id, scheduled_at=at.replace(minute=30), payment_status="pending",
+                                      created_at=datetime.utcnow() - timedelta(days=1)))
+    stale = await db_session.get(models.Appointment, first.json()["id"])
+    stale.created_at = datetime.utcnow() - timedelta(minutes=settings.appointment_hold_minutes + 1)
+    await db_session.commit()
+
+    slots = await client.get("/api/v1/doctors/available-slots",
+                             params={"doctor_id": doctor_id, "start": at.isoformat(), "count": 2})
+    assert [slot["start"][11:16] for slot in slots.json()] == ["09:00", "10:00"]
+
+    again = await client.post("/api/v1/appointments", json=_booking(doctor_id, at))
+    assert again.status_code == 201
+    await db_session.refresh(stale)
+    assert stale.status == "cancelled"
+    assert (await client.post("/api/v1/appointments", json=_booking(doctor_id, at.replace(minute=30)))).status_code == 409
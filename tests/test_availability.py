@@ -0,0 +1,79 @@
+"""
+Tests for parsed doctor availability and the free-slot search
+"""
+
+import json
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app import models
+from app.admin_web import get_time_from_slots
+from app.api.v1.routes import doctor_to_dict
+from app.utils.availability import doctor_availability, parse_time_slots
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+OFF_WEEK = {day: "Off" for day in ("Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")}
+
+
+async def test_time_slots_are_parsed_once_and_refreshed_on_change():
+    parsed = parse_time_slots(json.dumps({"Monday": "9:00 AM - 1:00 PM, 2 PM - 6:30 PM", "Tuesday": "18:00 - 12:00 AM",
+                                          "Wednesday": "Off", "Thursday": "nonsense"}))
+    assert parsed.intervals[0] == ((540, 780), (840, 1110))
+    assert parsed.intervals[1] == ((1080, 1440),)
+    assert parsed.intervals[2:] == ((),) * 5
+    assert parse_time_slots("not json").is_empty
+
+    doctor = SimpleNamespace(id=-1, time_slots=json.dumps({"Monday": "9:00 AM - 5:00 PM", **OFF_WEEK}))
+    assert get_time_from_slots(doctor, "Monday", "start") == "09:00"
+    assert get_time_from_slots(doctor, "Monday", "end") == "17:00"
+    assert get_time_from_slots(doctor, "Sunday", "start") == ""
+    cached = doctor_availability.get(doctor.id, doctor.time_slots)
+    assert doctor_availability.get(doctor.id, doctor.time_slots) is cached
+
+    # An edited doctor is re-parsed the next time it is serialized
+    doctor.time_slots = json.dumps({"Monday": "10:00 AM - 12:00 AM"})
+    assert get_time_from_slots(doctor, "Monday", "end") == "00:00"
+    assert doctor_availability.get(doctor.id, doctor.time_slots) is not cached
+    doctor_availability.invalidate(doctor.id)
+
+
+async def test_available_slots_merge_doctors_and_skip_booked_times(client, db_session, sql_statements):
+    tag = uuid.uuid4().hex[:8]
+    first = models.Doctor(name=f"Slots A {tag}", time_slots=json.dumps({"Monday": "9:00 AM - 10:30 AM", **OFF_WEEK}))
+    second = models.Doctor(name=f"Slots B {tag}",
+                           time_slots=json.dumps({"Monday": "9:30 AM - 10:30 AM, 2:00 PM - 3:00 PM", **OFF_WEEK}))
+    db_session.add_all([first, second])
+    await db_session.flush()
+    monday = datetime(2030, 1, 7)
+    db_session.add_all([
+        models.Appointment(doctor_id=first.id, scheduled_at=monday.replace(hour=9), status="scheduled"),
+        models.Appointment(doctor_id=first.id, scheduled_at=monday.replace(hour=9, minute=30), status="cancelled"),
+        models.Appointment(doctor_id=second.id, scheduled_at=monday.replace(hour=10, minute=10), status="confirmed"),
+    ])
+    await db_session.commit()
+
+    sql_statements.clear()
+    response = await client.get("/api/v1/doctors/available-slots", params={
+        "doctor_id": [first.id, second.id], "start": monday.replace(hour=9).isoformat(), "count": 5,
+    })
+    assert response.status_code == 200
+    # One query for the doctors, one for their bookings
+    assert len(sql_statements) == 2
+    assert [(slot["doctor_name"][-10:], slot["start"][11:16]) for slot in response.json()] == [
+        (f"A {tag}", "09:30"), (f"B {tag}", "09:30"), (f"A {tag}", "10:00"), (f"B {tag}", "14:00"), (f"B {tag}", "14:30"),
+    ]
+    assert response.json()[0]["end"].endswith("10:00:00")
+
+    # Next Monday is searched once this week's slots run out
+    later = await client.get("/api/v1/doctors/available-slots", params={
+        "doctor_id": first.id, "start": monday.replace(hour=11).isoformat(), "count": 1,
+    })
+    assert later.json()[0]["start"] == "2030-01-14T09:00:00"
+
+    detail = await client.get(f"/api/v1/doctors/{first.id}")
+    assert detail.json()["time_slots"]["Monday"] == "9:00 AM - 10:30 AM"
+    assert doctor_to_dict(first)["time_slots"]["Tuesday"] == "Off"
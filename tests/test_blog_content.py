@@ -0,0 +1,89 @@
+"""
+Tests for blog fields derived from the content at write time
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app import models
+from app.utils.blog_content import parse_blog_content
+from tests.helpers import selects_from
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+CONTENT = (
+    '<h2>Why India?</h2><p onclick="steal()">Costs are <b>low</b>.<script>alert(1)</script></p>'
+    '<h3>Visa</h3><p><a href="javascript:alert(1)" target="_blank">Apply</a> early '
+    '<img src="/media/blog/x.png" style="width: 50%; background: url(evil)"></p>'
+    '<h2>Why India?</h2><ul><li>one<li>two</ul>'
+)
+
+
+async def test_content_is_sanitized_and_outlined():
+    derived = parse_blog_content(CONTENT)
+
+    assert "script" not in derived.html and "onclick" not in derived.html
+    assert "javascript" not in derived.html and "url(" not in derived.html
+    assert '<a target="_blank" rel="noopener noreferrer">Apply</a>' in derived.html
+    assert '<img src="/media/blog/x.png" style="width: 50%">' in derived.html
+    assert "<li>one</li><li>two</li>" in derived.html
+    assert derived.toc == [
+        {"level": 2, "id": "why-india", "text": "Why India?"},
+        {"level": 3, "id": "visa", "text": "Visa"},
+        {"level": 2, "id": "why-india-2", "text": "Why India?"},
+    ]
+    assert '<h2 id="why-india-2">' in derived.html
+    assert derived.text == "Why India? Costs are low. Visa Apply early Why India? one two"
+    assert derived.word_count == 12
+    assert derived.reading_time == 1
+
+    long_text = parse_blog_content("<p>" + "word " * 500 + "</p>")
+    assert long_text.reading_time == 3
+    assert long_text.excerpt.endswith("…") and len(long_text.excerpt) <= 201
+
+
+async def _admin_post(client, admin_cookies, url: str, data: dict):
+    client.cookies.update(admin_cookies)
+    try:
+        return await client.post(url, data=data)
+    finally:
+        client.cookies.clear()
+
+
+async def test_admin_save_stores_derived_fields_and_list_omits_content(client, db_session, admin_cookies, sql_statements):
+    title = f"Derived {uuid.uuid4().hex[:10]}"
+    response = await _admin_post(client, admin_cookies, "/admin/blogs",
+                                 {"title": title, "content": CONTENT, "is_published": "true"})
+    assert response.status_code == 302
+
+    blog = (await db_session.execute(select(models.Blog).where(models.Blog.title == title))).scalar_one()
+    assert blog.word_count == 12
+    assert blog.auto_excerpt.startswith("Why India? Costs are low.")
+    assert blog.excerpt is None and blog.reading_time is None
+
+    sql_statements.clear()
+    listed = (await client.get("/api/v1/blogs", params={"search": title})).json()
+    assert len(listed) == 1
+    assert not any("blogs.content_html" in s or "blogs.toc" in s for s in selects_from(sql_statements, "blogs"))
+    assert "content" not in listed[0] and "toc" not in listed[0]
+    assert listed[0]["excerpt"] == blog.auto_excerpt
+    assert listed[0]["reading_time"] == 1 and listed[0]["word_count"] == 12
+
+    detail = (await client.get(f"/api/v1/blogs/{blog.id}")).json()
+    assert detail["content"] == blog.content_html
+    assert [entry["id"] for entry in detail["toc"]] == ["why-india", "visa", "why-india-2"]
+
+    # Admin-entered values win, and an edit re-derives the rest
+    response = await _admin_post(client, admin_cookies, f"/admin/blogs/{blog.id}", {
+        "title": title, "content": "<h2>Only</h2><p>" + "word " * 450 + "</p>",
+        "excerpt": "Hand written", "reading_time": "9", "is_published": "true",
+    })
+    assert response.status_code == 302
+    await db_session.refresh(blog)
+    assert blog.word_count == 451
+    assert blog.toc == '[{"level": 2, "id": "only", "text": "Only"}]'
+
+    listed = (await client.get("/api/v1/blogs", params={"search": title})).json()
+    assert listed[0]["excerpt"] == "Hand written" and listed[0]["reading_time"] == 9
@@ -0,0 +1,85 @@
+"""
+Tests for the write-behind blog view counter
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app import models
+from app.api.v1.routes import blog_detail_cache, blog_views
+from tests.conftest import test_engine
+from tests.helpers import selects_from
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _create_blog(db_session, **fields) -> models.Blog:
+    tag = uuid.uuid4().hex[:10]
+    blog = models.Blog(title=f"Views {tag}", slug=f"views-{tag}", content="<p>Body</p>",
+                       is_published=True, view_count=5, **fields)
+    db_session.add(blog)
+    await db_session.commit()
+    return blog
+
+
+async def _stored_views(blog_id: int) -> int:
+    async with test_engine.connect() as conn:
+        return await conn.scalar(select(models.Blog.view_count).where(models.Blog.id == blog_id))
+
+
+def _writes(statements: list) -> list:
+    return [s for s in statements if s.lstrip().upper().startswith(("UPDATE", "INSERT", "DELETE"))]
+
+
+async def test_reads_are_buffered_not_written(client, db_session, sql_statements):
+    blog = await _create_blog(db_session)
+    await blog_views.flush(test_engine)
+    sql_statements.clear()
+
+    counts = [
+        (await client.get(f"/api/v1/blogs/{blog.id}")).json()["view_count"],
+        (await client.get(f"/api/v1/blogs/slug/{blog.slug}")).json()["view_count"],
+        (await client.get(f"/api/v1/blogs/{blog.id}")).json()["view_count"],
+    ]
+
+    assert counts == [6, 7, 8]
+    assert _writes(sql_statements) == []
+    # The payload is cached per key, so repeated reads skip the database
+    assert len(selects_from(sql_statements, "blogs")) == 2
+    assert await _stored_views(blog.id) == 5
+
+    assert await blog_views.flush(test_engine) >= 1
+    assert await _stored_views(blog.id) == 8
+    assert blog_views.pending(blog.id) == 0
+    assert (await client.get(f"/api/v1/blogs/{blog.id}")).json()["view_count"] == 9
+
+
+async def test_flush_updates_many_blogs_in_one_statement(db_session, sql_statements):
+    first = await _create_blog(db_session)
+    second = await _create_blog(db_session)
+    await blog_views.flush(test_engine)
+    blog_views.increment(first.id, 3)
+    blog_views.increment(second.id)
+    sql_statements.clear()
+
+    assert await blog_views.flush(test_engine) == 2
+
+    assert len([s for s in sql_statements if s.lstrip().upper().startswith("UPDATE BLOGS")]) == 1
+    assert await _stored_views(first.id) == 8
+    assert await _stored_views(second.id) == 6
+    assert await blog_views.flush(test_engine) == 0
+
+
+async def test_blog_write_drops_cached_detail(client, db_session):
+    blog = await _create_blog(db_session)
+    assert (await client.get(f"/api/v1/blogs/{blog.id}")).json()["title"] == blog.title
+    assert blog_detail_cache.get(("id", blog.id)) is not None
+
+    blog.title = blog.title + " (edited)"
+    await db_session.commit()
+
+    assert blog_detail_cache.get(("id", blog.id)) is None
+    assert (await client.get(f"/api/v1/blogs/{blog.id}")).json()["title"].endswith("(edited)")
+    await blog_views.flush(test_engine)
@@ -0,0 +1,131 @@
+"""
+Tests for the admin bulk CSV import
+"""
+
+import threading
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app import models
+from app.utils import bulk_import
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _upload(client, admin_cookies, resource: str, content: str):
+    client.cookies.update(admin_cookies)
+    try:
+        return await client.post(
+            f"/admin/{resource}/bulk-import",
+            files={"file": (f"{resource}.csv", content.encode("utf-8"), "text/csv")},
+        )
+    finally:
+        client.cookies.clear()
+
+
+async def test_doctor_import_resolves_hospital_names_and_reports_bad_rows(client, db_session, admin_cookies):
+    tag = uuid.uuid4().hex[:8]
+    first = models.Hospital(name=f"Bulk General {tag}")
+    second = models.Hospital(name=f"Bulk Heart {tag}")
+    db_session.add_all([first, second])
+    await db_session.commit()
+
+    content = (
+        "name,specialization,experience_years,rating,hospital_name,associated_hospital_names\n"
+        f"Dr A {tag},Cardiology,12,4.5,Bulk General {tag},Bulk General {tag}; bulk heart {tag}\n"
+        f"Dr B {tag},Neurology,abc,,,\n"
+        f"Dr C {tag},Oncology,3,,Missing Hospital {tag},\n"
+        f",Orthopedics,5,,,\n"
+        f"Dr D {tag},ENT,7,9,,\n"
+        f"Dr E {tag},ENT,,,,\n"
+    )
+    response = await _upload(client, admin_cookies, "doctors", content)
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["total_rows"] == 6
+    assert report["inserted"] == 2
+    assert report["failed"] == 4
+    assert {(error["row"], error["field"]) for error in report["errors"]} == {
+        (3, "experience_years"),
+        (4, "hospital_name"),
+        (5, "name"),
+        (6, "rating"),
+    }
+
+    result = await db_session.execute(
+        select(models.Doctor).where(models.Doctor.name.like(f"Dr % {tag}"))
+    )
+    doctors = {doctor.name: doctor for doctor in result.scalars().all()}
+    assert set(doctors) == {f"Dr A {tag}", f"Dr E {tag}"}
+    assert doctors[f"Dr A {tag}"].hospital_id == first.id
+
+    associations = await db_session.execute(
+        select(models.doctor_hospital_association.c.hospital_id)
+        .where(models.doctor_hospital_association.c.doctor_id == doctors[f"Dr A {tag}"].id)
+    )
+    assert sorted(associations.scalars().all()) == sorted([first.id, second.id])
+
+
+async def test_treatment_import_keeps_unknown_hospital_as_free_text(client, db_session, admin_cookies):
+    tag = uuid.uuid4().hex[:8]
+    content = (
+        "name,treatment_type,price_min,hospital_name\n"
+        f"Knee {tag},Orthopedics,1000,Elsewhere {tag}\n"
+    )
+    response = await _upload(client, admin_cookies, "treatments", content)
+
+    assert response.json()["inserted"] == 1
+    treatment = (await db_session.execute(
+        select(models.Treatment).where(models.Treatment.name == f"Knee {tag}")
+    )).scalar_one()
+    assert treatment.hospital_id is None
+    assert treatment.other_hospital_name == f"Elsewhere {tag}"
+
+
+async def test_upload_is_parsed_off_the_event_loop_in_batches(client, admin_cookies, monkeypatch):
+    tag = uuid.uuid4().hex[:8]
+    calls = []
+    parse_batch = bulk_import._parse_batch
+
+    def recording_parse_batch(*args):
+        calls.append(threading.current_thread() is threading.main_thread())
+        return parse_batch(*args)
+
+    monkeypatch.setattr(bulk_import, "_parse_batch", recording_parse_batch)
+    monkeypatch.setattr(bulk_import.settings, "export_batch_size", 2)
+    content = "name,location\n" + "".join(f"Threaded {tag} {i},Pune\n" for i in range(5))
+    response = await _upload(client, admin_cookies, "hospitals", content)
+
+    assert response.json()["inserted"] == 5
+    assert calls == [False, False, False]
+
+    # Decoding errors raised in the worker thread still become a 400
+    client.cookies.update(admin_cookies)
+    try:
+        invalid = await client.post("/admin/hospitals/bulk-import",
+                                    files={"file": ("hospitals.csv", b"name\n\xff\xfe\n", "text/csv")})
+    finally:
+        client.cookies.clear()
+    assert invalid.status_code == 400
+
+
+async def test_import_requires_known_resource_and_login(client, admin_cookies):
+    assert (await _upload(client, admin_cookies, "blogs", "title\nx\n")).status_code == 404
+    response = await client.post(
+        "/admin/hospitals/bulk-import", files={"file": ("h.csv", b"name\nx\n", "text/csv")}
+    )
+    assert response.status_code == 401
+
+
+async def test_template_lists_importable_columns(client, admin_cookies):
+    client.cookies.update(admin_cookies)
+    response = await client.get("/admin/doctors/bulk-import-template")
+    client.cookies.clear()
+
+    header = response.text.strip().split(",")
+    assert "hospital_name" in header
+    assert "associated_hospital_names" in header
+    assert "associated_hospitals" not in header
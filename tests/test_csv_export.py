@@ -0,0 +1,72 @@
+"""
+Tests for the streamed admin CSV exports
+"""
+
+import csv
+import io
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app import models
+from app.admin_web import HOSPITAL_EXPORT_HEADER, hospital_export_row
+from app.utils.csv_export import iter_csv_chunks
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _create_hospitals(db_session, count: int) -> str:
+    tag = uuid.uuid4().hex[:8]
+    db_session.add_all(
+        models.Hospital(name=f"Export {tag} {i}", location="Pune") for i in range(count)
+    )
+    await db_session.commit()
+    return tag
+
+
+async def test_chunks_follow_batches(db_session):
+    tag = await _create_hospitals(db_session, 5)
+    query = select(models.Hospital).where(models.Hospital.name.like(f"Export {tag}%"))
+
+    chunks = [
+        chunk async for chunk in iter_csv_chunks(
+            db_session, query, HOSPITAL_EXPORT_HEADER, hospital_export_row, batch_size=2
+        )
+    ]
+
+    # Header, then one chunk per batch of two rows
+    assert len(chunks) == 4
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0] == HOSPITAL_EXPORT_HEADER
+    assert len(rows) == 6
+
+
+async def test_hospital_export_endpoint_streams_csv(client, db_session, admin_cookies):
+    tag = await _create_hospitals(db_session, 3)
+
+    client.cookies.update(admin_cookies)
+    response = await client.get("/admin/hospitals", params={"export": "true", "search": tag})
+    client.cookies.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "hospitals_export_" in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == HOSPITAL_EXPORT_HEADER
+    assert sorted(row[1] for row in rows[1:]) == [f"Export {tag} {i}" for i in range(3)]
+
+
+async def test_booking_export_endpoint_streams_csv(client, db_session, admin_cookies):
+    email = f"export-{uuid.uuid4().hex[:8]}@example.com"
+    db_session.add(models.PackageBooking(
+        first_name="Export", last_name="Test", email=email, mobile_no="9999999999",
+    ))
+    await db_session.commit()
+
+    client.cookies.update(admin_cookies)
+    response = await client.get("/admin/bookings", params={"export": "true"})
+    client.cookies.clear()
+
+    assert response.status_code == 200
+    assert email in response.text
@@ -0,0 +1,103 @@
+"""
+Tests for the cached, single-query admin dashboard statistics
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import update
+
+from app import models
+from app.admin_web import dashboard_stats_cache, get_dashboard_stats
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture(autouse=True)
+def cold_stats_cache():
+    dashboard_stats_cache.clear()
+    yield
+    dashboard_stats_cache.clear()
+
+
+def _counter_queries(statements):
+    return [s for s in statements if "count(" in s.lower()]
+
+
+async def test_counts_run_as_one_statement(db_session, sql_statements):
+    stats = await get_dashboard_stats(db_session)
+
+    assert len(_counter_queries(sql_statements)) == 1
+    for key in ("hospitals", "doctors", "published_blogs", "active_banners", "verified_users"):
+        assert isinstance(stats[key], int)
+
+
+async def test_snapshot_is_reused_until_counted_table_changes(db_session, sql_statements):
+    first = await get_dashboard_stats(db_session)
+    await get_dashboard_stats(db_session)
+    assert len(_counter_queries(sql_statements)) == 1
+
+    db_session.add(models.Hospital(name=f"Stats {uuid.uuid4().hex[:8]}"))
+    await db_session.commit()
+
+    second = await get_dashboard_stats(db_session)
+    assert second["hospitals"] == first["hospitals"] + 1
+    assert len(_counter_queries(sql_statements)) == 2
+
+
+async def test_bulk_update_invalidates_snapshot(db_session):
+    banner = models.Banner(name="Stats banner", is_active=True)
+    db_session.add(banner)
+    await db_session.commit()
+    before = await get_dashboard_stats(db_session)
+
+    await db_session.execute(
+        update(models.Banner).where(models.Banner.id == banner.id).values(is_active=False)
+    )
+    await db_session.commit()
+
+    after = await get_dashboard_stats(db_session)
+    assert after["active_banners"] == before["active_banners"] - 1
+
+
+async def test_snapshot_is_dropped_on_commit_not_on_flush(db_session):
+    await get_dashboard_stats(db_session)
+
+    db_session.add(models.Hospital(name=f"Stats {uuid.uuid4().hex[:8]}"))
+    await db_session.flush()
+    # Not committed yet: readers may still be served the old snapshot
+    assert dashboard_stats_cache.get("stats") is not None
+    await db_session.rollback()
+    assert dashboard_stats_cache.get("stats") is not None
+
+    db_session.add(models.Hospital(name=f"Stats {uuid.uuid4().hex[:8]}"))
+    await db_session.commit()
+    assert dashboard_stats_cache.get("stats") is None
+
+
+async def test_recent_bookings_are_cached_as_plain_rows(client, db_session, admin_cookies):
+    tag = uuid.uuid4().hex[:8]
+    treatment = models.Treatment(name=f"Stats treatment {tag}")
+    db_session.add(treatment)
+    await db_session.flush()
+    db_session.add(models.PackageBooking(first_name="Stats", last_name=tag, email="s@example.com",
+                                         mobile_no="1", treatment_id=treatment.id))
+    await db_session.commit()
+
+    booking = (await get_dashboard_stats(db_session))["recent_bookings"][0]
+    assert isinstance(booking, dict)
+    assert booking["last_name"] == tag and booking["treatment"] == {"name": f"Stats treatment {tag}"}
+
+    # Renaming the treatment refreshes the embedded name
+    treatment.name = f"Renamed {tag}"
+    await db_session.commit()
+    booking = (await get_dashboard_stats(db_session))["recent_bookings"][0]
+    assert booking["treatment"] == {"name": f"Renamed {tag}"}
+
+    client.cookies.update(admin_cookies)
+    try:
+        page = await client.get("/admin/dashboard")
+    finally:
+        client.cookies.clear()
+    assert page.status_code == 200
+    assert f"Renamed {tag}"[:25] in page.text
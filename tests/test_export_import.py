@@ -0,0 +1,76 @@
+"""
+Tests for the streaming NDJSON export/import utilities
+"""
+
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app import models
+from app.utils.export_import import export_tables, export_to_ndjson, import_from_ndjson
+from tests.conftest import test_engine
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def empty_engine():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def _row_counts(engine) -> dict:
+    async with engine.connect() as conn:
+        return {
+            table.name: await conn.scalar(select(func.count()).select_from(table))
+            for table in export_tables()
+        }
+
+
+async def test_round_trip_preserves_rows_and_relationships(db_session, empty_engine, tmp_path):
+    tag = uuid.uuid4().hex[:8]
+    hospital = models.Hospital(name=f"NDJSON {tag}")
+    doctor = models.Doctor(name=f"Dr NDJSON {tag}", hospital=hospital, hospitals=[hospital])
+    db_session.add_all([
+        hospital,
+        doctor,
+        models.PackageBooking(first_name="Nd", last_name="Json", email=f"{tag}@example.com", mobile_no="1"),
+    ])
+    await db_session.commit()
+
+    path = tmp_path / "dump.ndjson"
+    exported = await export_to_ndjson(str(path), batch_size=2, bind=test_engine)
+    imported = await import_from_ndjson(str(path), batch_size=2, bind=empty_engine)
+
+    assert exported.total_rows == imported.total_rows
+    assert await _row_counts(empty_engine) == await _row_counts(test_engine)
+    async with empty_engine.connect() as conn:
+        copied = (await conn.execute(
+            select(models.Doctor.__table__).where(models.Doctor.name == f"Dr NDJSON {tag}")
+        )).mappings().one()
+    assert copied["hospital_id"] == hospital.id
+    assert imported.as_dict()["tables"]["doctor_hospital_association"]["rows"] >= 1
+
+
+async def test_export_writes_one_json_object_per_line(empty_engine, tmp_path):
+    async with empty_engine.begin() as conn:
+        await conn.execute(models.Slider.__table__.insert(), [{"title": f"s{i}"} for i in range(3)])
+
+    path = tmp_path / "sliders.ndjson"
+    report = await export_to_ndjson(str(path), bind=empty_engine)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    header = json.loads(lines[0])
+    assert header["format"] == "meditour-ndjson"
+    assert set(header["tables"]) == {table.name for table in export_tables()}
+    rows = [json.loads(line) for line in lines[1:]]
+    assert [row["row"]["title"] for row in rows if row["table"] == "sliders"] == ["s0", "s1", "s2"]
+    assert report.as_dict()["tables"]["sliders"]["rows"] == 3
@@ -0,0 +1,169 @@
+"""
+Tests for background export jobs and their ranged downloads
+"""
+
+import asyncio
+import csv
+import io
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app import models
+from app.utils.export_jobs import (
+    export_file_path, purge_expired_exports, run_export_job, start_export_purger, stop_export_purger,
+)
+from tests.conftest import test_engine
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _create_bookings(db_session, count: int) -> str:
+    tag = uuid.uuid4().hex[:8]
+    db_session.add_all(
+        models.PackageBooking(
+            first_name=f"Job{tag}", last_name=str(i),
+            email=f"job-{tag}-{i}@example.com", mobile_no="9999999999",
+            payment_status=f"status-{tag}",
+        )
+        for i in range(count)
+    )
+    await db_session.commit()
+    return tag
+
+
+async def _start_job(client, admin_cookies, **form):
+    client.cookies.update(admin_cookies)
+    try:
+        return await client.post("/admin/bookings/export-jobs", data=form)
+    finally:
+        client.cookies.clear()
+
+
+async def test_job_writes_filtered_bookings_and_reports_progress(client, db_session, admin_cookies):
+    tag = await _create_bookings(db_session, 3)
+
+    started = await _start_job(client, admin_cookies, payment_status=f"status-{tag}")
+    assert started.status_code == 202
+    job_id = started.json()["id"]
+
+    client.cookies.update(admin_cookies)
+    progress = (await client.get(f"/admin/export-jobs/{job_id}")).json()
+    download = await client.get(progress["download_url"])
+    client.cookies.clear()
+
+    assert progress["status"] == "completed"
+    assert progress["total_rows"] == progress["processed_rows"] == 3
+    assert progress["percent"] == 100.0
+    assert download.status_code == 200
+    assert download.headers["accept-ranges"] == "bytes"
+    rows = list(csv.reader(io.StringIO(download.text)))
+    assert sorted(row[3] for row in rows[1:]) == [f"job-{tag}-{i}@example.com" for i in range(3)]
+
+
+async def test_download_honours_range_header(client, db_session, admin_cookies):
+    tag = await _create_bookings(db_session, 2)
+    job_id = (await _start_job(client, admin_cookies, payment_status=f"status-{tag}")).json()["id"]
+
+    client.cookies.update(admin_cookies)
+    full = await client.get(f"/admin/export-jobs/{job_id}/download")
+    partial = await client.get(f"/admin/export-jobs/{job_id}/download", headers={"Range": "bytes=10-"})
+    suffix = await client.get(f"/admin/export-jobs/{job_id}/download", headers={"Range": "bytes=-5"})
+    invalid = await client.get(
+        f"/admin/export-jobs/{job_id}/download", headers={"Range": f"bytes={len(full.content)}-"}
+    )
+    client.cookies.clear()
+
+    size = len(full.content)
+    assert partial.status_code == 206
+    assert partial.headers["content-range"] == f"bytes 10-{size - 1}/{size}"
+    assert partial.content == full.content[10:]
+    assert suffix.content == full.content[-5:]
+    assert invalid.status_code == 416
+    assert invalid.headers["content-range"] == f"bytes */{size}"
+
+
+async def test_batches_update_progress(db_session):
+    tag = await _create_bookings(db_session, 5)
+    job = models.ExportJob(
+        resource="bookings", filters=f'{{"payment_status": "status-{tag}"}}', status="pending"
+    )
+    db_session.add(job)
+    await db_session.commit()
+
+    await run_export_job(job.id, test_engine, batch_size=2)
+
+    await db_session.refresh(job)
+    assert job.status == "completed"
+    assert job.processed_rows == 5
+    assert job.file_size == os.path.getsize(export_file_path(job))
+    os.remove(export_file_path(job))
+
+
+async def test_expired_files_are_purged(client, db_session, admin_cookies):
+    tag = await _create_bookings(db_session, 1)
+    job_id = (await _start_job(client, admin_cookies, payment_status=f"status-{tag}")).json()["id"]
+    job = await db_session.get(models.ExportJob, job_id)
+    await db_session.refresh(job)
+    path = export_file_path(job)
+    assert os.path.exists(path)
+
+    job.expires_at = datetime.utcnow() - timedelta(minutes=1)
+    await db_session.commit()
+    assert await purge_expired_exports(db_session) >= 1
+
+    assert not os.path.exists(path)
+    client.cookies.update(admin_cookies)
+    response = await client.get(f"/admin/export-jobs/{job_id}/download")
+    client.cookies.clear()
+    assert response.status_code == 410
+
+
+async def test_setup_errors_mark_the_job_failed(db_session):
+    job = models.ExportJob(resource="bookings", filters="{not json", status="pending")
+    db_session.add(job)
+    await db_session.commit()
+
+    await run_export_job(job.id, test_engine)
+
+    await db_session.refresh(job)
+    assert job.status == "failed"
+    assert job.error
+    assert job.file_path is None
+
+
+async def test_expired_files_are_purged_in_the_background(db_session):
+    tag = await _create_bookings(db_session, 1)
+    job = models.ExportJob(resource="bookings", filters=f'{{"payment_status": "status-{tag}"}}', status="pending")
+    db_session.add(job)
+    await db_session.commit()
+    await run_export_job(job.id, test_engine)
+    await db_session.refresh(job)
+    path = export_file_path(job)
+    job.expires_at = datetime.utcnow() - timedelta(minutes=1)
+    await db_session.commit()
+
+    start_export_purger(test_engine, interval=0.05)
+    try:
+        await asyncio.sleep(0.2)
+    finally:
+        await stop_export_purger()
+
+    await db_session.refresh(job)
+    assert job.status == "expired"
+    assert not os.path.exists(path)
+
+
+async def test_exports_are_not_served_from_media(client):
+    os.makedirs(os.path.join("media", "exports"), exist_ok=True)
+    path = os.path.join("media", "exports", "private-check.csv")
+    with open(path, "w") as f:
+        f.write("secret")
+    try:
+        response = await client.get("/media/exports/private-check.csv")
+    finally:
+        os.remove(path)
+    assert response.status_code == 404
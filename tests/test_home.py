@@ -0,0 +1,91 @@
+"""
+Tests for the homepage aggregate endpoint
+"""
+
+import uuid
+
+import pytest
+
+from app import models
+from app.api.v1.home import HOME_SECTIONS, home_cache
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _seed(db_session, tag: str):
+    hospitals = [models.Hospital(name=f"Home Hospital {tag} {i}", is_featured=True) for i in range(3)]
+    doctors = [models.Doctor(name=f"Home Doctor {tag} {i}", is_featured=True) for i in range(3)]
+    treatments = [models.Treatment(name=f"Home Treatment {tag} {i}", is_featured=True) for i in range(3)]
+    db_session.add_all([
+        *hospitals, *doctors, *treatments,
+        models.Hospital(name=f"Hidden Hospital {tag}", is_featured=False),
+        models.Banner(name=f"Home Banner {tag}", position=-1),
+        models.Slider(title=f"Home Slider {tag}"),
+        models.PatientStory(patient_name=f"Patient {tag}", description="Great care", rating=5, is_featured=True, position=-1),
+        models.PartnerHospital(name=f"Partner {tag}"),
+    ])
+    await db_session.flush()
+    for owner_type, owners in (("hospital", hospitals), ("doctor", doctors), ("treatment", treatments)):
+        for owner in owners:
+            db_session.add_all([
+                models.Image(owner_type=owner_type, owner_id=owner.id, url=f"/media/{owner_type}-{owner.id}-a.jpg", position=0),
+                models.Image(owner_type=owner_type, owner_id=owner.id, url=f"/media/{owner_type}-{owner.id}-b.jpg",
+                             position=1, is_primary=True),
+            ])
+    await db_session.commit()
+
+
+def _names(payload: dict, section: str, field: str = "name") -> list:
+    return [card[field] for card in payload[section]]
+
+
+async def test_home_returns_every_section_with_batched_images(client, db_session, sql_statements):
+    tag = uuid.uuid4().hex[:8]
+    await _seed(db_session, tag)
+    home_cache.clear()
+
+    sql_statements.clear()
+    response = await client.get("/api/v1/home")
+    assert response.status_code == 200
+    payload = response.json()
+
+    # One query per section plus one image query per section with images
+    assert len(sql_statements) == len(HOME_SECTIONS) + 3
+    assert f"Home Banner {tag}" in _names(payload, "banners")
+    assert f"Home Slider {tag}" in _names(payload, "sliders", "title")
+    assert f"Patient {tag}" in _names(payload, "stories", "patient_name")
+    assert f"Partner {tag}" in _names(payload, "partners")
+    assert f"Hidden Hospital {tag}" not in _names(payload, "featured_hospitals")
+    for section, owner_type in (("featured_hospitals", "hospital"), ("featured_doctors", "doctor"),
+                                ("featured_treatments", "treatment")):
+        cards = [card for card in payload[section] if tag in card["name"]]
+        assert len(cards) == 3
+        assert all(card["image_url"] == f"/media/{owner_type}-{card['id']}-b.jpg" for card in cards)
+    # Compact cards: no descriptions or FAQs
+    assert "long_description" not in payload["featured_doctors"][0]
+    assert "faqs" not in payload["featured_treatments"][0]
+
+    sql_statements.clear()
+    assert (await client.get("/api/v1/home")).json() == payload
+    assert sql_statements == []
+
+
+async def test_home_sections_are_invalidated_independently(client, db_session, sql_statements):
+    tag = uuid.uuid4().hex[:8]
+    await client.get("/api/v1/home")
+
+    db_session.add(models.Banner(name=f"New Banner {tag}", position=-2))
+    await db_session.commit()
+    assert home_cache.get("banners") is None
+    assert home_cache.get("featured_doctors") is not None
+
+    sql_statements.clear()
+    payload = (await client.get("/api/v1/home")).json()
+    assert _names(payload, "banners")[0] == f"New Banner {tag}"
+    assert len(sql_statements) == 1 and "FROM banners" in sql_statements[0]
+
+    # Image writes only touch the sections that show images
+    db_session.add(models.Image(owner_type="doctor", owner_id=0, url="/media/unused.jpg"))
+    await db_session.commit()
+    assert home_cache.get("featured_doctors") is None
+    assert home_cache.get("banners") is not None
@@ -0,0 +1,79 @@
+"""
+Tests for the queue-based structured logging setup
+"""
+
+import io
+import json
+import logging
+import logging.handlers
+import queue
+
+import pytest
+
+from app.core.logging_config import (
+    JsonFormatter, _RequestQueueHandler, parse_log_levels, request_id_var,
+)
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def test_parse_log_levels():
+    assert parse_log_levels("app.admin_web=warning, sqlalchemy.engine=INFO,,bad") == {
+        "app.admin_web": "WARNING",
+        "sqlalchemy.engine": "INFO",
+    }
+
+
+def test_queued_records_are_json_with_request_id():
+    stream = io.StringIO()
+    output = logging.StreamHandler(stream)
+    output.setFormatter(JsonFormatter())
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, output)
+    logger = logging.getLogger("tests.structured")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    handler = _RequestQueueHandler(log_queue)
+    logger.addHandler(handler)
+    listener.start()
+    token = request_id_var.set("req-123")
+    try:
+        payload = {"count": 1}
+        logger.info("Booking %s created", 7, extra={"booking_id": 7, "payload": payload})
+        payload["count"] = 2  # must not leak into the queued record
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Failed")
+    finally:
+        request_id_var.reset(token)
+        listener.stop()
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+    first, second = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert first["message"] == "Booking 7 created"
+    assert first["request_id"] == "req-123"
+    assert first["booking_id"] == 7
+    assert first["level"] == "INFO"
+    assert first["logger"] == "tests.structured"
+    assert second["level"] == "ERROR"
+    assert "ValueError: boom" in second["exception"]
+
+
+async def test_request_id_header(client):
+    response = await client.get("/health")
+    generated = response.headers["x-request-id"]
+    assert len(generated) == 32
+
+    response = await client.get("/health", headers={"X-Request-ID": "trace-abc"})
+    assert response.headers["x-request-id"] == "trace-abc"
+
+
+async def test_forgot_password_logs_instead_of_printing(client, caplog, capsys):
+    with caplog.at_level(logging.INFO, logger="app.api.v1.routes"):
+        response = await client.post("/api/v1/auth/forgot-password", json={"email": "nobody@example.com"})
+
+    assert response.status_code == 200
+    assert "Password reset for unknown email" in caplog.text
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,82 @@
+"""
+Tests for the per-route request metrics and the /metrics endpoint
+"""
+
+import asyncio
+import time
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.main import app
+from app.utils.metrics import MetricsMiddleware, MetricsRegistry, RequestStats, current_request_stats
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_requests_are_recorded_by_route_template(client):
+    registry = MetricsRegistry()
+    transport = ASGITransport(app=MetricsMiddleware(app, metrics=registry))
+    async with AsyncClient(transport=transport, base_url="http://test") as metered:
+        assert (await metered.get("/api/v1/hospitals")).status_code == 200
+        assert (await metered.get("/api/v1/hospitals/999999")).status_code == 404
+        assert (await metered.get("/api/v1/hospitals/999998")).status_code == 404
+        await metered.get("/no-such-page")
+
+    text = registry.render()
+    assert 'http_requests_total{method="GET",route="/api/v1/hospitals/{hospital_id}",status="404"} 2' in text
+    assert 'http_requests_total{method="GET",route="/api/v1/hospitals",status="200"} 1' in text
+    assert 'route="<unmatched>"' in text
+    assert "/999999" not in text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/hospitals/{hospital_id}"} 2' in text
+
+    statements = [
+        line for line in text.splitlines()
+        if line.startswith('db_statements_total{method="GET",route="/api/v1/hospitals/{hospital_id}"}')
+    ]
+    assert len(statements) == 1
+    assert int(statements[0].rsplit(" ", 1)[1]) >= 2
+    assert current_request_stats.get() is None
+
+
+async def test_metrics_endpoint(client, monkeypatch):
+    assert (await client.get("/metrics")).status_code == 404
+
+    monkeypatch.setattr(settings, "metrics_enabled", True)
+    monkeypatch.setattr(settings, "metrics_token", "scrape-token")
+    assert (await client.get("/metrics")).status_code == 401
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+
+
+async def test_sql_time_is_tracked_per_statement_across_concurrent_sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'metrics.db'}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def add_sleep(dbapi_connection, connection_record):
+        dbapi_connection.create_function("sleep_ms", 1, lambda ms: time.sleep(ms / 1000) or ms)
+
+    async def run(statement):
+        async with engine.connect() as conn:
+            await conn.execute(text(statement))
+
+    stats = RequestStats()
+    token = current_request_stats.set(stats)
+    try:
+        with pytest.raises(DBAPIError):
+            await run("SELECT * FROM missing_table")
+        # Both statements share the request's stats, like home.py's asyncio.gather
+        await asyncio.gather(run("SELECT sleep_ms(200)"), run("SELECT sleep_ms(1)"))
+    finally:
+        current_request_stats.reset(token)
+        await engine.dispose()
+
+    assert stats.queries == 2
+    assert 0.2 <= stats.db_seconds < 0.4
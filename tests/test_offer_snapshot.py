@@ -0,0 +1,86 @@
+"""
+Tests for the active-offer snapshot behind the public offer endpoints
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import models
+from app.api.v1.offers import active_offers_cache
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# offers.router carries its own /api/v1/offers prefix and is included under
+# the /api/v1 API router
+OFFERS = "/api/v1/api/v1/offers"
+
+
+def _offer(tag: str, start: datetime, end: datetime, **fields) -> models.Offer:
+    return models.Offer(name=f"Snapshot {tag}", description=f"Offer {tag}", start_date=start, end_date=end, **fields)
+
+
+async def _counts(client) -> dict:
+    return (await client.get(f"{OFFERS}/active/count")).json()
+
+
+async def test_endpoints_share_one_snapshot_until_an_offer_is_written(client, db_session, sql_statements):
+    tag = uuid.uuid4().hex[:8]
+    now = datetime.utcnow()
+    before = await _counts(client)
+
+    db_session.add_all([
+        _offer(f"{tag}-camp", now - timedelta(days=1), now + timedelta(days=5),
+               is_free_camp=True, treatment_type=f"Camp {tag}", location=f"Pune {tag}"),
+        _offer(f"{tag}-discount", now - timedelta(days=1), now + timedelta(days=5),
+               discount_percentage=20, treatment_type=f"Dental {tag}", location=f"Goa {tag}"),
+        _offer(f"{tag}-later", now + timedelta(days=2), now + timedelta(days=9), location=f"Agra {tag}"),
+        _offer(f"{tag}-ended", now - timedelta(days=9), now - timedelta(days=1), location=f"Leh {tag}"),
+        _offer(f"{tag}-hidden", now - timedelta(days=1), now + timedelta(days=5), is_active=False),
+    ])
+    await db_session.commit()
+
+    sql_statements.clear()
+    counts = await _counts(client)
+    types = (await client.get(f"{OFFERS}/treatment-types/list")).json()["treatment_types"]
+    locations = (await client.get(f"{OFFERS}/locations/list")).json()["locations"]
+    listed = (await client.get(OFFERS, params={"search": tag, "limit": 100})).json()
+    camps = (await client.get(OFFERS, params={"search": tag, "location": f"PUNE {tag}"})).json()
+
+    # Offers with their images, then one aggregate; everything else is served from memory
+    assert len(sql_statements) == 3
+    assert "CASE" in sql_statements[-1] and "min(" in sql_statements[-1].lower()
+
+    assert counts["total_active"] == before["total_active"] + 2
+    assert counts["free_camps"] == before["free_camps"] + 1
+    assert counts["discount_offers"] == before["discount_offers"] + 1
+    assert {f"Camp {tag}", f"Dental {tag}"} <= set(types)
+    assert {f"Pune {tag}", f"Goa {tag}", f"Agra {tag}"} <= set(locations)
+    assert f"Leh {tag}" not in locations
+    assert sorted(offer["name"] for offer in listed) == sorted(f"Snapshot {tag}-{kind}" for kind in ("camp", "discount", "later"))
+    assert [offer["name"] for offer in camps] == [f"Snapshot {tag}-camp"]
+
+    # Expired offers still come from the database
+    expired = (await client.get(OFFERS, params={"search": tag, "include_expired": True})).json()
+    assert len(expired) == 4
+
+    hidden = await db_session.get(models.Offer, [o["id"] for o in listed if o["name"].endswith("-later")][0])
+    hidden.is_active = False
+    await db_session.commit()
+    assert active_offers_cache.get("active") is None
+    assert f"Agra {tag}" not in (await client.get(f"{OFFERS}/locations/list")).json()["locations"]
+
+
+async def test_snapshot_expires_when_an_offer_starts(client, db_session):
+    tag = uuid.uuid4().hex[:8]
+    now = datetime.utcnow()
+    db_session.add(_offer(tag, now + timedelta(seconds=1), now + timedelta(days=3), is_free_camp=True))
+    await db_session.commit()
+
+    before = await _counts(client)
+    assert active_offers_cache.get("active").next_change <= now + timedelta(seconds=1)
+
+    await asyncio.sleep(1.1)
+    assert (await _counts(client))["free_camps"] == before["free_camps"] + 1
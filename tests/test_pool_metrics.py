@@ -0,0 +1,49 @@
+"""
+Tests for the instrumented connection pool and its metrics
+"""
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db import InstrumentedQueuePool, pool_metrics
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_pool_metrics_track_checkouts_and_timeouts(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        async with engine.connect():
+            busy = pool_metrics(engine)
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+            after_timeout = pool_metrics(engine)
+    finally:
+        await engine.dispose()
+
+    assert busy["pool_class"] == "InstrumentedQueuePool"
+    assert busy["checked_out"] == 1
+    assert busy["size"] == 1
+    assert after_timeout["timeouts"] == 1
+    assert after_timeout["checkouts"] == 2
+    assert after_timeout["wait_seconds_max"] >= 0.05
+    assert pool_metrics(engine)["timeouts"] == 1
+
+
+async def test_pool_metrics_endpoint_requires_super_admin(client, admin_cookies):
+    assert (await client.get("/admin/api/pool-metrics")).status_code == 401
+
+    client.cookies.update(admin_cookies)
+    response = await client.get("/admin/api/pool-metrics")
+    client.cookies.clear()
+
+    assert response.status_code == 200
+    assert "pool_class" in response.json()
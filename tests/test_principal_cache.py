@@ -0,0 +1,128 @@
+"""
+Tests for the authenticated principal cache used by the auth dependencies
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app import models
+from app.auth_utils import create_access_token, hash_password
+from app.dependencies import principal_cache, token_cache, load_principal
+from tests.conftest import test_engine
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture
+def user_selects():
+    """Record SELECTs against the users table issued through the test engine"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    principal_cache.clear()
+    token_cache.clear()
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    principal_cache.clear()
+    token_cache.clear()
+
+
+async def _create_user(db_session, **fields) -> models.User:
+    user = models.User(
+        name="Cache Test",
+        email=f"cache-{uuid.uuid4().hex[:12]}@example.com",
+        password_hash=hash_password("secret123"),
+        **fields,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+def _bearer(user: models.User) -> dict:
+    token = create_access_token({"sub": str(user.id), "type": "user"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def test_repeated_requests_hit_cache(client, db_session, user_selects):
+    user = await _create_user(db_session)
+    headers = _bearer(user)
+
+    for _ in range(3):
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["email"] == user.email
+
+    assert len(user_selects) == 1
+
+
+async def test_toggle_user_status_revokes_cached_user(client, db_session, admin_cookies, user_selects):
+    user = await _create_user(db_session)
+    headers = _bearer(user)
+    assert (await client.get("/api/v1/auth/me", headers=headers)).status_code == 200
+
+    client.cookies.update(admin_cookies)
+    response = await client.post(f"/admin/users/{user.id}/toggle-status")
+    client.cookies.clear()
+    assert response.status_code == 200
+
+    assert (await client.get("/api/v1/auth/me", headers=headers)).status_code == 401
+
+
+async def test_reset_password_drops_cached_user(client, db_session, user_selects):
+    user = await _create_user(
+        db_session,
+        password_reset_token="reset-" + uuid.uuid4().hex,
+        password_reset_expires=datetime.utcnow() + timedelta(hours=1),
+    )
+    headers = _bearer(user)
+    assert (await client.get("/api/v1/auth/me", headers=headers)).status_code == 200
+    assert principal_cache.get(("users", str(user.id))) is not None
+
+    response = await client.post(
+        "/api/v1/auth/reset-password",
+        json={"token": user.password_reset_token, "new_password": "new-secret-456"},
+    )
+    assert response.status_code == 200
+
+    assert principal_cache.get(("users", str(user.id))) is None
+    selects_before = len(user_selects)
+    assert (await client.get("/api/v1/auth/me", headers=headers)).status_code == 200
+    assert len(user_selects) == selects_before + 1
+
+
+async def test_verify_email_is_reflected_immediately(client, db_session, user_selects):
+    user = await _create_user(
+        db_session,
+        email_verification_token="verify-" + uuid.uuid4().hex,
+        email_verification_expires=datetime.utcnow() + timedelta(hours=1),
+    )
+    headers = _bearer(user)
+    assert (await client.get("/api/v1/auth/me", headers=headers)).json()["is_email_verified"] is False
+
+    response = await client.post(
+        "/api/v1/auth/verify-email", json={"token": user.email_verification_token}
+    )
+    assert response.status_code == 200
+
+    assert (await client.get("/api/v1/auth/me", headers=headers)).json()["is_email_verified"] is True
+
+
+async def test_cached_principal_is_attached_copy(db_session, user_selects):
+    user = await _create_user(db_session)
+
+    first = await load_principal(db_session, models.User, user.id)
+    db_session.expunge_all()
+    second = await load_principal(db_session, models.User, user.id)
+
+    assert second is not principal_cache.get(("users", str(user.id)))
+    assert second in db_session
+    assert second.email == first.email
+    assert len(user_selects) == 1
@@ -0,0 +1,125 @@
+"""
+Tests for on-demand request profiling
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from app.admin_web import create_access_token
+from app.utils.profiling import WAITING_NODE, StackSampler, call_tree, requested_format
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def _scope(query: bytes = b"", headers=()):
+    return {"query_string": query, "headers": list(headers)}
+
+
+def test_requested_format():
+    assert requested_format(_scope()) is None
+    assert requested_format(_scope(b"__profile=0")) is None
+    assert requested_format(_scope(b"page=2&__profile=1")) == "html"
+    assert requested_format(_scope(b"__profile=json")) == "json"
+    assert requested_format(_scope(headers=[(b"x-profile", b"1"), (b"accept", b"application/json")])) == "json"
+
+
+def _root():
+    pass
+
+
+def _handler():
+    pass
+
+
+def _query():
+    pass
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_call_tree_from_samples():
+    outer, root, handler, query = (f.__code__ for f in (test_call_tree_from_samples, _root, _handler, _query))
+    samples = Counter({
+        (outer, root, handler, query): 0.3,
+        (outer, root, handler): 0.1,
+        (outer, root, query): 0.0001,
+        (outer,): 0.2,
+    })
+
+    tree = call_tree(samples, root, total_seconds=0.6)
+
+    # Nodes under MIN_NODE_FRACTION of the total (the direct _query sample) are dropped
+    assert [node["function"].split(" ")[0] for node in tree] == ["_handler", WAITING_NODE.split(" ")[0]]
+    handler_node = tree[0]
+    assert (handler_node["seconds"], handler_node["own"]) == (0.4, 0.1)
+    assert [(child["function"].split(" ")[0], child["seconds"]) for child in handler_node["children"]] == [("_query", 0.3)]
+    assert tree[1]["seconds"] == 0.2
+
+
+def test_sampler_lands_in_busy_function_and_restores_switch_interval():
+    original = sys.getswitchinterval()
+    first = StackSampler(threading.get_ident())
+    second = StackSampler(threading.get_ident())
+    first.start()
+    second.start()
+    lowered = sys.getswitchinterval()
+    _busy(0.1)
+    first.stop()
+    # Still lowered while another sampler runs
+    assert sys.getswitchinterval() == lowered < original
+    second.stop()
+    assert sys.getswitchinterval() == original
+
+    assert any(_busy.__code__ in stack for stack in first.samples)
+    assert 0.05 < sum(first.samples.values()) < 1
+
+
+async def test_super_admin_gets_json_profile(client, admin_cookies):
+    client.cookies.update(admin_cookies)
+    response = await client.get("/admin/hospitals", params={"__profile": "json"})
+    client.cookies.clear()
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["route"] == "/admin/hospitals"
+    assert report["status"] == 200
+    assert report["sql_queries"] >= 2
+    assert 0 < report["sql_seconds"] <= report["total_seconds"]
+    assert report["python_seconds"] == pytest.approx(report["total_seconds"] - report["sql_seconds"], abs=1e-5)
+
+
+async def test_html_profile_via_header(client, admin_cookies):
+    client.cookies.update(admin_cookies)
+    response = await client.get("/api/v1/hospitals", headers={"X-Profile": "1"})
+    client.cookies.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "SQL" in response.text and "/api/v1/hospitals" in response.text
+
+
+async def test_profile_ignored_without_super_admin(client, db_session):
+    from app.auth_utils import hash_password
+    from app.models import Admin
+
+    admin = Admin(username="profile-staff", email="profile-staff@example.com",
+                  password_hash=hash_password("secret123"), is_active=True, is_super_admin=False)
+    db_session.add(admin)
+    await db_session.commit()
+
+    anonymous = await client.get("/api/v1/hospitals", params={"__profile": "json"})
+    assert isinstance(anonymous.json(), list)
+
+    # A forged super-admin claim is checked against the database
+    client.cookies.set("session_token", create_access_token(admin.id, admin.username, True))
+    staff = await client.get("/api/v1/hospitals", params={"__profile": "json"})
+    client.cookies.clear()
+    assert isinstance(staff.json(), list)
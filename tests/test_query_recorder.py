@@ -0,0 +1,118 @@
+"""
+Tests for the N+1 query recorder and the batched list endpoints it guards
+"""
+
+import logging
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app import models
+from app.utils.query_recorder import QueryRecorder, QueryRecorderMiddleware, sql_shape
+from tests.conftest import test_engine
+from tests.helpers import assert_max_queries
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def test_sql_shape_ignores_values():
+    assert sql_shape("SELECT * FROM t WHERE id = 5") == sql_shape("SELECT * FROM t WHERE id = 12")
+    assert sql_shape("SELECT * FROM t WHERE name = 'a'") == "SELECT * FROM t WHERE name = ?"
+    assert sql_shape("SELECT * FROM t WHERE id IN (?, ?)") == sql_shape("SELECT * FROM t WHERE id IN (?, ?, ?, ?)")
+    assert sql_shape("SELECT t1.id FROM t1") == "SELECT t1.id FROM t1"
+
+
+async def _seed_owners(db_session, owner_type, owners):
+    for position, owner in enumerate(owners):
+        db_session.add(models.Image(owner_type=owner_type, owner_id=owner.id, url=f"/media/{owner_type}-{owner.id}.jpg", position=position))
+        if owner_type == "hospital":
+            db_session.add(models.FAQ(owner_type=owner_type, owner_id=owner.id, question="Q?", answer="A", position=0))
+    await db_session.commit()
+
+
+async def test_hospital_list_loads_images_and_faqs_in_batches(client, db_session):
+    hospitals = [models.Hospital(name=f"Batch Hospital {uuid.uuid4().hex[:8]}") for _ in range(4)]
+    db_session.add_all(hospitals)
+    await db_session.commit()
+    await _seed_owners(db_session, "hospital", hospitals)
+
+    with assert_max_queries(3, max_repeats=1):
+        response = await client.get("/api/v1/hospitals", params={"limit": 1000})
+
+    assert response.status_code == 200
+    by_id = {hospital["id"]: hospital for hospital in response.json()}
+    for hospital in hospitals:
+        assert by_id[hospital.id]["images"][0]["url"] == f"/media/hospital-{hospital.id}.jpg"
+        assert by_id[hospital.id]["faqs"][0]["question"] == "Q?"
+
+
+async def test_blog_and_offer_lists_load_images_in_one_query(client, db_session):
+    suffix = uuid.uuid4().hex[:8]
+    blogs = [models.Blog(title=f"Blog {i}", slug=f"batch-blog-{suffix}-{i}", content="<p>x</p>", is_published=True) for i in range(3)]
+    now = datetime.utcnow()
+    offers = [
+        models.Offer(name=f"Offer {i}", description="d", start_date=now - timedelta(days=1), end_date=now + timedelta(days=1))
+        for i in range(3)
+    ]
+    db_session.add_all(blogs + offers)
+    await db_session.commit()
+    await _seed_owners(db_session, "blog", blogs)
+    await _seed_owners(db_session, "offer", offers)
+
+    with assert_max_queries(2):
+        blog_response = await client.get("/api/v1/blogs", params={"limit": 1000})
+    with assert_max_queries(2):
+        offer_response = await client.get("/api/v1/offers", params={"limit": 1000})
+
+    blog_images = {blog["id"]: blog["images"] for blog in blog_response.json()}
+    offer_images = {offer["id"]: offer["images"] for offer in offer_response.json()}
+    assert all(len(blog_images[blog.id]) == 1 for blog in blogs)
+    assert all(len(offer_images[offer.id]) == 1 for offer in offers)
+
+
+async def test_admin_hospitals_faq_summary_is_batched(client, admin_cookies):
+    client.cookies.update(admin_cookies)
+    with assert_max_queries(10, max_repeats=1):
+        response = await client.get("/admin/hospitals")
+    client.cookies.clear()
+    assert response.status_code == 200
+
+
+async def test_assert_max_queries_reports_repeats():
+    with pytest.raises(AssertionError, match="repeated more than 1 times"):
+        with assert_max_queries(10, max_repeats=1):
+            async with test_engine.connect() as conn:
+                for value in range(3):
+                    await conn.execute(text(f"SELECT {value}"))
+
+
+async def test_middleware_logs_repeated_shapes(caplog):
+    async def looping_app(scope, receive, send):
+        async with test_engine.connect() as conn:
+            for value in range(3):
+                await conn.execute(text("SELECT :value"), {"value": value})
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    middleware = QueryRecorderMiddleware(looping_app, threshold=3)
+    with caplog.at_level(logging.WARNING, logger="app.utils.query_recorder"):
+        await middleware({"type": "http", "method": "GET", "path": "/loop", "root_path": ""}, receive, send)
+
+    assert "Possible N+1 query on GET <unmatched>: 3 executions" in caplog.text
+
+
+async def test_recorder_only_sees_its_own_block():
+    async with test_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        with QueryRecorder() as recorder:
+            await conn.execute(text("SELECT 2"))
+        await conn.execute(text("SELECT 3"))
+    assert recorder.count == 1
@@ -0,0 +1,84 @@
+"""
+Tests for read-replica routing of read-only sessions
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app import db as app_db
+from app.api.v1 import routes
+from app.dependencies import get_current_admin, get_current_user
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _read_session_bind():
+    generator = app_db.get_read_db()
+    session = await generator.__anext__()
+    bind = session.bind
+    await generator.aclose()
+    return bind
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def replica(monkeypatch):
+    """Install a replica engine built from the URL passed to the returned factory"""
+    engines = []
+
+    def install(url: str):
+        engine = create_async_engine(url)
+        engines.append(engine)
+        monkeypatch.setattr(app_db, "ReadSessionLocal", async_sessionmaker(engine, class_=AsyncSession))
+        monkeypatch.setattr(app_db, "_replica_retry_at", 0.0)
+        return engine
+
+    yield install
+    for engine in engines:
+        await engine.dispose()
+
+
+async def test_reads_use_replica_when_reachable(replica, tmp_path):
+    engine = replica(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+
+    assert await _read_session_bind() is engine
+
+
+async def test_unreachable_replica_falls_back_to_primary(replica, tmp_path):
+    replica(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+
+    assert await _read_session_bind() is app_db.engine
+    assert app_db._replica_retry_at > 0
+    # Later requests skip the replica until the retry window has passed
+    assert await _read_session_bind() is app_db.engine
+
+
+async def test_without_replica_reads_use_primary(monkeypatch):
+    monkeypatch.setattr(app_db, "ReadSessionLocal", None)
+
+    assert await _read_session_bind() is app_db.engine
+
+
+def _dependencies(path: str, method: str):
+    route = next(
+        r for r in routes.router.routes if r.path == path and method in r.methods
+    )
+    return {dependency.call for dependency in route.dependant.dependencies}
+
+
+def test_catalog_reads_and_writes_use_the_right_session():
+    assert app_db.get_read_db in _dependencies("/hospitals", "GET")
+    assert app_db.get_read_db in _dependencies("/doctors/{doctor_id}", "GET")
+    # Writes and read-your-writes flows stay on the primary
+    assert app_db.get_db in _dependencies("/hospitals", "POST")
+    assert app_db.get_db in _dependencies("/bookings/{booking_id}", "GET")
+
+
+def test_authenticated_routes_stay_on_the_primary():
+    # Admins and users read back what they just wrote, so never from a lagging replica
+    authenticated = {get_current_admin, get_current_user}
+    for route in routes.router.routes:
+        dependencies = {dependency.call for dependency in route.dependant.dependencies}
+        if dependencies & authenticated:
+            assert app_db.get_read_db not in dependencies, route.path
+    assert app_db.get_db in _dependencies("/images", "GET")
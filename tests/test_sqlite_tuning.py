@@ -0,0 +1,81 @@
+"""
+Tests for the SQLite connection tuning applied by create_engine_for
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import Settings, settings
+from app.db import create_engine_for, is_file_sqlite, pool_metrics
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_tuned_sqlite_applies_pragmas_and_keeps_pools(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}"
+    writer = create_engine_for(url, sqlite_role="writer", sqlite_tuned=True)
+    reader = create_engine_for(url, sqlite_role="reader", sqlite_tuned=True)
+    try:
+        async with writer.connect() as conn:
+            journal_mode = await conn.scalar(text("PRAGMA journal_mode"))
+            synchronous = await conn.scalar(text("PRAGMA synchronous"))
+            busy_timeout = await conn.scalar(text("PRAGMA busy_timeout"))
+            cache_size = await conn.scalar(text("PRAGMA cache_size"))
+        async with reader.connect() as conn:
+            reader_busy_timeout = await conn.scalar(text("PRAGMA busy_timeout"))
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+    assert busy_timeout == settings.sqlite_busy_timeout_ms
+    assert cache_size == settings.sqlite_cache_size
+    assert reader_busy_timeout == settings.sqlite_busy_timeout_ms
+    # A one-connection writer pool would queue every get_db session behind long exports
+    assert pool_metrics(writer)["size"] == settings.db_pool_size
+    assert pool_metrics(reader)["size"] == settings.db_pool_size
+
+
+async def test_tuned_writers_wait_for_each_other_while_reads_stay_free(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'writers.db'}"
+    writer = create_engine_for(url, sqlite_role="writer", sqlite_tuned=True)
+    try:
+        async with writer.begin() as conn:
+            await conn.execute(text("CREATE TABLE counter (n INTEGER)"))
+            await conn.execute(text("INSERT INTO counter VALUES (0)"))
+
+        async def increment():
+            # Concurrent write transactions queue on busy_timeout instead of failing
+            async with writer.connect() as conn:
+                await conn.scalar(text("SELECT n FROM counter"))
+                await conn.execute(text("UPDATE counter SET n = n + 1"))
+                await asyncio.sleep(0.01)
+                await conn.commit()
+
+        async with writer.connect() as long_read:
+            # An open reader (e.g. a streaming export) does not hold the write lock
+            await long_read.scalar(text("SELECT count(*) FROM counter"))
+            await asyncio.gather(*(increment() for _ in range(5)))
+            assert await long_read.scalar(text("SELECT n FROM counter")) == 5
+    finally:
+        await writer.dispose()
+
+
+def test_tuning_is_opt_in():
+    assert Settings.model_fields["sqlite_tuned"].default is False
+
+
+async def test_untuned_and_memory_sqlite_keep_defaults(tmp_path):
+    assert not is_file_sqlite("sqlite+aiosqlite:///:memory:")
+    assert not is_file_sqlite("sqlite+aiosqlite://")
+    assert is_file_sqlite(f"sqlite+aiosqlite:///{tmp_path / 'plain.db'}")
+
+    engine = create_engine_for(f"sqlite+aiosqlite:///{tmp_path / 'plain.db'}", sqlite_tuned=False)
+    try:
+        async with engine.connect() as conn:
+            assert await conn.scalar(text("PRAGMA journal_mode")) == "delete"
+    finally:
+        await engine.dispose()
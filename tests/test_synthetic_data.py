@@ -0,0 +1,125 @@
+"""
+Tests for the deterministic synthetic catalog generator
+"""
+
+import json
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app import models
+from app.db import get_db, get_read_db
+from app.main import app
+from app.utils.synthetic_data import DAYS, SyntheticScale, generate_catalog
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+SCALE = SyntheticScale.for_treatments(60, hospitals=4, doctors=12, appointments=20)
+REFERENCE_DATE = date(2026, 1, 1)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def make_engine():
+    engines = []
+
+    def factory():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        engines.append(engine)
+        return engine
+
+    yield factory
+    for engine in engines:
+        await engine.dispose()
+
+
+async def _rows(engine, table) -> list:
+    async with engine.connect() as conn:
+        return [dict(row) for row in (await conn.execute(select(table).order_by(*table.primary_key.columns))).mappings()]
+
+
+async def test_same_seed_generates_identical_rows(make_engine, tmp_path):
+    first, second = make_engine(), make_engine()
+    await generate_catalog(SCALE, seed=7, reference_date=REFERENCE_DATE, bind=first, media_dir=str(tmp_path))
+    await generate_catalog(SCALE, seed=7, reference_date=REFERENCE_DATE, bind=second, media_dir=str(tmp_path))
+
+    for table in (models.Doctor.__table__, models.FAQ.__table__, models.doctor_hospital_association):
+        assert await _rows(first, table) == await _rows(second, table)
+
+
+async def test_catalog_matches_scale_and_is_consistent(make_engine, tmp_path):
+    engine = make_engine()
+    report = await generate_catalog(SCALE, seed=3, reference_date=REFERENCE_DATE, batch_size=7,
+                                    bind=engine, media_dir=str(tmp_path))
+
+    tables = report.as_dict()["tables"]
+    assert tables["hospitals"]["rows"] == SCALE.hospitals
+    assert tables["doctors"]["rows"] == SCALE.doctors
+    assert tables["treatments"]["rows"] == SCALE.treatments
+    assert tables["appointments"]["rows"] == SCALE.appointments
+    assert tables["package_bookings"]["rows"] == SCALE.package_bookings
+
+    doctors = await _rows(engine, models.Doctor.__table__)
+    for doctor in doctors:
+        slots = json.loads(doctor["time_slots"])
+        assert list(slots) == DAYS
+        assert "Off" in slots.values()
+        assert 1 <= doctor["hospital_id"] <= SCALE.hospitals
+
+    images = await _rows(engine, models.Image.__table__)
+    assert {image["owner_type"] for image in images} >= {"hospital", "doctor", "treatment"}
+    filename = images[0]["url"].rsplit("/", 1)[-1]
+    assert (tmp_path / filename).read_bytes().startswith(b"\x89PNG")
+
+
+async def test_refuses_to_fill_a_populated_database(make_engine):
+    engine = make_engine()
+    await generate_catalog(SCALE, reference_date=REFERENCE_DATE, bind=engine, media_dir=None)
+
+    with pytest.raises(ValueError):
+        await generate_catalog(SCALE, reference_date=REFERENCE_DATE, bind=engine, media_dir=None)
+
+
+async def test_public_api_serves_the_generated_catalog(make_engine):
+    # Offline port of the old test_sample_data.py API walk-through
+    engine = make_engine()
+    await generate_catalog(SCALE, seed=5, reference_date=REFERENCE_DATE, bind=engine, media_dir=None)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def get_synthetic_db():
+        async with sessions() as session:
+            yield session
+
+    saved = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db] = get_synthetic_db
+    app.dependency_overrides[get_read_db] = get_synthetic_db
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            hospitals = (await client.get("/api/v1/hospitals")).json()
+            assert len(hospitals) == SCALE.hospitals
+            assert all(hospital["images"] for hospital in hospitals)
+
+            city = hospitals[0]["location"].split(",")[0]
+            by_city = (await client.get("/api/v1/hospitals", params={"location": city.lower()})).json()
+            assert by_city and all(city in hospital["location"] for hospital in by_city)
+
+            doctors = (await client.get("/api/v1/doctors", params={"limit": 1000})).json()
+            assert len(doctors) == SCALE.doctors
+            assert all(doctor["designation"] for doctor in doctors)
+
+            treatments = (await client.get("/api/v1/treatments", params={"limit": 1000})).json()
+            assert len(treatments) == SCALE.treatments
+            sample = treatments[0]
+            filtered = (await client.get("/api/v1/treatments", params={
+                "location": sample["location"].lower(), "treatment_type": sample["treatment_type"].lower(),
+                "limit": 1000,
+            })).json()
+            assert sample["id"] in {treatment["id"] for treatment in filtered}
+            assert all(treatment["treatment_type"] == sample["treatment_type"] for treatment in filtered)
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(saved)